@@ -1,8 +1,9 @@
-import random
 from models import Company, Market, Product, Bond, Loan
-from utils import random_product_name, format_money
+from utils import random_product_name
 from finances import update_finances
+import projection
 from configs import CAMPUS_TYPES
+from news import NewsItem, HIRING, FIRING, ACQUISITIONS, LOANS, BONDS, CAMPUS, REASSIGNMENTS, OTHER
 
 class AIController:
     def __init__(self, game_ref):
@@ -12,7 +13,12 @@ class AIController:
         """
         Called each quarter by the game engine for each AI company.
         This method first checks bankruptcy, then delegates to tier-specific logic.
+        Time spent is added to the profiler's "ai/<tier>" phase.
         """
+        with self.game.profiler.phase("ai/" + str(comp.tier)):
+            self._take_actions(comp)
+
+    def _take_actions(self, comp: Company):
         # 1) Update negative-cash logic and check bankruptcy.
         comp.update_negative_cash_quarters()
         if comp.is_bankrupt():
@@ -20,6 +26,40 @@ class AIController:
             return
 
         # 2) Execute tier-specific strategy.
+        self.run_strategy(comp)
+
+        # 3) Negative cash update and employee assignments.
+        self.finish_turn(comp)
+
+    def commit_plan(self, comp: Company, actions):
+        """
+        Applies actions planned (against a snapshot) by ai_plan.PlanningController,
+        then finishes the company's turn like ai_take_actions does.
+        Time spent is added to the same "ai/<tier>" phase (planning is timed as "ai/plan").
+        """
+        with self.game.profiler.phase("ai/" + str(comp.tier)):
+            self._commit_plan(comp, actions)
+
+    def _commit_plan(self, comp: Company, actions):
+        comp.update_negative_cash_quarters()
+        if actions and actions[0][0] == "bankrupt":
+            self.handle_bankruptcy(comp)
+            return
+        for action in actions:
+            self.act(comp, *action)
+        self.finish_turn(comp)
+
+    def project_cash(self, comp: Company, quarters=projection.DEFAULT_QUARTERS):
+        """
+        Forward cash-flow projection of comp (see projection.py), for decisions that
+        need more than this quarter's numbers.
+        """
+        return projection.project(comp, quarters)
+
+    def run_strategy(self, comp: Company):
+        """
+        Tier-specific decisions. Every change to the company goes through act().
+        """
         if comp.tier == "Startup":
             self._logic_startup(comp)
         elif comp.tier == "Medium":
@@ -32,18 +72,114 @@ class AIController:
             # Default / unknown tier: do nothing extra.
             pass
 
+    def finish_turn(self, comp: Company):
         # 3) Final update of negative cash quarters after actions.
         comp.update_negative_cash_quarters()
         # 4) Adjust employee assignments and push news.  This MUST happen after
         #    hiring/firing, as adjust_employee_assignments expects the correct
         #    total employee count.
         assignment_changes = self.adjust_employee_assignments(comp)
+        log = self.game.turn_log
+        if log is not None:
+            log.assignments(comp.name, assignment_changes)
+        self.push_assignment_news(comp, assignment_changes)
+
+    def push_assignment_news(self, comp: Company, assignment_changes):
+        if not self.game.news_enabled:
+            return
         for product_name, changes in assignment_changes.items():
             for dept, change in changes.items():
                 if change > 0:
-                    self.game._push_competitor_news(f"{comp.name} assigned {change} additional employees to {dept} for product '{product_name}'.")
+                    self.game._push_competitor_news(NewsItem(REASSIGNMENTS, "{} assigned {} additional employees to {} for product '{}'.",
+                                                             comp.name, change, dept, product_name))
                 elif change < 0:
-                    self.game._push_competitor_news(f"{comp.name} removed {-change} employees from {dept} for product '{product_name}'.")
+                    self.game._push_competitor_news(NewsItem(REASSIGNMENTS, "{} removed {} employees from {} for product '{}'.",
+                                                             comp.name, -change, dept, product_name))
+
+    def make_news(self, category, template, *args):
+        """
+        A NewsItem, or None when the game discards news (nothing is built then).
+        """
+        if not self.game.news_enabled:
+            return None
+        return NewsItem(category, template, *args)
+
+    # =============================
+    # Actions
+    # =============================
+    def act(self, comp: Company, kind: str, *args):
+        """
+        Applies one decision to the company: ("hire", n, news), ("fire", n, severance, news),
+        ("release", n, news), ("campus", campus, news), ("loan", amount, rate, term, news),
+        ("bond", amount, rate, term, news), ("launch", market_name, cost),
+        ("bid", target_name, price, news) or ("assign", product_name, dept, count).
+        When the game records a turn log, the action is appended to it with what a
+        replay needs beyond the arguments (the name of a launched product).
+        """
+        result = getattr(self, "_act_" + kind)(comp, *args)
+        log = self.game.turn_log
+        if log is not None and comp is not self.game.player:  # player moves are logged by player_act
+            log.action(comp.name, kind, args, result)
+
+    def _act_hire(self, comp: Company, hires, news):
+        comp.employees += hires
+        if hires > 0:  # Only push news if hires actually happened
+            self.game._push_competitor_news(news)
+
+    def _act_fire(self, comp: Company, count, severance, news):
+        comp.cash -= severance
+        comp.employees -= count
+        self.game._push_competitor_news(news)
+
+    def _act_release(self, comp: Company, count, news):
+        comp.employees -= count  # No severance paid
+        self.game._push_competitor_news(news)
+
+    def _act_campus(self, comp: Company, campus, news):
+        comp.cash -= campus[1]
+        comp.add_campus(campus)
+        self.game._push_competitor_news(news)
+
+    def _act_loan(self, comp: Company, amount, rate, term, news):
+        comp.loans.append(Loan(amount, rate, term, exact_schedule=self.game.exact_loans))
+        comp.cash += amount
+        self.game._push_competitor_news(news)
+
+    def _act_bond(self, comp: Company, amount, rate, term, news):
+        comp.cash -= amount
+        comp.bonds.append(Bond(amount, rate, term))
+        self.game._push_competitor_news(news)
+
+    def _act_bid(self, comp: Company, target_name, price, news):
+        comp.last_acquisition_quarter = self.game.turn_index
+        self.game.pending_acquisitions.append((comp, target_name, price, self.game.turn_index))
+        self.game._push_competitor_news(news)
+
+    def _act_assign(self, comp: Company, product_name, dept, count):
+        comp.products[product_name].assigned_employees[dept] = count
+
+    def _act_launch(self, comp: Company, market_name, cost, pname=None):
+        comp.cash -= cost
+        newp = Product(comp.name, market_name)
+        prods = self.game._find_products_in_market(market_name)
+        if prods:
+            min_eff = min(pp.effectiveness for pp in prods)
+            newp.effectiveness = max(0, min_eff - (min_eff * 0.4))
+            biggest = max(prods, key=lambda x: x.revenue)
+            if biggest.revenue > 10000:
+                biggest.revenue -= 10000
+                newp.revenue = 10000
+
+        # Initial employee assignments for new products.  Start with a small team.
+        newp.assigned_employees = {"r&d": 2, "q&a": 1, "marketing": 2}
+        if pname is None:
+            pname = random_product_name(self.game.used_product_names, self.game.rng)
+        else:
+            self.game.used_product_names.add(pname)  # replayed launch
+        comp.add_product(pname, newp)
+        self.game._register_product(newp)
+        self.game._push_competitor_news(self.make_news(OTHER, "{} opened a new product in {} for {:money}.", comp.name, market_name, cost))
+        return pname
 
     # =============================
     # Bankruptcy Handler
@@ -60,21 +196,16 @@ class AIController:
         # Re-check if the company is still bankrupt after bond liquidation
         if comp.cash >= 0:
             # Successfully staved off bankruptcy
-            self.game._push_competitor_news(f"{comp.name} avoided bankruptcy after liquidating bonds!")
+            self.game._push_competitor_news(self.make_news(BONDS, "{} avoided bankruptcy after liquidating bonds!", comp.name))
             return
 
 
-        largest = self.game.player
-        largest_mc = largest.market_cap
-        for ai in self.game.ai_companies:
-            if ai != comp and ai.market_cap > largest_mc:
-                largest_mc = ai.market_cap
-                largest = ai
+        largest = self.game._largest_company_excluding(comp)
 
         self.game._merge_companies(largest, comp)
-        if comp in self.game.ai_companies:
-            self.game.ai_companies.remove(comp)
-        self.game._push_competitor_news(f"{comp.name} has gone BANKRUPT! All assets given to {largest.name}.")
+        self.game._remove_ai_company(comp)
+        self.game.bankruptcies[comp.tier] = self.game.bankruptcies.get(comp.tier, 0) + 1
+        self.game._push_competitor_news(self.make_news(OTHER, "{} has gone BANKRUPT! All assets given to {}.", comp.name, largest.name))
 
     # =============================
     # Helper Functions
@@ -103,7 +234,7 @@ class AIController:
         total_gained = sum(b.principal for b in comp.bonds)
         comp.cash += total_gained
         comp.bonds.clear()
-        self.game._push_competitor_news(f"{comp.name} sold all bonds for {format_money(total_gained)} to raise emergency funds.")
+        self.game._push_competitor_news(self.make_news(BONDS, "{} sold all bonds for {:money} to raise emergency funds.", comp.name, total_gained))
 
     def fire_excess_employees(self, comp: Company, target_employees: int):
         """Fires employees down to the target, handling severance, and unassigning first."""
@@ -149,21 +280,21 @@ class AIController:
         # 2. Now, actually reduce the employee count and handle severance.
         severance_cost = to_fire * 20000  # $20k per fired employee
         if comp.cash >= severance_cost:
-            comp.cash -= severance_cost
-            comp.employees -= to_fire
-            self.game._push_competitor_news(f"{comp.name} fired {to_fire} employees, incurring {format_money(severance_cost)} in severance costs.")
+            self.act(comp, "fire", to_fire, severance_cost,
+                     self.make_news(FIRING, "{} fired {} employees, incurring {:money} in severance costs.",
+                                   comp.name, to_fire, severance_cost))
         else:
             # Not enough cash to cover severance.  Fire as many as possible.
-            affordable_to_fire = comp.cash // 20000
+            affordable_to_fire = int(comp.cash // 20000)  # cash is a float; headcounts stay ints
             if affordable_to_fire > 0:
-                comp.cash -= affordable_to_fire * 20000
-                comp.employees -= affordable_to_fire
-                self.game._push_competitor_news(f"{comp.name} fired {affordable_to_fire} employees, incurring {format_money(affordable_to_fire * 20000)} in severance costs (limited by cash).")
+                self.act(comp, "fire", affordable_to_fire, affordable_to_fire * 20000,
+                         self.make_news(FIRING, "{} fired {} employees, incurring {:money} in severance costs (limited by cash).",
+                                       comp.name, affordable_to_fire, affordable_to_fire * 20000))
             # Even if they can't afford *any*, they might still need to reduce staff if over capacity.
             over_capacity = max(0, comp.employees - comp.employee_capacity())
             if over_capacity > 0:
-                comp.employees -= over_capacity  # No severance paid
-                self.game._push_competitor_news(f"{comp.name} released {over_capacity} employees due to campus capacity limits.")
+                self.act(comp, "release", over_capacity,
+                         self.make_news(FIRING, "{} released {} employees due to campus capacity limits.", comp.name, over_capacity))
 
 
     # =============================
@@ -174,7 +305,7 @@ class AIController:
             Startup Strategy (Aggressive growth):
             - Prioritize raising product effectiveness.
             - Aim for a high employee spending ratio (~80% of revenue).
-            - Take loans aggressively if liquidity is low.
+            - Take loans aggressively if liquidity is low or cash is projected to run out.
             - Open new products when excess cash is available.
             - Invest a small fraction in bonds if surplus cash exists.
             """
@@ -191,9 +322,7 @@ class AIController:
                 hires = min(target_emp - comp.employees, comp.employee_capacity() - comp.employees)
                 # Ensure that hiring does not push liquidity below a safety margin.  Require 3x quarterly revenue.
                 if comp.cash > revenue * 1:
-                    comp.employees += hires
-                    if hires > 0:  # Only push news if hires actually happened
-                        self.game._push_competitor_news(f"{comp.name} hires {hires} new employees.")
+                    self.act(comp, "hire", hires, self.make_news(HIRING, "{} hires {} new employees.", comp.name, hires))
             # Ensure firing happens if overstaffed AND losing money
             elif profit < 0 and comp.employees > int(target_emp * 1.2): # fires if employees are 20% greater than target employees AND comp is losing money
                 self.fire_excess_employees(comp, target_emp)
@@ -206,23 +335,24 @@ class AIController:
                 self.build_campus(comp, tier="startup")
 
             # (D) LIQUIDITY MANAGEMENT:
-            if liquidity < 0.5:
+            # Also borrow ahead of a cash shortfall projected within the next 4 quarters.
+            if liquidity < 0.5 or self.project_cash(comp, 4).first_negative_quarter() is not None:
                 self.take_loan_if_needed(comp, emergency=True)
 
             # (E) NEW PRODUCT:
             # Use a threshold based on the market’s entry cost.
             # (For startups, require cash > 1.75× entry cost.)
-            potential_markets = [m for m in self.game.markets if not self.game._company_has_product_in_market(comp, m.name)]
+            potential_markets = self.game._markets_without_product(comp)
             if potential_markets:
                 # Pick one market to evaluate (could be randomized).
-                chosen_market = random.choice(potential_markets)
+                chosen_market = self.game.rng.choice(potential_markets)
                 entry_cost = chosen_market.size * 0.05 * 4
                 if comp.cash > entry_cost * 1.75 and profit > 0:
                     self.open_new_product(comp, 0.25)
 
             # (F) BOND INVESTMENT:
             # If surplus cash exists (cash > 1.5× revenue), invest ~10% in short-term bonds.
-            if comp.cash > revenue * 1.5 and comp.cash > 500000 and random.random() < 0.05:
+            if comp.cash > revenue * 1.5 and comp.cash > 500000 and self.game.rng.random() < 0.05:
                 self.buy_bond(comp, term=2, annual_rate=0.06)
 
     def _logic_medium(self, comp: Company):
@@ -245,9 +375,7 @@ class AIController:
             hires = min(target_emp - comp.employees, comp.employee_capacity() - comp.employees)
             # Medium companies require a bit more cash buffer.
             if comp.cash > revenue * 2:  # Increased cash buffer
-                comp.employees += hires
-                if hires > 0:
-                    self.game._push_competitor_news(f"{comp.name} hires {hires} employees.")
+                self.act(comp, "hire", hires, self.make_news(HIRING, "{} hires {} employees.", comp.name, hires))
         elif profit < 0 and comp.employees > int(target_emp * 1.15): # fires if employees are 15% greater than target and comp is losing cash
             self.fire_excess_employees(comp, target_emp)
 
@@ -262,36 +390,20 @@ class AIController:
             self.take_loan_if_needed(comp, emergency=False)
 
         # (E) NEW PRODUCT:
-        potential_markets = [m for m in self.game.markets if not self.game._company_has_product_in_market(comp, m.name)]
+        potential_markets = self.game._markets_without_product(comp)
         if potential_markets:
-            chosen_market = random.choice(potential_markets)
+            chosen_market = self.game.rng.choice(potential_markets)
             entry_cost = chosen_market.size * 0.05 * 4
             if comp.cash > entry_cost * 2 and profit > 0:  # 2x entry cost buffer
                 self.open_new_product(comp, 0.25)
 
         # (F) ACQUISITIONS:
         # If any product has been underperforming and game turn is mature, try to acquire a competitor.
-        for pname, product in comp.products.items():
-            rank = self.game._get_product_quality_rank(product)
-            if rank in ["Very Bad", "Bad"] and self.game.turn_index >= 12 and self.game.turn_index - comp.last_acquisition_quarter >= 5:
-                market_products = self.game._find_products_in_market(product.market_name)
-                for other_product in market_products:
-                    if other_product.owner_name != comp.name:
-                        other_rank = self.game._get_product_quality_rank(other_product)
-                        if other_rank in ["Very Good", "Good"]:  # Only acquire better-ranked products.
-                            # Find target company
-                            for potential_target in self.game.ai_companies:
-                                if potential_target.name == other_product.owner_name:
-                                    price = self.game._calculate_acquisition_price(potential_target)
-                                    if comp.cash >= price:
-                                        comp.last_acquisition_quarter = self.game.turn_index
-                                        self.game.pending_acquisitions.append((comp, potential_target.name, price, self.game.turn_index))
-                                        self.game._push_competitor_news(f"{comp.name} begins acquisition attempt of {potential_target.name}!")
-                                        break  # Only one acquisition attempt per turn
+        self.seek_acquisitions(comp, ("Very Bad", "Bad"), "begins acquisition attempt of")
 
         # (G) BOND INVESTMENT:
         if comp.cash > revenue * 1.5 and comp.cash > 1000000:
-            if random.random() < 0.15:  # Reduced probability
+            if self.game.rng.random() < 0.15:  # Reduced probability
                 self.buy_bond(comp, term=4, annual_rate=0.07)
 
 
@@ -315,9 +427,7 @@ class AIController:
             hires = min(target_emp - comp.employees, comp.employee_capacity() - comp.employees)
             # Large companies are even more conservative.  Require 4x quarterly revenue.
             if comp.cash > revenue * 3:
-                comp.employees += hires
-                if hires > 0:
-                     self.game._push_competitor_news(f"{comp.name} hires {hires} employees.")
+                self.act(comp, "hire", hires, self.make_news(HIRING, "{} hires {} employees.", comp.name, hires))
         elif profit < 0 and comp.employees > int(target_emp * 1.10): # fires if employees are 10% greater than target
             self.fire_excess_employees(comp, target_emp)
 
@@ -332,34 +442,19 @@ class AIController:
             self.take_loan_if_needed(comp, emergency=False)
 
         # (E) NEW PRODUCT:
-        potential_markets = [m for m in self.game.markets if not self.game._company_has_product_in_market(comp, m.name)]
+        potential_markets = self.game._markets_without_product(comp)
         if potential_markets:
-            chosen_market = random.choice(potential_markets)
+            chosen_market = self.game.rng.choice(potential_markets)
             entry_cost = chosen_market.size * 0.05 * 4
             if comp.cash > entry_cost * 3 and profit > 0:  # Higher cash buffer for large companies
                 self.open_new_product(comp, 0.20)
 
         # (F) ACQUISITIONS:
-        for pname, product in comp.products.items():
-            rank = self.game._get_product_quality_rank(product)
-            if rank in ["Very Bad", "Bad"] and self.game.turn_index >= 12 and self.game.turn_index - comp.last_acquisition_quarter >= 5:
-                market_products = self.game._find_products_in_market(product.market_name)
-                for other_product in market_products:
-                    if other_product.owner_name != comp.name:
-                        other_rank = self.game._get_product_quality_rank(other_product)
-                        if other_rank in ["Very Good", "Good"] :
-                            for potential_target in self.game.ai_companies:
-                                if potential_target.name == other_product.owner_name:
-                                    price = self.game._calculate_acquisition_price(potential_target)
-                                    if comp.cash >= price:
-                                        comp.last_acquisition_quarter = self.game.turn_index
-                                        self.game.pending_acquisitions.append((comp, potential_target.name, price, self.game.turn_index))
-                                        self.game._push_competitor_news(f"{comp.name} initiates acquisition of {potential_target.name}!")
-                                        break
+        self.seek_acquisitions(comp, ("Very Bad", "Bad"), "initiates acquisition of")
 
         # (G) BOND INVESTMENT:
         if comp.cash > revenue * 2 and comp.cash > 5000000:
-            if random.random() < 0.20:  # Further Reduced probability
+            if self.game.rng.random() < 0.20:  # Further Reduced probability
                 self.buy_bond(comp, term=4, annual_rate=0.07)
 
 
@@ -384,9 +479,7 @@ class AIController:
             hires = min(target_emp - comp.employees, comp.employee_capacity() - comp.employees)
             # Big Tech hires sparingly; only hire if cash is very abundant.
             if comp.cash > revenue * 4:
-                comp.employees += hires
-                if hires > 0:
-                     self.game._push_competitor_news(f"{comp.name} hires {hires} new employees.")
+                self.act(comp, "hire", hires, self.make_news(HIRING, "{} hires {} new employees.", comp.name, hires))
         elif profit < 0 and comp.employees > int(target_emp * 1.05): # very tight firing threshold, big tech almost never fires
             self.fire_excess_employees(comp, target_emp)
 
@@ -401,37 +494,21 @@ class AIController:
             self.take_loan_if_needed(comp, emergency=False)
 
         # (E) NEW PRODUCT:
-        potential_markets = [m for m in self.game.markets if not self.game._company_has_product_in_market(comp, m.name)]
+        potential_markets = self.game._markets_without_product(comp)
         if potential_markets:
-            chosen_market = random.choice(potential_markets)
+            chosen_market = self.game.rng.choice(potential_markets)
             entry_cost = chosen_market.size * 0.05 * 4
             if comp.cash > entry_cost * 4 and profit > 0:  # very high buffer for big tech
                 self.open_new_product(comp, 0.30)
 
         # (F) ACQUISITIONS:
         # Big Tech aggressively acquires companies when they are smaller.
-        for pname, product in comp.products.items():
-            rank = self.game._get_product_quality_rank(product)
-            if rank in ["Very Bad", "Bad", "Moderate"] and self.game.turn_index >= 12 and self.game.turn_index - comp.last_acquisition_quarter >= 5:  
-                market_products = self.game._find_products_in_market(product.market_name)
-                for other_product in market_products:
-                    if other_product.owner_name != comp.name:
-                        other_rank = self.game._get_product_quality_rank(other_product)
-                        # Big tech will acquire companies with very good products.
-                        if other_rank in ["Very Good", "Good"]:
-                            for potential_target in self.game.ai_companies:
-                                if potential_target.name == other_product.owner_name:
-                                    price = self.game._calculate_acquisition_price(potential_target)
-                                    if comp.cash >= price:
-                                         comp.last_acquisition_quarter = self.game.turn_index
-                                         self.game.pending_acquisitions.append((comp, potential_target.name, price, self.game.turn_index))
-                                         self.game._push_competitor_news(f"{comp.name} initiates acquisition of {potential_target.name}!")
-                                         break
+        self.seek_acquisitions(comp, ("Very Bad", "Bad", "Moderate"), "initiates acquisition of")
 
         # (G) BOND INVESTMENT:
         # With surplus cash, invest a large portion (e.g., 50% of excess cash) in long-term bonds.
         if comp.cash > revenue * 2.5 and comp.cash > 10000000:
-            if random.random() < 0.15: # reduced liklihood 0.5 -> 0.15
+            if self.game.rng.random() < 0.15: # reduced liklihood 0.5 -> 0.15
                 self.buy_bond(comp, term=8, annual_rate=0.08)
 
 
@@ -439,6 +516,30 @@ class AIController:
     # Common AI Actions (Helpers)
     # These methods are largely unchanged from your original code.
     # =============================
+    def seek_acquisitions(self, comp: Company, weak_ranks, verb):
+        """
+        (F) Acquisitions: for each product of comp ranked in weak_ranks, bid for the AI
+        owner of every product ranked as an acquisition target in that market, if comp
+        can pay the price. Needs turn 12+ and 5 quarters since comp's last bid.
+        The targets come from the engine's per-market candidate index.
+        """
+        game = self.game
+        if game.turn_index < 12:
+            return
+        for product in comp.products.values():
+            if game.turn_index - comp.last_acquisition_quarter < 5:
+                return  # a bid was just made
+            if game._get_product_quality_rank(product) not in weak_ranks:
+                continue
+            for other_product in game._acquisition_candidates(product.market_name):
+                if other_product.owner_name != comp.name:
+                    potential_target = game.find_ai_company(other_product.owner_name)
+                    if potential_target is not None:
+                        price = game._calculate_acquisition_price(potential_target)
+                        if comp.cash >= price:
+                            self.act(comp, "bid", potential_target.name, price,
+                                     self.make_news(ACQUISITIONS, "{} {} {}!", comp.name, verb, potential_target.name))
+
     def build_campus(self, comp: Company, tier: str = "small"):
         """
         Attempt to build an appropriate campus.
@@ -456,9 +557,8 @@ class AIController:
              campus_to_build = sorted(affordable, key=lambda x: x[1])[-2] if len(affordable) > 1 else affordable[-1]
         else: # big tech: choose the largest
             campus_to_build = sorted(affordable, key=lambda x: x[1])[-1]
-        comp.cash -= campus_to_build[1]
-        comp.campuses.append(campus_to_build)
-        self.game._push_competitor_news(f"{comp.name} built a new campus: {campus_to_build[0]} for {format_money(campus_to_build[1])}.")
+        self.act(comp, "campus", campus_to_build,
+                 self.make_news(CAMPUS, "{} built a new campus: {} for {:money}.", comp.name, campus_to_build[0], campus_to_build[1]))
 
 
     def take_loan_if_needed(self, comp: Company, emergency: bool):
@@ -488,38 +588,21 @@ class AIController:
         base_rate = 0.06 * 1.5
         new_rate = base_rate + 0.01 * len(comp.loans)
         # Term is halved => 120 -> 60
-        new_loan = Loan(loan_amt, new_rate, 60)
-        comp.loans.append(new_loan)
-        comp.cash += loan_amt
-        self.game._push_competitor_news(f"{comp.name} took a loan of {format_money(loan_amt)} at {new_rate*100:.1f}% interest.")
+        self.act(comp, "loan", loan_amt, new_rate, 60,
+                 self.make_news(LOANS, "{} took a loan of {:money} at {:.1f}% interest.", comp.name, loan_amt, new_rate * 100))
 
     def open_new_product(self, comp: Company, cost_fraction: float):
         """
         AI creates a new product in a market it is not currently in.
         The product costs 5% of the market size.
         """
-        mk_candidates = [m for m in self.game.markets if not self.game._company_has_product_in_market(comp, m.name)]
+        mk_candidates = self.game._markets_without_product(comp)
         if not mk_candidates:
             return
-        chosen_m = random.choice(mk_candidates)
+        chosen_m = self.game.rng.choice(mk_candidates)
         cost = chosen_m.size * 0.05 * 4
         if cost < comp.cash * cost_fraction and comp.cash >= cost:
-            comp.cash -= cost
-            newp = Product(comp.name, chosen_m.name)
-            prods = self.game._find_products_in_market(chosen_m.name)
-            if prods:
-                min_eff = min(pp.effectiveness for pp in prods)
-                newp.effectiveness = max(0, min_eff - (min_eff * 0.4))
-                biggest = max(prods, key=lambda x: x.revenue)
-                if biggest.revenue > 10000:
-                    biggest.revenue -= 10000
-                    newp.revenue = 10000
-
-            # Initial employee assignments for new products.  Start with a small team.
-            newp.assigned_employees = {"r&d": 2, "q&a": 1, "marketing": 2}
-            pname = random_product_name(self.game.used_product_names)
-            comp.products[pname] = newp
-            self.game._push_competitor_news(f"{comp.name} opened a new product in {chosen_m.name} for {format_money(cost)}.")
+            self.act(comp, "launch", chosen_m.name, cost)
 
     def buy_bond(self, comp: Company, term: int, annual_rate: float):
         """
@@ -528,10 +611,9 @@ class AIController:
         invest = comp.cash * 0.25  # invest 25% of available cash, more reasonable.
         if invest < 100_000:
             return
-        comp.cash -= invest
-        b = Bond(invest, annual_rate, term)
-        comp.bonds.append(b)
-        self.game._push_competitor_news(f"{comp.name} purchased a {term}-quarter bond at {annual_rate*100:.1f}% for {format_money(invest)}.")
+        self.act(comp, "bond", invest, annual_rate, term,
+                 self.make_news(BONDS, "{} purchased a {}-quarter bond at {:.1f}% for {:money}.",
+                               comp.name, term, annual_rate * 100, invest))
 
     def adjust_employee_assignments(self, comp: Company):
         """
@@ -0,0 +1,190 @@
+"""
+ai_plan.py
+
+Two-phase AI step, used when the engine is created with ai_workers set.
+
+1) Plan: every AI company runs its tier strategy against a frozen snapshot of
+   the quarter (market sizes, quality ranks, acquisition prices) on a private
+   copy of itself. Nothing global is touched; each decision the strategy makes
+   (hire, fire, campus, loan, bond, product launch, acquisition bid) is
+   recorded as an action. Plans are independent, so they are computed across a
+   process pool.
+2) Commit: the engine applies the plans serially, in company order, through
+   AIController.commit_plan (bankruptcies, launches, bids, news, employee
+   assignments against the live state).
+
+Each company plans with its own random.Random, seeded from the engine's
+generator (drawn serially before planning), and the snapshot is the same for
+every worker, so a quarter comes out identical for any worker count.
+"""
+
+import multiprocessing
+import pickle
+import random
+
+from ai import AIController
+from configs import ACQUISITION_TARGET_RANKS
+
+BANKRUPT = ("bankrupt",)
+
+
+class _ProductRef:
+    """A competitor product as seen by the planner: its owner and quality rank."""
+    __slots__ = ("owner_name", "rank")
+
+    def __init__(self, owner_name, rank):
+        self.owner_name = owner_name
+        self.rank = rank
+
+
+class _MarketRef:
+    """A market as seen by the planner."""
+    __slots__ = ("name", "size")
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+
+class _TargetRef:
+    """An AI company that can be bid for, with its acquisition price."""
+    __slots__ = ("name", "price")
+
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+
+class PlanningSnapshot:
+    """
+    Read-only view of the quarter with the subset of the engine API the tier
+    strategies use. Built once per quarter and shared by every plan.
+    """
+    def __init__(self, game):
+        self.turn_index = game.turn_index
+        self.exact_loans = game.exact_loans
+        self.turn_log = None  # plans are logged when committed
+        self.news_enabled = game.news_enabled  # news items are built in the plan, pushed at commit
+        self.markets = [_MarketRef(m.name, m.size) for m in game.markets]
+        self.market_products = {
+            mname: [_ProductRef(p.owner_name, game._get_product_quality_rank(p)) for p in prods]
+            for mname, prods in game._market_products.items()
+        }
+        self.acquisition_candidates = {
+            mname: [ref for ref in refs if ref.rank in ACQUISITION_TARGET_RANKS]
+            for mname, refs in self.market_products.items()
+        }
+        self.targets = {c.name: _TargetRef(c.name, price) for c, price in game.acquisition_prices()}
+        self.rng = None
+        self._own_ranks = {}
+
+    def begin(self, comp, own_ranks, rng):
+        """Points the snapshot at the company being planned."""
+        self.rng = rng
+        self._own_ranks = {id(p): own_ranks[pname] for pname, p in comp.products.items()}
+
+    # --- engine API used by the strategies ---
+    def _get_product_quality_rank(self, product):
+        rank = self._own_ranks.get(id(product))
+        return product.rank if rank is None else rank
+
+    def _markets_without_product(self, comp):
+        owned = {p.market_name for p in comp.products.values()}
+        return [m for m in self.markets if m.name not in owned]
+
+    def _find_products_in_market(self, mname):
+        return self.market_products.get(mname, [])
+
+    def _acquisition_candidates(self, mname):
+        return self.acquisition_candidates.get(mname, [])
+
+    def find_ai_company(self, name):
+        return self.targets.get(name)
+
+    def _calculate_acquisition_price(self, target):
+        return target.price
+
+    def _push_competitor_news(self, msg):
+        pass  # news is pushed when the plan is committed
+
+
+class PlanningController(AIController):
+    """
+    Runs the tier strategies on a company copy, recording actions instead of
+    touching the game.
+    """
+    def __init__(self, snapshot):
+        super().__init__(snapshot)
+        self.actions = []
+
+    def act(self, comp, kind, *args):
+        self.actions.append((kind,) + args)
+        super().act(comp, kind, *args)  # keep the copy current for later decisions
+
+    def _act_launch(self, comp, market_name, cost):
+        comp.cash -= cost  # the product itself is created at commit
+
+    def _act_bid(self, comp, target_name, price, news):
+        comp.last_acquisition_quarter = self.game.turn_index
+
+    def plan(self, comp):
+        self.actions = []
+        comp.update_negative_cash_quarters()
+        if comp.is_bankrupt():
+            return [BANKRUPT]
+        self.run_strategy(comp)
+        return self.actions
+
+
+def _plan_chunk(task):
+    """
+    Plans a contiguous chunk of companies. Runs in a worker process (or in
+    process on a copy), so it only sees pickled data.
+    """
+    snapshot, entries = task
+    controller = PlanningController(snapshot)
+    plans = []
+    for comp, own_ranks, seed in entries:
+        snapshot.begin(comp, own_ranks, random.Random(seed))
+        plans.append(controller.plan(comp))
+    return plans
+
+
+def run_ai_phase(game):
+    """
+    Plans every AI company (in parallel when game.ai_workers > 1), then commits
+    the plans in company order.
+    """
+    companies = list(game.ai_companies)
+    if not companies:
+        return
+
+    with game.profiler.phase("ai/plan"):
+        seeds = [game.rng.getrandbits(64) for _ in companies]
+        snapshot = PlanningSnapshot(game)
+        entries = [(comp, {pname: game._get_product_quality_rank(p) for pname, p in comp.products.items()}, seed)
+                   for comp, seed in zip(companies, seeds)]
+
+        workers = max(1, game.ai_workers)
+        chunk = len(companies) if workers == 1 else -(-len(companies) // (workers * 4))
+        tasks = [(snapshot, entries[i:i + chunk]) for i in range(0, len(companies), chunk)]
+        if workers == 1:
+            game.close()  # no worker processes needed any more
+            # Plan on copies, exactly as a worker process would see the data.
+            plans = [p for task in tasks for p in _plan_chunk(pickle.loads(pickle.dumps(task, pickle.HIGHEST_PROTOCOL)))]
+        else:
+            plans = [p for chunk_plans in _pool(game, workers).map(_plan_chunk, tasks) for p in chunk_plans]
+
+    with game.profiler.phase("ai/commit"):
+        controller = game.ai_controller
+        for comp, actions in zip(companies, plans):
+            controller.commit_plan(comp, actions)
+
+
+def _pool(game, workers):
+    """The engine's worker pool, restarted when game.ai_workers no longer matches its size."""
+    if game._ai_pool is None or game._ai_pool_workers != workers:
+        game.close()
+        game._ai_pool = multiprocessing.Pool(workers)
+        game._ai_pool_workers = workers
+    return game._ai_pool
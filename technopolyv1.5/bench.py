@@ -0,0 +1,453 @@
+"""
+bench.py
+
+Benchmarks for the simulation engine.
+
+    python bench.py memory [--count 20000]
+    python bench.py hot [--companies 20 60 120 500] [--products N] [--save FILE] [--compare FILE]
+    python bench.py scale [--companies 500 1000 2000 5000] [--quarters 4]
+
+memory: bytes allocated per Product / Company / Loan / Bond / Market object,
+        including the containers each object owns (measured with tracemalloc),
+        before (the dict-based models the __slots__ classes replaced, kept
+        here as reference classes) and after (the current models).
+hot:    ops/sec and peak allocation per op of the engine hot paths
+        (revenue distribution, finances, employee assignments, quality ranks,
+        record_state and a full headless quarter) on seeded games with the
+        given number of AI companies. Every timed call runs on its own fresh
+        copy of the game, so no call sees state an earlier one changed and
+        the numbers do not depend on --min-time. --save writes the results as
+        JSON and --compare flags cases more than 20% slower than a saved run.
+scale:  seconds per quarter of stress games (configs.STRESS_SCALE) with the
+        given number of AI companies and one market per 100 companies; the
+        time per company-quarter should stay roughly flat as the game grows.
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from models import Product, Company, Market, Bond
+from loan import Loan
+from finances import update_finances
+from configs import STRESS_SCALE
+import savegame
+
+
+# ===========================
+#          MEMORY
+# ===========================
+def _make_product(i):
+    p = Product("Owner Co", "Cloud Computing")
+    p.assigned_employees["r&d"] = 3
+    p.assigned_employees["q&a"] = 2
+    p.assigned_employees["marketing"] = 1
+    p.revenue = 1_000_000.0 + i
+    p.recent_growth.extend([1.5, 2.5, 3.5, 4.5])
+    return p
+
+
+def _make_company(i):
+    c = Company(f"Company{i}", "Medium")
+    c.add_campus(("Small Office", 400_000, 0.02, 50))
+    return c
+
+
+def _make_loan(i):
+    return Loan(1_000_000.0 + i, 0.09, 60)
+
+
+def _make_bond(i):
+    return Bond(500_000.0 + i, 0.07, 4)
+
+
+_market_rng = random.Random(0)
+
+
+def _make_market(i):
+    return Market("Cloud Computing", _market_rng)
+
+
+# --- Reference models: the attributes and owned containers of each model before
+# __slots__, as plain classes with an instance __dict__ ---
+class _DictProduct:
+    def __init__(self, owner_name, market_name):
+        self.owner_name = owner_name
+        self.market_name = market_name
+        self.assigned_employees = {"r&d": 0, "q&a": 0, "marketing": 0}
+        self.effective_spend = {"r&d": 0.0, "q&a": 0.0, "marketing": 0.0}
+        self.effectiveness = 0.0
+        self.revenue = 0.0
+        self.recent_growth = []
+
+
+class _DictBond:
+    def __init__(self, principal, annual_rate, term_quarters):
+        self.principal = principal
+        self.annual_rate = annual_rate
+        self.term_remaining = term_quarters
+        self.original_term = term_quarters
+
+
+class _DictCompany:
+    def __init__(self, name, tier=None):
+        self.name = name
+        self.tier = tier
+        self.cash = 0.0
+        self.debt = 0.0
+        self.debt_monthly_payment = 0.0
+        self.debt_interest_rate = 0.06
+        self.debt_remaining_months = 0
+        self.loans = []
+        self.bonds = []
+        self.employees = 0
+        self.market_cap = 0.0
+        self.products = {}
+        self.past_quarter_profits = [0.0, 0.0, 0.0]
+        self.campuses = []
+        self._negative_cash_quarters = 0
+        self.past_quarter_revenues = [0.0, 0.0, 0.0]
+        self.last_acquisition_quarter = -100
+
+
+class _DictLoan:
+    def __init__(self, principal, annual_rate, term_months):
+        self.principal = principal
+        self.annual_rate = annual_rate
+        self.term_remaining_months = term_months
+        monthly_r = annual_rate / 12
+        self.monthly_payment = (monthly_r * principal) / (1 - (1 + monthly_r) ** (-term_months))
+
+
+class _DictMarket:
+    def __init__(self, name, rng):
+        self.name = name
+        self.size = rng.randint(25_000_000, 50_000_000)
+        self.base_growth_rate = rng.uniform(0.05, 0.15)
+        self.growth_rate = self.base_growth_rate
+        self.quarters_elapsed = 0
+        self.is_in_global_recession = False
+        self.recession_quarters_left = 0
+        self.last_quarter_total_revenue = 0.0
+        self.imaginary_product = None
+
+
+def _make_dict_product(i):
+    p = _DictProduct("Owner Co", "Cloud Computing")
+    p.assigned_employees["r&d"] = 3
+    p.assigned_employees["q&a"] = 2
+    p.assigned_employees["marketing"] = 1
+    p.revenue = 1_000_000.0 + i
+    p.recent_growth.extend([1.5, 2.5, 3.5, 4.5])
+    return p
+
+
+def _make_dict_company(i):
+    c = _DictCompany(f"Company{i}", "Medium")
+    c.campuses.append(("Small Office", 400_000, 0.02, 50))
+    return c
+
+
+def _make_dict_market(i):
+    return _DictMarket("Cloud Computing", _market_rng)
+
+
+MEMORY_CASES = [
+    # name, reference (before) factory, current (after) factory
+    ("Product", _make_dict_product, _make_product),
+    ("Company", _make_dict_company, _make_company),
+    ("Loan", lambda i: _DictLoan(1_000_000.0 + i, 0.09, 60), _make_loan),
+    ("Bond", lambda i: _DictBond(500_000.0 + i, 0.07, 4), _make_bond),
+    ("Market", _make_dict_market, _make_market),
+]
+
+
+def bytes_per_object(factory, count):
+    """
+    Average bytes allocated per object built by factory (the holding list is not counted).
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - start - sys.getsizeof(objects)
+    tracemalloc.stop()
+    del objects
+    return used / count
+
+
+def run_memory(count):
+    print(f"{'object':<10} {'before':>10} {'after':>10} {'saved':>7}")
+    for name, reference, factory in MEMORY_CASES:
+        before, after = bytes_per_object(reference, count), bytes_per_object(factory, count)
+        print(f"{name:<10} {before:>10.1f} {after:>10.1f} {1 - after / before:>7.0%}")
+
+
+# ===========================
+#          HOT PATHS
+# ===========================
+BENCH_TIERS = [
+    # tier, campus, employees, cash, products per company
+    ("Startup", ("Garage", 0, 0.0, 10), (10, 20), (500_000, 2_000_000), 1),
+    ("Medium", ("Small Office", 250_000, 0.02, 50), (35, 70), (3_000_000, 6_000_000), 2),
+    ("Large", ("Large Office", 2_500_000, 0.04, 125), (80, 140), (12_000_000, 18_000_000), 4),
+    ("Big Tech", ("Large Building", 5_000_000, 0.08, 250), (180, 300), (25_000_000, 40_000_000), 5),
+]
+
+
+def build_game(companies, products=None, seed=0, warmup=2):
+    """
+    A seeded game with `companies` AI companies (tiers in the same 5:7:5:3 mix as a
+    new game) and `products` products per company (the tier default when None),
+    played for `warmup` quarters so products have revenue and effectiveness.
+    """
+    from main import BusinessGameEngine
+    game = BusinessGameEngine(seed=seed)
+    game.setup_game()
+    game.start_player_company("Bench Player", game.markets[0].name)
+
+    mix = [t for t, weight in zip(BENCH_TIERS, (5, 7, 5, 3)) for _ in range(weight)]
+    for i in range(len(game.ai_companies), companies):
+        tier, campus, employees, cash, default_products = mix[i % len(mix)]
+        c = Company(f"Bench{i}", tier)
+        c.add_campus(campus)
+        c.employees = game.rng.randint(*employees)
+        c.cash = game.rng.uniform(*cash)
+        count = min(products or default_products, len(game.markets))
+        for k, mk in enumerate(game.rng.sample(game.markets, count)):
+            p = Product(c.name, mk.name)
+            p.assigned_employees["r&d"] = game.rng.randint(1, 3)
+            p.assigned_employees["q&a"] = game.rng.randint(1, 3)
+            p.assigned_employees["marketing"] = game.rng.randint(1, 3)
+            p.revenue = mk.size / 40.0
+            name = f"Bench{i}-{k}"
+            game.used_product_names.add(name)
+            c.add_product(name, p)
+            game._register_product(p)
+        game.used_company_names.add(c.name)
+        game._add_ai_company(c)
+
+    for _ in range(warmup):
+        game.advance_quarter()
+    return game
+
+
+def _case_revenue(game):
+    return game._distribute_revenue_all_markets
+
+
+def _case_finances(game):
+    companies = [game.player] + game.ai_companies
+    return lambda: update_finances(companies)
+
+
+def _case_assignments(game):
+    adjust = game.ai_controller.adjust_employee_assignments
+    companies = list(game.ai_companies)
+
+    def op():
+        for comp in companies:
+            adjust(comp)
+    return op
+
+
+def _case_quality_rank(game):
+    products = [p for c in game.ai_companies for p in c.products.values()]
+
+    def op():
+        game._invalidate_rankings()  # as after a revenue pass
+        for p in products:
+            game._get_product_quality_rank(p)
+    return op
+
+
+def _case_record_state(game):
+    companies = [game.player] + game.ai_companies
+
+    def op():
+        game.data_store.record_state(game.turn_index, companies, game.markets)
+    return op
+
+
+HOT_CASES = [
+    ("revenue", _case_revenue),
+    ("finances", _case_finances),
+    ("assignments", _case_assignments),
+    ("quality_rank", _case_quality_rank),
+    ("record_state", _case_record_state),
+]
+
+
+def time_case(make, saved, min_time=0.2, repeat=3, max_calls=50):
+    """
+    Best-of-`repeat` seconds per call of the op make(game) returns. Every call runs
+    once on its own copy of the saved game, loaded before the clock starts; a round
+    makes enough calls to last about min_time (at most max_calls copies).
+    """
+    probe = make(savegame.loads(saved))
+    start = time.perf_counter()
+    probe()
+    once = time.perf_counter() - start
+    calls = max(1, min(max_calls, int(min_time / max(once, 1e-9))))
+
+    best = float("inf")
+    for _ in range(repeat):
+        ops = [make(savegame.loads(saved)) for _ in range(calls)]
+        gc.collect()
+        start = time.perf_counter()
+        for op in ops:
+            op()
+        best = min(best, (time.perf_counter() - start) / calls)
+        del ops
+    return best
+
+
+def peak_alloc(op):
+    """
+    Peak bytes allocated by tracemalloc while running op once.
+    """
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    op()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return peak
+
+
+def bench_quarter(saved, quarters=4, repeat=3):
+    """
+    Seconds per headless quarter and peak bytes of one quarter, each round starting
+    from the same saved game.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        game = savegame.loads(saved)
+        start = time.perf_counter()
+        for _ in range(quarters):
+            game.advance_quarter()
+        best = min(best, (time.perf_counter() - start) / quarters)
+    game = savegame.loads(saved)
+    return best, peak_alloc(game.advance_quarter)
+
+
+def run_hot(company_counts, products=None, seed=0, cases=None, min_time=0.2):
+    """
+    Runs every hot-path case for each company count. Returns a list of result dicts.
+    """
+    results = []
+    print(f"{'case':<14} {'companies':>9} {'products':>9} {'ops/sec':>11} {'ms/op':>10} {'peak KB/op':>11}")
+    for count in company_counts:
+        saved = savegame.dumps(build_game(count, products, seed), compress=False)
+        for name, make in HOT_CASES + [("quarter", None)]:
+            if cases and name not in cases:
+                continue
+            game = savegame.loads(saved)
+            n_products = sum(len(c.products) for c in game.ai_companies)
+            if make is None:
+                seconds, peak = bench_quarter(saved)
+            else:
+                seconds = time_case(make, saved, min_time)
+                peak = peak_alloc(make(game))  # on a fresh copy, like every timed call
+            result = {"case": name, "companies": count, "products": n_products,
+                      "seconds": seconds, "peak_bytes": peak}
+            results.append(result)
+            print(f"{name:<14} {count:>9} {n_products:>9} {1 / seconds:>11.1f} "
+                  f"{seconds * 1e3:>10.3f} {peak / 1024:>11.1f}")
+    return results
+
+
+def compare(results, baseline_path, tolerance=0.2):
+    """
+    Prints the cases that got more than `tolerance` slower than a saved run.
+    Returns the number of regressions.
+    """
+    with open(baseline_path) as f:
+        baseline = {(r["case"], r["companies"]): r for r in json.load(f)}
+    regressions = 0
+    for r in results:
+        old = baseline.get((r["case"], r["companies"]))
+        if old is None:
+            continue
+        ratio = r["seconds"] / old["seconds"]
+        if ratio > 1 + tolerance:
+            regressions += 1
+            print(f"REGRESSION {r['case']} @ {r['companies']} companies: "
+                  f"{old['seconds'] * 1e3:.3f} -> {r['seconds'] * 1e3:.3f} ms/op ({ratio:.2f}x)")
+    print(f"{regressions} regression(s) against {baseline_path}")
+    return regressions
+
+
+# ===========================
+#          SCALING
+# ===========================
+def run_scale(company_counts, quarters=4, seed=0):
+    """
+    Plays `quarters` quarters of a STRESS_SCALE game per company count (after 2
+    warm-up quarters) and prints the time per quarter and per company-quarter.
+    """
+    from main import BusinessGameEngine
+    print(f"{'companies':>9} {'markets':>8} {'setup s':>8} {'s/quarter':>10} {'us/company-quarter':>19}")
+    for count in company_counts:
+        scale = dict(STRESS_SCALE, initial_ai_multiplier=max(1, count // 20),
+                     initial_markets=max(8, count // 100), max_spawned_markets=max(8, count // 100))
+        start = time.perf_counter()
+        game = BusinessGameEngine(seed=seed, scale=scale)
+        game.setup_game()
+        game.start_player_company("Bench Player", game.markets[0].name)
+        setup = time.perf_counter() - start
+        for _ in range(2):
+            game.advance_quarter()
+
+        played = 0
+        company_quarters = 0
+        start = time.perf_counter()
+        for _ in range(quarters):
+            company_quarters += len(game.ai_companies)
+            played += 1
+            if game.advance_quarter().game_over:
+                break
+        elapsed = time.perf_counter() - start
+        print(f"{len(game.ai_companies):>9} {len(game.markets):>8} {setup:>8.2f} {elapsed / played:>10.3f} "
+              f"{elapsed / company_quarters * 1e6:>19.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Technopoly engine benchmarks.")
+    sub = parser.add_subparsers(dest="suite", required=True)
+    mem = sub.add_parser("memory", help="bytes per model object")
+    mem.add_argument("--count", type=int, default=20_000, help="objects to allocate per model")
+    hot = sub.add_parser("hot", help="engine hot paths by company count")
+    hot.add_argument("--companies", type=int, nargs="+", default=[20, 60, 120, 500], help="AI company counts")
+    hot.add_argument("--products", type=int, default=None, help="products per company (default: by tier)")
+    hot.add_argument("--seed", type=int, default=0, help="game seed")
+    hot.add_argument("--cases", nargs="+", default=None, help="only run these cases")
+    hot.add_argument("--min-time", type=float, default=0.2, help="seconds per timing round")
+    hot.add_argument("--save", default=None, help="write results as JSON")
+    hot.add_argument("--compare", default=None, help="JSON results of an earlier run to check against")
+    scl = sub.add_parser("scale", help="quarter time of stress games by company count")
+    scl.add_argument("--companies", type=int, nargs="+", default=[500, 1000, 2000, 5000], help="AI company counts")
+    scl.add_argument("--quarters", type=int, default=4, help="quarters timed per game")
+    scl.add_argument("--seed", type=int, default=0, help="game seed")
+    args = parser.parse_args(argv)
+
+    if args.suite == "scale":
+        run_scale(args.companies, args.quarters, args.seed)
+    elif args.suite == "memory":
+        run_memory(args.count)
+    elif args.suite == "hot":
+        results = run_hot(args.companies, args.products, args.seed, args.cases, args.min_time)
+        if args.save:
+            with open(args.save, "w") as f:
+                json.dump(results, f, indent=1)
+        if args.compare and compare(results, args.compare):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
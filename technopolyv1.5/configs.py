@@ -9,3 +9,29 @@ CAMPUS_TYPES = [
     ("Large HQ Campus", 5_500_000, 0.12, 1000),
     ("Large Campus Park", 25_000_000, 0.15, float('inf'))
 ]
+
+# Quality ranks of the products an AI company tries to buy its way into (the owner is the target).
+ACQUISITION_TARGET_RANKS = ("Very Good", "Good")
+
+# Size limits of a game. BusinessGameEngine(scale={...}) overrides any of them.
+DEFAULT_SCALE = {
+    "initial_markets": 8,  # markets at the start (names beyond the 8 built-in ones are numbered)
+    "initial_ai_multiplier": 1,  # copies of the starting 5 Startup / 7 Medium / 5 Large / 3 Big Tech mix
+    "max_spawned_ai": 100,  # AI companies spawned over the whole game
+    "ai_spawn_batch": 3,  # AI companies spawned per spawn turn
+    "ai_spawn_interval": 4,  # quarters between AI spawns
+    "spawn_market_pool": 8,  # spawned AI pick their markets among the first N markets (None = all)
+    "max_spawned_markets": 12,  # markets spawned over the whole game
+    "market_spawn_interval": 3,  # quarters between market spawns
+}
+
+# Stress scenario: 5,000 AI companies over 50 starting markets, plus 50 spawned markets.
+STRESS_SCALE = dict(
+    DEFAULT_SCALE,
+    initial_markets=50,
+    initial_ai_multiplier=250,
+    max_spawned_ai=5_000,
+    ai_spawn_batch=100,
+    spawn_market_pool=None,
+    max_spawned_markets=50,
+)
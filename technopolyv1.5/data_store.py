@@ -2,79 +2,264 @@
 data_store.py
 
 Implements a DataStorage class that captures all changing values
-each quarter: 
- - Company finances (cash, debt, market cap, profit)
+each quarter:
+ - Company finances (cash, debt, market cap, employees)
  - Product data (employee assignments, effectiveness, revenue)
- - Market data (size, growth rate)
+ - Bond holdings (principal, rate, remaining term)
+ - Market data (size, growth rate, recession flag, revenue)
 and so on.
 
-We'll store them in a dictionary structure each turn.
+The full game is kept (no snapshot limit). Values are stored column by column
+in typed arrays (one array per metric) keyed by turn and by small integer ids
+for companies, products and markets, so:
+ - appending a quarter costs O(rows) with no per-row dicts,
+ - "company X cash over all turns" is a slice over that company's row numbers,
+ - a whole game costs a few dozen bytes per row instead of a nested dict per
+   company/product per quarter.
 """
 
+from array import array
 from typing import List
 from models import Company, Market, Product, Loan, Bond
 
 
+class _Columns:
+    """
+    A table stored as one typed array per column. Rows are append-only.
+    """
+    def __init__(self, **typecodes):
+        self.columns = {name: array(code) for name, code in typecodes.items()}
+        self._order = list(typecodes)
+
+    def append(self, *values):
+        for name, value in zip(self._order, values):
+            self.columns[name].append(value)
+
+    def __len__(self):
+        return len(self.columns[self._order[0]])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def row(self, i):
+        return {name: self.columns[name][i] for name in self._order}
+
+    def nbytes(self):
+        return sum(col.itemsize * len(col) for col in self.columns.values())
+
+
+class _Interner:
+    """
+    Maps names to small integer ids (and back).
+    """
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def id(self, name):
+        i = self.ids.get(name)
+        if i is None:
+            i = len(self.names)
+            self.ids[name] = i
+            self.names.append(name)
+        return i
+
+
+def _product_columns():
+    # product is the Product's own id (Product.history_id), so a product keeps its series
+    # when renamed ("..._acq") or when another company uses the same name; name is its
+    # key in Company.products that quarter.
+    return _Columns(turn="i", company="i", product="i", name="i", market="i", rd="i", qa="i",
+                    marketing="i", revenue="d", effectiveness="d")
+
+
 class DataStorage:
     """
-    Maintains a list of snapshots, one per quarter, for historical analysis.
+    Append-only columnar history of every quarter, for charts and post-mortems.
     """
     def __init__(self):
-        self.history = []  # list of dict snapshots
-        self.max_history_length = 10  # Limit history to 10 snapshots to avoid memory issues
+        self.companies = _Interner()
+        self.products = _Interner()  # product names (keys of Company.products), shown in snapshots
+        self._product_count = 0  # product ids handed out (Product.history_id)
+        self.markets = _Interner()
+        self.tiers = _Interner()
+
+        self.company_rows = _Columns(turn="i", company="i", tier="b", cash="d", debt="d", market_cap="d", employees="i")
+        self.product_rows = _product_columns()
+        self.bond_rows = _Columns(turn="i", company="i", principal="d", annual_rate="d", term_remaining="i")
+        self.market_rows = _Columns(turn="i", market="i", size="d", growth_rate="d", recession="b",
+                                    last_quarter_revenue="d")
+
+        # id -> row numbers, for O(k) per-entity slices
+        self._company_index = {}
+        self._product_index = {}
+        self._market_index = {}
+        # one entry per record_state call: (turn, company, product, bond, market row offsets)
+        self._recordings = []
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_product_count" not in state:
+            # Saves from before stable product ids: product rows were keyed by name and
+            # headcounts stored as floats. Their rows keep the name id as product id; the
+            # live products get fresh ids when next recorded.
+            old = self.product_rows
+            self.product_rows = _product_columns()
+            for name, column in self.product_rows.columns.items():
+                values = old["product" if name == "name" else name]
+                column.extend(map(int, values) if column.typecode == "i" else values)
+            employees = self.company_rows["employees"]
+            self.company_rows.columns["employees"] = array("i", map(int, employees))
+            self._product_count = len(self.products.names)
 
     def record_state(self, turn_index: int, companies: List[Company], markets: List[Market]):
         """
-        Create a big dictionary capturing everything. Then append to self.history.
+        Append one row per company, product, bond and market for this quarter.
+        """
+        self._recordings.append((turn_index, len(self.company_rows), len(self.product_rows),
+                                 len(self.bond_rows), len(self.market_rows)))
+
+        for c in companies:
+            cid = self.companies.id(c.name)
+            tier = self.tiers.id(c.tier) if c.tier is not None else -1
+            self._company_index.setdefault(cid, array("i")).append(len(self.company_rows))
+            self.company_rows.append(turn_index, cid, tier, c.cash, c.debt, c.market_cap, c.employees)
+
+            for pname, prod in c.products.items():
+                pid = getattr(prod, "history_id", None)  # unset on products of older saves
+                if pid is None:
+                    pid = prod.history_id = self._product_count
+                    self._product_count += 1
+                self._product_index.setdefault(pid, array("i")).append(len(self.product_rows))
+                self.product_rows.append(turn_index, cid, pid, self.products.id(pname),
+                                         self.markets.id(prod.market_name),
+                                         prod.rd_employees, prod.qa_employees, prod.marketing_employees,
+                                         prod.revenue, prod.effectiveness)
+            # bonds
+            for b in c.bonds:
+                self.bond_rows.append(turn_index, cid, b.principal, b.annual_rate, b.term_remaining)
+
+        for m in markets:
+            mid = self.markets.id(m.name)
+            self._market_index.setdefault(mid, array("i")).append(len(self.market_rows))
+            self.market_rows.append(turn_index, mid, m.size, m.growth_rate,
+                                    1 if m.is_in_global_recession else 0, m.last_quarter_total_revenue)
+
+    # ===========================
+    #          QUERIES
+    # ===========================
+    @property
+    def turns(self):
+        """Turn index of every recording, in order."""
+        return [rec[0] for rec in self._recordings]
+
+    def company_series(self, company_name, metric):
+        """
+        Returns (turns, values) of one company metric (cash, debt, market_cap, employees)
+        over every recorded quarter.
+        """
+        return self._series(self.company_rows, self._company_index, self.companies, company_name, metric)
+
+    def product_series(self, product, metric):
+        """
+        Returns (turns, values) of one product metric (rd, qa, marketing, revenue, effectiveness)
+        of a Product, across renames and changes of owner.
+        """
+        rows = self._product_index.get(getattr(product, "history_id", None), ())
+        return [self.product_rows["turn"][i] for i in rows], [self.product_rows[metric][i] for i in rows]
+
+    def market_series(self, market_name, metric):
+        """
+        Returns (turns, values) of one market metric (size, growth_rate, recession, last_quarter_revenue).
+        """
+        return self._series(self.market_rows, self._market_index, self.markets, market_name, metric)
+
+    @staticmethod
+    def _series(table, index, interner, name, metric):
+        rows = index.get(interner.ids.get(name), ())
+        turn_col = table["turn"]
+        value_col = table[metric]
+        return [turn_col[i] for i in rows], [value_col[i] for i in rows]
+
+    def snapshot(self, turn_index):
+        """
+        Rebuilds the nested dict snapshot of a recorded quarter (the latest recording of
+        that turn), in the same shape the store used to keep for every quarter.
         """
+        for n in range(len(self._recordings) - 1, -1, -1):
+            if self._recordings[n][0] == turn_index:
+                return self._build_snapshot(n)
+        return None
+
+    @property
+    def history(self):
+        """
+        Every recorded quarter as a nested dict snapshot (built on demand).
+        """
+        return [self._build_snapshot(n) for n in range(len(self._recordings))]
+
+    def _bounds(self, n):
+        start = self._recordings[n]
+        end = self._recordings[n + 1] if n + 1 < len(self._recordings) else (
+            None, len(self.company_rows), len(self.product_rows), len(self.bond_rows), len(self.market_rows))
+        return start, end
+
+    def _build_snapshot(self, n):
+        start, end = self._bounds(n)
         snapshot = {
-            "turn": turn_index,
+            "turn": start[0],
             "companies": [],
             "markets": []
         }
-
-        for c in companies:
+        by_company = {}
+        cr = self.company_rows
+        for i in range(start[1], end[1]):
+            cid = cr["company"][i]
+            tier = cr["tier"][i]
             company_data = {
-                "name": c.name,
-                "tier": c.tier,
-                "cash": c.cash,
-                "debt": c.debt,
-                "market_cap": c.market_cap,
-                "employees": c.employees,
+                "name": self.companies.names[cid],
+                "tier": self.tiers.names[tier] if tier >= 0 else None,
+                "cash": cr["cash"][i],
+                "debt": cr["debt"][i],
+                "market_cap": cr["market_cap"][i],
+                "employees": cr["employees"][i],
                 "products": {},
                 "bonds": []
             }
-            for pname, prod in c.products.items():
-                company_data["products"][pname] = {
-                    "market_name": prod.market_name,
-                    "r&d_employees": prod.assigned_employees["r&d"],
-                    "qa_employees": prod.assigned_employees["q&a"],
-                    "marketing_employees": prod.assigned_employees["marketing"],
-                    "revenue": prod.revenue,
-                    "effectiveness": prod.effectiveness
-                }
-            # bonds
-            for b in c.bonds:
-                company_data["bonds"].append({
-                    "principal": b.principal,
-                    "annual_rate": b.annual_rate,
-                    "term_remaining": b.term_remaining
-                })
-
+            by_company[cid] = company_data
             snapshot["companies"].append(company_data)
 
-        for m in markets:
-            market_data = {
-                "name": m.name,
-                "size": m.size,
-                "growth_rate": m.growth_rate,
-                "is_in_global_recession": m.is_in_global_recession,
-                "last_quarter_revenue": m.last_quarter_total_revenue
+        pr = self.product_rows
+        for i in range(start[2], end[2]):
+            by_company[pr["company"][i]]["products"][self.products.names[pr["name"][i]]] = {
+                "market_name": self.markets.names[pr["market"][i]],
+                "r&d_employees": pr["rd"][i],
+                "qa_employees": pr["qa"][i],
+                "marketing_employees": pr["marketing"][i],
+                "revenue": pr["revenue"][i],
+                "effectiveness": pr["effectiveness"][i]
             }
-            snapshot["markets"].append(market_data)
 
-        self.history.append(snapshot)
-        
-        # Limit history size to prevent memory issues
-        if len(self.history) > self.max_history_length:
-            self.history.pop(0)  # Remove the oldest snapshot
+        br = self.bond_rows
+        for i in range(start[3], end[3]):
+            by_company[br["company"][i]]["bonds"].append({
+                "principal": br["principal"][i],
+                "annual_rate": br["annual_rate"][i],
+                "term_remaining": br["term_remaining"][i]
+            })
+
+        mr = self.market_rows
+        for i in range(start[4], end[4]):
+            snapshot["markets"].append({
+                "name": self.markets.names[mr["market"][i]],
+                "size": mr["size"][i],
+                "growth_rate": mr["growth_rate"][i],
+                "is_in_global_recession": bool(mr["recession"][i]),
+                "last_quarter_revenue": mr["last_quarter_revenue"][i]
+            })
+        return snapshot
+
+    def nbytes(self):
+        """Approximate bytes held by the column arrays."""
+        return (self.company_rows.nbytes() + self.product_rows.nbytes()
+                + self.bond_rows.nbytes() + self.market_rows.nbytes())
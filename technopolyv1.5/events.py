@@ -13,6 +13,7 @@ We store these in an 'EventManager' that is used by the game engine.
 import random
 from typing import List
 from models import Market
+from news import NewsItem, EVENTS
 
 class GameEvent:
     """
@@ -36,8 +37,9 @@ class EventManager:
     If a global recession is in effect, we skip events for 3 quarters.
     """
 
-    def __init__(self, markets: List[Market]):
+    def __init__(self, markets: List[Market], rng=random):
         self.markets = markets
+        self.rng = rng  # the game engine's random.Random, so events are reproducible
         self.last_5_events = []
         self.recession_active = False
         self.recession_quarters_left = 0
@@ -73,11 +75,11 @@ class EventManager:
 
         # 17 total events => 16 normal + 1 global
         # We'll do a 1/17 chance for global. If not chosen, pick from normal.
-        r = random.randint(1, 17)
+        r = self.rng.randint(1, 17)
         if r == 17:
             return self.recession_event
         else:
-            return random.choice(self.normal_events)
+            return self.rng.choice(self.normal_events)
 
     # events.py: EventManager.apply_event
 
@@ -122,7 +124,7 @@ class EventManager:
 
     def format_news_feed(self, current_year, current_q):
         """
-        Return a list of lines describing the last 5 events,
+        Return a list of NewsItems describing the last 5 events,
         but show the date they actually happened (from ev.turn_happened).
         """
         def compute_year_q_from_turn(turn_index):
@@ -138,9 +140,10 @@ class EventManager:
                 eyear, eq = (current_year, current_q)  # fallback if missing
 
             if ev.is_breaking:
-                lines.append(f"{eyear}, Q{eq} - Global Recession (remaining {self.recession_quarters_left} quarters)")
+                lines.append(NewsItem(EVENTS, "{}, Q{} - Global Recession (remaining {} quarters)",
+                                      eyear, eq, self.recession_quarters_left))
             else:
-                lines.append(f"{eyear}, Q{eq}: {ev.name}, {ev.description}")
+                lines.append(NewsItem(EVENTS, "{}, Q{}: {}, {}", eyear, eq, ev.name, ev.description))
         return lines
 
     
@@ -6,6 +6,10 @@ Handles routines for:
  - Paying out bond interest
  - New Market Cap formula:
    MarketCap = avg_profit_3q * (20 + (margin_last_q*0.1) + rnd(1..3)) + (net_assets).
+
+Expired bonds and finished loans are dropped by rebuilding a company's list
+once, only in quarters where something expired, instead of one list.remove
+per expired bond or loan (quadratic when many mature in the same quarter).
 """
 
 import random
@@ -27,7 +31,7 @@ def update_finances(companies):
     # 1) Pay bond interest
     for c in companies:
         total_bond_interest = 0.0
-        remove_bonds = []
+        expired = False
         for b in c.bonds:
             # Compute interest for this quarter.
             interest = b.quarterly_interest()
@@ -38,11 +42,11 @@ def update_finances(companies):
             if b.term_remaining <= 0:
                 # When the bond expires, add back its principal.
                 c.cash += b.principal
-                remove_bonds.append(b)
+                expired = True
 
         # Remove expired bonds.
-        for bb in remove_bonds:
-            c.bonds.remove(bb)
+        if expired:
+            c.bonds[:] = [b for b in c.bonds if b.term_remaining > 0]
 
         # Add total bond interest to cash.
         c.cash += total_bond_interest
@@ -89,25 +93,13 @@ def update_finances(companies):
     # 3) Process loans for each company
     for c in companies:
         total_loan_payment = 0.0
-        remove_loans = []
+        finished = False
         for loan in c.loans:
-            monthly_r = loan.annual_rate / 12
-            # Calculate interest for one month.
-            interest_payment = loan.principal * monthly_r
-            # Calculate principal portion for one month.
-            principal_portion = loan.monthly_payment - interest_payment
-            if principal_portion < 0:
-                principal_portion = 0
-            # For the quarter (3 months):
-            total_interest = interest_payment * 3
-            principal_payment_total = principal_portion * 3
-            # Reduce the loan principal.
-            loan.principal = max(0, loan.principal - principal_payment_total)
-            loan.term_remaining_months -= 3
-            total_loan_payment += loan.monthly_payment * 3
+            # Pay the quarter and reduce the loan principal (see Loan.pay_quarter).
+            total_loan_payment += loan.pay_quarter()
             if loan.term_remaining_months <= 0 or loan.principal <= 0:
-                remove_loans.append(loan)
-        for loan in remove_loans:
-            c.loans.remove(loan)
+                finished = True
+        if finished:
+            c.loans[:] = [ln for ln in c.loans if ln.term_remaining_months > 0 and ln.principal > 0]
         # Subtract the total loan payment from cash.
         c.cash -= total_loan_payment
@@ -3,6 +3,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 from utils import format_money
+import news
 from models import Product
 import os
 import time
@@ -11,6 +12,136 @@ import concurrent.futures
 import random
 import math
 
+
+class KeyedRows:
+    """
+    One row of widgets per key inside a container, kept across refreshes.
+    sync() creates rows for new keys, destroys the rows of keys that are gone and
+    calls fill() only for rows whose data changed; rows are re-packed only when
+    the order of the keys changed.
+    create(parent, key) returns a dict of the row's widgets ("frame" is packed);
+    fill(widgets, key, data) writes data into them.
+    """
+    def __init__(self, parent, create, fill, pack, placeholder=None):
+        self.parent = parent
+        self.create = create
+        self.fill = fill
+        self.pack = pack
+        self.placeholder = placeholder  # placeholder(parent) -> widget shown when there are no rows
+        self.rows = {}  # key -> [widgets, data]
+        self.order = []
+        self._placeholder_widget = None
+
+    def sync(self, items):
+        """items: (key, data) pairs in display order; data must support ==."""
+        keys = [key for key, _ in items]
+        live = set(keys)
+        for key in [k for k in self.rows if k not in live]:
+            self.rows.pop(key)[0]["frame"].destroy()
+
+        for key, data in items:
+            entry = self.rows.get(key)
+            if entry is None:
+                entry = self.rows[key] = [self.create(self.parent, key), None]
+            if entry[1] != data:
+                self.fill(entry[0], key, data)
+                entry[1] = data
+
+        if keys != self.order:
+            for key in keys:
+                self.rows[key][0]["frame"].pack_forget()
+            for key in keys:
+                self.rows[key][0]["frame"].pack(**self.pack)
+            self.order = keys
+
+        if keys and self._placeholder_widget is not None:
+            self._placeholder_widget.destroy()
+            self._placeholder_widget = None
+        elif not keys and self._placeholder_widget is None and self.placeholder is not None:
+            self._placeholder_widget = self.placeholder(self.parent)
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Scrolling list that only builds widgets for the rows in view: a pool of at most
+    `visible_rows` rows is created once and refilled with the items at the scroll
+    offset, so showing a list costs the same for 20 items or 2,000.
+    create_row(parent) returns a dict of the row's widgets ("frame" is packed);
+    fill_row(widgets, index, item) shows item, index being its position in the list.
+    """
+    def __init__(self, master, create_row, fill_row, visible_rows=10, row_pack=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.container = master
+        self.create_row = create_row
+        self.fill_row = fill_row
+        self.visible_rows = visible_rows
+        self.row_pack = row_pack or {"fill": "x", "pady": 2}
+        self.items = []
+        self.first = 0  # index of the item in the top row
+        self.rows = []
+
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self._bind_wheel(self)
+
+    def set_items(self, items, keep_position=True):
+        """Replaces the items and refills the rows in view."""
+        self.items = list(items)
+        if not keep_position:
+            self.first = 0
+        self._render()
+
+    def scroll_to(self, first):
+        first = max(0, min(first, len(self.items) - self.visible_rows))
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def _render(self):
+        self.first = max(0, min(self.first, len(self.items) - self.visible_rows))
+        shown = min(self.visible_rows, len(self.items))
+        while len(self.rows) < shown:
+            row = self.create_row(self.body)
+            self._bind_wheel(row["frame"])
+            self.rows.append(row)
+        for i, row in enumerate(self.rows):
+            if i < shown:
+                self.fill_row(row, self.first + i, self.items[self.first + i])
+                row["frame"].pack(**self.row_pack)
+            else:
+                row["frame"].pack_forget()
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + shown) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(round(float(value) * len(self.items)))
+        elif action == "scroll":
+            self.scroll_to(self.first + int(value) * (self.visible_rows if unit == "pages" else 1))
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self.scroll_to(self.first + step)
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", self._on_wheel, add="+")
+        widget.bind("<Button-5>", self._on_wheel, add="+")
+        for child in widget.winfo_children():
+            if child is not self.scrollbar:
+                self._bind_wheel(child)
+
+
 class TechnopolyGUI:
     # Color Scheme
     COLORS = {
@@ -41,9 +172,23 @@ class TechnopolyGUI:
         "button": ("Segoe UI", 14, "bold"),
     }
 
+    # Tab name -> method redrawing it. After a quarter only the visible tab is
+    # redrawn; the others are redrawn when they are next shown.
+    TAB_UPDATERS = {
+        "Summary": "update_summary_tab",
+        "Products": "update_products_tab",
+        "Finances": "update_finances_tab",
+        "Stock Market": "update_stock_market_tab",
+        "Acquisitions": "update_acquisitions_tab",
+        "Operations": "update_operations_tab",
+    }
+
     def __init__(self, game_engine):
         self.game = game_engine
         self.competitor_moves = []
+        self.profiler_window = None
+        self.current_tab = "Summary"
+        self._stale_tabs = set()
         
         # Configure CTk
         ctk.set_appearance_mode("dark")
@@ -55,12 +200,19 @@ class TechnopolyGUI:
         self.root.geometry("1280x720")
         self.root.resizable(True, True)
         self.root.minsize(1024, 600)
+        self.root.bind("<F12>", lambda event: self.show_profiler_panel())
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_game)
         
         # Create splash screen
         self.show_splash_screen()
         
         self.root.mainloop()
     
+    def exit_game(self):
+        """Stop the engine's AI worker processes and close the window"""
+        self.game.close()
+        self.root.quit()
+
     def show_splash_screen(self):
         """Show an animated splash screen before the main menu"""
         # Clear any existing widgets
@@ -242,7 +394,7 @@ class TechnopolyGUI:
         tutorial_button.pack(pady=(0, button_spacing))
         
         # Exit button
-        exit_button = create_menu_button(menu_container, "EXIT", self.root.quit, is_primary=False)
+        exit_button = create_menu_button(menu_container, "EXIT", self.exit_game, is_primary=False)
         exit_button.pack()
         
         # Version text
@@ -441,8 +593,7 @@ class TechnopolyGUI:
             widget.destroy()
 
         # Re-initialize the game: create AI companies and the player
-        self.game._create_ai_companies()
-        self.game._initialize_player()
+        self.game.setup_game()
         
         # Create main container
         main_container = ctk.CTkFrame(self.root, fg_color=self.COLORS["bg_primary"])
@@ -613,36 +764,8 @@ class TechnopolyGUI:
                 self.show_notification("Please select a market first", "error") 
                 return
                 
-            # Set player name
-            self.game.player.name = company_name
-            chosen_m = self.selected_market
-            
-            # Create initial product
-            from models import Product
-            p = Product(self.game.player.name, chosen_m.name)
-            p.assigned_employees["r&d"] = 0
-            p.assigned_employees["q&a"] = 0
-            p.assigned_employees["marketing"] = 0
-            
-            # Adjust product based on market competition
-            prods = self.game._find_products_in_market(chosen_m.name)
-            if prods:
-                biggest = max(prods, key=lambda x: x.revenue)
-                if biggest.revenue >= 10_000:
-                    biggest.revenue -= 10_000
-                    p.revenue = 10_000
-                min_eff = min(prod.effectiveness for prod in prods)
-                p.effectiveness = max(0, min_eff - (min_eff * 0.4))
-                
-            # Add product to player's portfolio
-            self.game.player.products[chosen_m.name] = p
-            
-            # Record initial state
-            self.game.data_store.record_state(
-                self.game.turn_index,
-                [self.game.player] + self.game.ai_companies,
-                self.game.markets
-            )
+            # Name the company, launch the first product and record the initial state
+            self.game.start_player_company(company_name, self.selected_market.name)
             
             # Create main game interface and process first turn
             self.create_main_game_interface()
@@ -662,102 +785,67 @@ class TechnopolyGUI:
         )
         self.notification_label.pack()
 
-    def update_competitor_moves(self):
-        """Update the competitor moves panel with latest news"""
-        # Clear existing news
-        for widget in self.competitor_news_frame.winfo_children():
-            widget.destroy()
-        
-        # Get competitor news from the game engine
-        competitor_moves = self.game.competitor_news_feed[:] 
-        self.game.competitor_news_feed.clear()  # Clear after copying
-        
-        if not competitor_moves:
-            no_news = ctk.CTkLabel(
+    def update_competitor_moves(self, competitor_moves):
+        """Update the competitor moves panel with latest news (only the lines in view get widgets)"""
+        view = getattr(self, "_competitor_list", None)
+        if view is None or view.container is not self.competitor_news_frame:
+            for widget in self.competitor_news_frame.winfo_children():
+                widget.destroy()
+            view = self._competitor_list = VirtualList(
                 self.competitor_news_frame,
-                text="No industry news this quarter",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_tertiary"]
+                self._create_competitor_line,
+                self._fill_competitor_line,
+                visible_rows=15,
+                row_pack={"fill": "x", "padx": 10, "pady": 1},
+                fg_color="transparent"
             )
-            no_news.pack(pady=20)
+            self._competitor_placeholder = None
+
+        if not competitor_moves:
+            view.pack_forget()
+            if self._competitor_placeholder is None:
+                self._competitor_placeholder = self._placeholder_label(
+                    self.competitor_news_frame, "No industry news this quarter")
             return
-        
-        # Categorize messages
-        def categorize_message(msg):
-            msg_lower = msg.lower()
-            if "hire" in msg_lower:
-                return "Hiring"
-            elif "fire" in msg_lower:
-                return "Firing"
-            elif "acquisition" in msg_lower or "acquired" in msg_lower:
-                return "Acquisitions"
-            elif "loan" in msg_lower:
-                return "Loans"
-            elif "bond" in msg_lower:
-                return "Bonds"
-            elif "campus" in msg_lower:
-                return "Campus Expansion"
-            elif "assigned" in msg_lower or "removed" in msg_lower:
-                return "Employee Reassignments"
-            else:
-                return "Other"
-                
-        # Group messages by category
+        if self._competitor_placeholder is not None:
+            self._competitor_placeholder.destroy()
+            self._competitor_placeholder = None
+        view.pack(fill="both", expand=True)
+
+        # Group messages by category (carried by each NewsItem)
         categories = {}
-        for msg in competitor_moves:
-            cat = categorize_message(msg)
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(msg)
-        
-        # Define the display order
-        category_order = [
-            "Hiring",
-            "Firing",
-            "Acquisitions",
-            "Loans",
-            "Bonds",
-            "Campus Expansion",
-            "Employee Reassignments",
-            "Other"
-        ]
-        
+        for item in competitor_moves:
+            categories.setdefault(item.category, []).append(item)
+
         # Get the width of the competitor news frame
         panel_width = self.competitor_news_frame.winfo_width() - 30  # Leave margin for padding
-        wrap_length = max(200, panel_width)  # Minimum 200px
-        
-        # Display categories in order
-        for cat in category_order:
+        self._competitor_wrap = max(200, panel_width)  # Minimum 200px
+
+        # One line per category header and per message, categories in display order
+        lines = []
+        for cat in news.COMPETITOR_CATEGORIES:
             if cat in categories:
-                # Category header
-                header = ctk.CTkLabel(
-                    self.competitor_news_frame,
-                    text=cat,
-                    font=self.FONTS["body"],
-                    text_color=self.COLORS["text_primary"],
-                    anchor="w"
-                )
-                header.pack(fill="x", padx=10, pady=(10, 2))
-                
-                # Messages in this category
-                for msg in categories[cat]:
-                    msg_card = ctk.CTkFrame(
-                        self.competitor_news_frame,
-                        fg_color=self.COLORS["bg_tertiary"],
-                        corner_radius=5
-                    )
-                    msg_card.pack(fill="x", padx=15, pady=1)
-                    
-                    msg_label = ctk.CTkLabel(
-                        msg_card,
-                        text=msg,
-                        font=self.FONTS["body_small"],
-                        text_color=self.COLORS["text_secondary"],
-                        wraplength=wrap_length,
-                        anchor="w",
-                        justify="left"
-                    )
-                    msg_label.pack(fill="x", padx=10, pady=5)
+                lines.append((True, cat))
+                lines.extend((False, item) for item in categories[cat])
+        view.set_items(lines, keep_position=False)
+
+    def _create_competitor_line(self, parent):
+        line = ctk.CTkFrame(parent, corner_radius=5)
+        label = ctk.CTkLabel(line, anchor="w", justify="left")
+        label.pack(fill="x", padx=10, pady=5)
+        return {"frame": line, "label": label}
+
+    def _fill_competitor_line(self, widgets, index, line):
+        is_header, item = line
+        if is_header:
+            widgets["frame"].configure(fg_color="transparent")
+            widgets["label"].configure(text=item, font=self.FONTS["body"],
+                                       text_color=self.COLORS["text_primary"], wraplength=0)
+        else:
+            widgets["frame"].configure(fg_color=self.COLORS["bg_tertiary"])
+            widgets["label"].configure(text=item.text, font=self.FONTS["body_small"],
+                                       text_color=self.COLORS["text_secondary"],
+                                       wraplength=self._competitor_wrap)
 
     def update_news_feed(self, news):
         """Update the news feed with latest game events"""
@@ -788,7 +876,7 @@ class TechnopolyGUI:
             
             news_label = ctk.CTkLabel(
                 news_card,
-                text=item,
+                text=item.text,
                 font=self.FONTS["body_small"],
                 text_color=self.COLORS["text_primary"],
                 wraplength=380,
@@ -798,80 +886,98 @@ class TechnopolyGUI:
             self.news_feed_labels.append(news_card)
 
     def update_product_summary(self):
-        """Update the product summary section on the summary tab"""
-        # Clear existing summary
-        for widget in self.product_summary_scroll.winfo_children():
-            widget.destroy()
-        
-        if not self.game.player.products:
-            no_products = ctk.CTkLabel(
-                self.product_summary_scroll,
-                text="No products in portfolio",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_tertiary"]
-            )
-            no_products.pack(pady=20)
-            return
-        
-        # Add product cards
-        for name, product in self.game.player.products.items():
-            prod_card = ctk.CTkFrame(
+        """Update the product summary section on the summary tab (only cards whose product changed)"""
+        rows = getattr(self, "_product_summary_rows", None)
+        if rows is None or rows.parent is not self.product_summary_scroll:
+            rows = self._product_summary_rows = KeyedRows(
                 self.product_summary_scroll,
-                fg_color=self.COLORS["bg_secondary"],
-                corner_radius=5
-            )
-            prod_card.pack(fill="x", pady=5)
-            
-            header_frame = ctk.CTkFrame(prod_card, fg_color="transparent")
-            header_frame.pack(fill="x", padx=10, pady=(10, 5))
-            
-            name_label = ctk.CTkLabel(
-                header_frame,
-                text=name,
-                font=self.FONTS["body"],
-                text_color=self.COLORS["text_primary"],
-                anchor="w"
-            )
-            name_label.pack(side="left")
-            
-            market_label = ctk.CTkLabel(
-                header_frame,
-                text=f"in {product.market_name}",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_secondary"],
-                anchor="e"
-            )
-            market_label.pack(side="right")
-            
-            # Product metrics
-            metrics_frame = ctk.CTkFrame(prod_card, fg_color="transparent")
-            metrics_frame.pack(fill="x", padx=10, pady=(0, 10))
-            
-            revenue_frame = self.create_metric_row(
-                metrics_frame,
-                "Revenue",
-                format_money(product.revenue)
-            )
-            revenue_frame.pack(fill="x", pady=2)
-            
-            effectiveness_frame = self.create_metric_row(
-                metrics_frame,
-                "Effectiveness",
-                f"{product.effectiveness:.2f}"
-            )
-            effectiveness_frame.pack(fill="x", pady=2)
-            
-            employees_text = (
-                f"R&D: {product.assigned_employees['r&d']} | "
-                f"Q&A: {product.assigned_employees['q&a']} | "
-                f"Marketing: {product.assigned_employees['marketing']}"
+                self._create_product_card,
+                self._fill_product_card,
+                pack={"fill": "x", "pady": 5},
+                placeholder=lambda parent: self._placeholder_label(parent, "No products in portfolio")
             )
-            employees_frame = self.create_metric_row(
-                metrics_frame,
-                "Employees",
-                employees_text
-            )
-            employees_frame.pack(fill="x", pady=2)
+        rows.sync([
+            (name, (product.market_name, product.revenue, product.effectiveness,
+                    product.assigned_employees['r&d'], product.assigned_employees['q&a'],
+                    product.assigned_employees['marketing']))
+            for name, product in self.game.player.products.items()
+        ])
+
+    def _placeholder_label(self, parent, text, **kwargs):
+        label = ctk.CTkLabel(
+            parent,
+            text=text,
+            font=kwargs.pop("font", self.FONTS["body_small"]),
+            text_color=self.COLORS["text_tertiary"],
+            **kwargs
+        )
+        label.pack(pady=20)
+        return label
+
+    def _create_product_card(self, parent, name):
+        prod_card = ctk.CTkFrame(
+            parent,
+            fg_color=self.COLORS["bg_secondary"],
+            corner_radius=5
+        )
+
+        header_frame = ctk.CTkFrame(prod_card, fg_color="transparent")
+        header_frame.pack(fill="x", padx=10, pady=(10, 5))
+
+        name_label = ctk.CTkLabel(
+            header_frame,
+            text=name,
+            font=self.FONTS["body"],
+            text_color=self.COLORS["text_primary"],
+            anchor="w"
+        )
+        name_label.pack(side="left")
+
+        market_label = ctk.CTkLabel(
+            header_frame,
+            text="",
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_secondary"],
+            anchor="e"
+        )
+        market_label.pack(side="right")
+
+        # Product metrics (their values are set by _fill_product_card)
+        metrics_frame = ctk.CTkFrame(prod_card, fg_color="transparent")
+        metrics_frame.pack(fill="x", padx=10, pady=(0, 10))
+        widgets = {"frame": prod_card, "market": market_label}
+        for key, label in (("revenue", "Revenue"), ("effectiveness", "Effectiveness"), ("employees", "Employees")):
+            row = self.create_metric_row(metrics_frame, label, "")
+            row.pack(fill="x", pady=2)
+            widgets[key] = row.value_label
+        return widgets
+
+    def _fill_product_card(self, widgets, name, data):
+        market_name, revenue, effectiveness, rd, qa, marketing = data
+        widgets["market"].configure(text=f"in {market_name}")
+        widgets["revenue"].configure(text=format_money(revenue))
+        widgets["effectiveness"].configure(text=f"{effectiveness:.2f}")
+        widgets["employees"].configure(text=f"R&D: {rd} | Q&A: {qa} | Marketing: {marketing}")
+
+    def create_metric_row(self, parent, label, value):
+        """A label / value row; the value label is kept as row.value_label so callers can update it"""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        ctk.CTkLabel(
+            row,
+            text=label,
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_secondary"],
+            anchor="w"
+        ).pack(side="left")
+        row.value_label = ctk.CTkLabel(
+            row,
+            text=value,
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_primary"],
+            anchor="e"
+        )
+        row.value_label.pack(side="right")
+        return row
 
     def update_summary_tab(self):
         """Update all elements in the summary tab"""
@@ -883,7 +989,8 @@ class TechnopolyGUI:
         overhead = emp_cost * player.overhead_percent()
         total_costs = player.total_spending_this_quarter()
         total_debt = sum(ln.principal for ln in player.loans)
-        debt_service = sum(ln.monthly_payment for ln in player.loans) * 4
+        outlook = self.game.project_cash(player, 4)
+        debt_service = sum(outlook.loan_payments)  # next 4 quarters
         
         self.quarterly_metrics["Revenue"].configure(text=format_money(revenue))
         self.quarterly_metrics["Profit"].configure(text=format_money(profit))
@@ -893,6 +1000,9 @@ class TechnopolyGUI:
         self.quarterly_metrics["MarketCap"].configure(text=format_money(player.market_cap))
         self.quarterly_metrics["Debt"].configure(text=format_money(total_debt))
         self.quarterly_metrics["Debt Servicing"].configure(text=format_money(debt_service))
+        projected = self.quarterly_metrics.get("Projected Cash (4Q)")
+        if projected is not None:  # layouts without the projection row skip it
+            projected.configure(text=format_money(outlook.cash[-1]))
         
         # Update investments metrics
         total_bonds = sum(b.principal for b in player.bonds)
@@ -929,7 +1039,7 @@ class TechnopolyGUI:
         self.market_cap_label.configure(text=f"Market Cap: {format_money(player.market_cap)}")
         
         # Update dominance percentage in stock market tab
-        total_market_cap = sum(comp.market_cap for comp in [player] + self.game.ai_companies if comp.market_cap > 0)
+        total_market_cap = self.game.registry.total_market_cap
         if total_market_cap > 0:
             dominance = (player.market_cap / total_market_cap) * 100
             self.dominance_label.configure(text=f"Your Market Dominance: {dominance:.1f}%")
@@ -954,84 +1064,24 @@ class TechnopolyGUI:
         
         # Process turn in a separate thread to avoid UI freezing
         def process_turn():
-            # Store the current turn's competitor moves
-            self.competitor_moves = []
-            
-            # Re-randomize Market Growth Every 8 Turns
-            if self.game.turn_index > 0 and (self.game.turn_index % 8) == 0:
-                for mk in self.game.markets:
-                    mk.base_growth_rate = random.uniform(0.05, 0.15)
-                    mk.growth_rate = mk.base_growth_rate  # Reset growth rate
-
-            # Resolve any pending acquisitions
-            self.game._resolve_pending_acquisitions()
-
-            # Run AI actions
-            for comp in self.game.ai_companies:
-                self.game.ai_controller.ai_take_actions(comp)
-                
-            # Spawn new companies and markets periodically
-            if self.game.turn_index > 0 and (self.game.turn_index % 4) == 0:
-                self.game.spawn_new_ai_companies()
-
-            if self.game.turn_index > 0 and (self.game.turn_index % 3) == 0:
-                self.game.spawn_new_product_market()
-
-            # Distribute Revenue & Update Market Size
-            self.game._distribute_revenue_all_markets()
-
-            # Trigger Events
-            ev = self.game.event_manager.pick_random_event()
-            self.game.event_manager.apply_event(ev)
-            if ev is not None:
-                ev.turn_happened = self.game.turn_index
-                self.game._push_news(f"{ev.name}: {ev.description}")
-            
-            self.game.event_manager.update_recession()
-
-            # Update Finances
-            self.game._update_finances()
-
-            # Update bankruptcy status
-            self.game.player.update_negative_cash_quarters()
-            
-            # Store data for the turn
-            self.game.data_store.record_state(self.game.turn_index + 1, 
-                                             [self.game.player] + self.game.ai_companies, 
-                                             self.game.markets)
-            
-            # Check for game over conditions
-            is_bankrupt = self.game.player.is_bankrupt()
-            
-            # Check for victory condition
-            total_market_cap = sum(comp.market_cap for comp in [self.game.player] + self.game.ai_companies if comp.market_cap > 0)
-            is_winner = False
-            if total_market_cap > 0:
-                player_dominance = (self.game.player.market_cap / total_market_cap)
-                is_winner = player_dominance > 0.7 or len(self.game.ai_companies) == 0
-            
-            # Increment turn counter
-            self.game.turn_index += 1
-            
-            # Prepare news for display
-            year, quarter = self.game._get_date()
-            news = self.game.event_manager.format_news_feed(year, quarter)
-            news.extend(self.game.news_feed)
-            self.game.news_feed.clear()
+            # The engine plays the whole quarter; the GUI only presents the result
+            result = self.game.advance_quarter()
+            self.competitor_moves = result.competitor_news
             
             # Handle game over conditions
-            if is_bankrupt:
+            if result.is_bankrupt:
                 self.root.after(0, lambda: self.show_game_over("BANKRUPTCY", "Your company has gone bankrupt!"))
                 return
                 
-            if is_winner:
+            if result.is_winner:
                 self.root.after(0, lambda: self.show_game_over("VICTORY", "You've achieved market dominance and won the game!"))
                 return
             
             # Update the UI with new game state
             self.root.after(0, lambda: self.update_all_tabs())
-            self.root.after(0, lambda: self.update_news_feed(news))
-            self.root.after(0, lambda: self.update_competitor_moves())
+            self.root.after(0, lambda: self.update_news_feed(result.news))
+            self.root.after(0, lambda: self.update_competitor_moves(result.competitor_news))
+            self.root.after(0, lambda: self.refresh_profiler_panel())
             
             # Re-enable the end turn button
             self.root.after(0, lambda: self.end_turn_button.configure(
@@ -1043,6 +1093,66 @@ class TechnopolyGUI:
         # Start turn processing in a separate thread
         threading.Thread(target=process_turn, daemon=True).start()
 
+    def show_profiler_panel(self):
+        """Debug panel (F12) with the engine's per-phase turn timings"""
+        if self.profiler_window is not None and self.profiler_window.winfo_exists():
+            self.profiler_window.focus()
+            return
+
+        self.profiler_window = ctk.CTkToplevel(self.root)
+        self.profiler_window.title("Turn Profiler")
+        self.profiler_window.geometry("560x420")
+        self.profiler_window.configure(fg_color=self.COLORS["bg_primary"])
+
+        controls = ctk.CTkFrame(self.profiler_window, fg_color="transparent")
+        controls.pack(fill="x", padx=10, pady=(10, 0))
+
+        enabled_var = tk.BooleanVar(value=self.game.profiler.enabled)
+
+        def toggle():
+            self.game.profiler.enabled = enabled_var.get()
+            self.refresh_profiler_panel()
+
+        ctk.CTkCheckBox(
+            controls,
+            text="Profile turns",
+            variable=enabled_var,
+            command=toggle,
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_primary"]
+        ).pack(side="left")
+
+        def reset():
+            self.game.profiler.reset()
+            self.refresh_profiler_panel()
+
+        ctk.CTkButton(
+            controls,
+            text="Reset",
+            width=80,
+            command=reset,
+            font=self.FONTS["body_small"],
+            fg_color=self.COLORS["bg_tertiary"]
+        ).pack(side="right")
+
+        self.profiler_text = ctk.CTkTextbox(
+            self.profiler_window,
+            font=("Consolas", 12),
+            fg_color=self.COLORS["bg_secondary"],
+            text_color=self.COLORS["text_primary"]
+        )
+        self.profiler_text.pack(fill="both", expand=True, padx=10, pady=10)
+        self.refresh_profiler_panel()
+
+    def refresh_profiler_panel(self):
+        """Redraw the profiler report if the debug panel is open"""
+        if self.profiler_window is None or not self.profiler_window.winfo_exists():
+            return
+        self.profiler_text.configure(state="normal")
+        self.profiler_text.delete("1.0", "end")
+        self.profiler_text.insert("1.0", self.game.profiler.report() + "\n\n(times in ms)")
+        self.profiler_text.configure(state="disabled")
+
     def show_game_over(self, status, message):
         """Show game over screen with modern design"""
         # Clear all widgets
@@ -1180,27 +1290,24 @@ class TechnopolyGUI:
         main_menu_button.grid(row=0, column=1, sticky="ew", padx=(5, 0))
 
     def update_all_tabs(self):
-        """Update all tabs with current game data"""
+        """Update the top bar and the visible tab; the other tabs are redrawn when shown"""
         # Update live info in top bar
         self.update_live_info()
-        
-        # Update summary tab
-        self.update_summary_tab()
-        
-        # Update products tab
-        self.update_products_tab()
-        
-        # Update finances tab
-        self.update_finances_tab()
-        
-        # Update stock market tab
-        self.update_stock_market_tab()
-        
-        # Update acquisitions tab
-        self.update_acquisitions_tab()
-        
-        # Update operations tab
-        self.update_operations_tab()
+
+        # Every tab now shows stale data; redraw the one on screen
+        self._stale_tabs = set(self.TAB_UPDATERS)
+        self.refresh_visible_tab()
+
+    def on_tab_changed(self):
+        """Command of the main tab view (CTkTabview calls it without arguments): redraw the newly shown tab if it is stale"""
+        self.current_tab = self.tabview.get()
+        self.refresh_visible_tab()
+
+    def refresh_visible_tab(self):
+        """Redraw the visible tab if its data changed since it was last drawn"""
+        if self.current_tab in self._stale_tabs:
+            self._stale_tabs.discard(self.current_tab)
+            getattr(self, self.TAB_UPDATERS[self.current_tab])()
 
     def stop_background_animation(self):
         """Stop the background animation if it's running"""
@@ -1209,7 +1316,7 @@ class TechnopolyGUI:
     # Add missing methods at the end of the class
 
     def view_market_rankings_dialog(self):
-        """Show dialog with product rankings for each market"""
+        """Show dialog with product rankings for each market (a market's rows are built when its tab is first shown)"""
         dialog = ctk.CTkToplevel(self.root)
         dialog.title("Market Rankings")
         dialog.geometry("900x600")
@@ -1218,143 +1325,24 @@ class TechnopolyGUI:
         # Main container
         main_frame = ctk.CTkFrame(dialog, fg_color=self.COLORS["bg_primary"])
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
+
+        built = set()
+
+        def show_market():
+            market_name = market_tabs.get()
+            if market_name and market_name not in built:
+                built.add(market_name)
+                self._build_market_ranking(market_tabs.tab(market_name), market_name)
+
         # Create a tabbed interface for different markets
-        market_tabs = ctk.CTkTabview(main_frame)
+        market_tabs = ctk.CTkTabview(main_frame, command=show_market)
         market_tabs.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create tabs for each market
         for market in self.game.markets:
-            market_name = market.name
-            market_tabs.add(market_name)
-            
-            # Create a frame for this market's products
-            market_frame = ctk.CTkFrame(
-                market_tabs.tab(market_name), 
-                fg_color="transparent"
-            )
-            market_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            # Find products in this market
-            products = self.game._find_products_in_market(market_name)
-            
-            if not products:
-                no_products = ctk.CTkLabel(
-                    market_frame,
-                    text=f"No products in the {market_name} market yet.",
-                    font=self.FONTS["body"],
-                    text_color=self.COLORS["text_tertiary"]
-                )
-                no_products.pack(pady=50)
-                continue
-                
-            # Sort products by revenue (highest first)
-            products.sort(key=lambda p: p.revenue, reverse=True)
-            
-            # Create header row
-            header_frame = ctk.CTkFrame(
-                market_frame,
-                fg_color=self.COLORS["bg_secondary"],
-                corner_radius=5
-            )
-            header_frame.pack(fill="x", pady=(0, 10))
-            
-            # Configure columns
-            header_frame.columnconfigure(0, weight=1)  # Rank
-            header_frame.columnconfigure(1, weight=3)  # Company
-            header_frame.columnconfigure(2, weight=2)  # Revenue
-            header_frame.columnconfigure(3, weight=2)  # Quality
-            
-            # Header labels
-            rank_header = ctk.CTkLabel(
-                header_frame,
-                text="Rank",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_secondary"]
-            )
-            rank_header.grid(row=0, column=0, padx=10, pady=5, sticky="w")
-            
-            company_header = ctk.CTkLabel(
-                header_frame,
-                text="Company",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_secondary"]
-            )
-            company_header.grid(row=0, column=1, padx=10, pady=5, sticky="w")
-            
-            revenue_header = ctk.CTkLabel(
-                header_frame,
-                text="Revenue",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_secondary"]
-            )
-            revenue_header.grid(row=0, column=2, padx=10, pady=5, sticky="w")
-            
-            quality_header = ctk.CTkLabel(
-                header_frame,
-                text="Quality",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_secondary"]
-            )
-            quality_header.grid(row=0, column=3, padx=10, pady=5, sticky="w")
-            
-            # Product rows
-            for i, product in enumerate(products):
-                row_frame = ctk.CTkFrame(
-                    market_frame,
-                    fg_color=self.COLORS["bg_tertiary"] if i % 2 == 0 else "transparent",
-                    corner_radius=5
-                )
-                row_frame.pack(fill="x", pady=2)
-                
-                # Configure columns (same as header)
-                row_frame.columnconfigure(0, weight=1)
-                row_frame.columnconfigure(1, weight=3)
-                row_frame.columnconfigure(2, weight=2)
-                row_frame.columnconfigure(3, weight=2)
-                
-                # Determine if this is the player's product
-                is_player = product.owner_name == self.game.player.name
-                text_color = self.COLORS["accent_primary"] if is_player else self.COLORS["text_primary"]
-                
-                # Rank
-                rank_label = ctk.CTkLabel(
-                    row_frame,
-                    text=f"{i+1}",
-                    font=self.FONTS["body"],
-                    text_color=self.COLORS["text_primary"]
-                )
-                rank_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
-                
-                # Company name
-                company_text = f"{product.owner_name} {'(YOU)' if is_player else ''}"
-                company_label = ctk.CTkLabel(
-                    row_frame,
-                    text=company_text,
-                    font=self.FONTS["body"],
-                    text_color=text_color
-                )
-                company_label.grid(row=0, column=1, padx=10, pady=5, sticky="w")
-                
-                # Revenue
-                revenue_label = ctk.CTkLabel(
-                    row_frame,
-                    text=format_money(product.revenue),
-                    font=self.FONTS["body"],
-                    text_color=self.COLORS["text_primary"]
-                )
-                revenue_label.grid(row=0, column=2, padx=10, pady=5, sticky="w")
-                
-                # Quality
-                quality_str = self.game._get_product_quality_rank(product)
-                quality_label = ctk.CTkLabel(
-                    row_frame,
-                    text=quality_str,
-                    font=self.FONTS["body"],
-                    text_color=self.COLORS["text_primary"]
-                )
-                quality_label.grid(row=0, column=3, padx=10, pady=5, sticky="w")
-        
+            market_tabs.add(market.name)
+        show_market()
+
         # Close button
         close_button = ctk.CTkButton(
             main_frame,
@@ -1367,12 +1355,122 @@ class TechnopolyGUI:
         )
         close_button.pack(pady=10)
 
+
+    def _build_market_ranking(self, tab, market_name):
+        """Ranking table of one market, as a virtual list of its products"""
+        # Create a frame for this market's products
+        market_frame = ctk.CTkFrame(tab, fg_color="transparent")
+        market_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Find products in this market
+        products = self.game._find_products_in_market(market_name)
+
+        if not products:
+            no_products = ctk.CTkLabel(
+                market_frame,
+                text=f"No products in the {market_name} market yet.",
+                font=self.FONTS["body"],
+                text_color=self.COLORS["text_tertiary"]
+            )
+            no_products.pack(pady=50)
+            return
+
+        # Sort products by revenue (highest first)
+        products.sort(key=lambda p: p.revenue, reverse=True)
+
+        # Create header row
+        header_frame = ctk.CTkFrame(
+            market_frame,
+            fg_color=self.COLORS["bg_secondary"],
+            corner_radius=5
+        )
+        header_frame.pack(fill="x", pady=(0, 10))
+
+        # Configure columns
+        header_frame.columnconfigure(0, weight=1)  # Rank
+        header_frame.columnconfigure(1, weight=3)  # Company
+        header_frame.columnconfigure(2, weight=2)  # Revenue
+        header_frame.columnconfigure(3, weight=2)  # Quality
+
+        # Header labels
+        rank_header = ctk.CTkLabel(
+            header_frame,
+            text="Rank",
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_secondary"]
+        )
+        rank_header.grid(row=0, column=0, padx=10, pady=5, sticky="w")
+
+        company_header = ctk.CTkLabel(
+            header_frame,
+            text="Company",
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_secondary"]
+        )
+        company_header.grid(row=0, column=1, padx=10, pady=5, sticky="w")
+
+        revenue_header = ctk.CTkLabel(
+            header_frame,
+            text="Revenue",
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_secondary"]
+        )
+        revenue_header.grid(row=0, column=2, padx=10, pady=5, sticky="w")
+
+        quality_header = ctk.CTkLabel(
+            header_frame,
+            text="Quality",
+            font=self.FONTS["body_small"],
+            text_color=self.COLORS["text_secondary"]
+        )
+        quality_header.grid(row=0, column=3, padx=10, pady=5, sticky="w")
+
+        # Product rows (widgets only for the rows in view)
+        ranking = VirtualList(
+            market_frame,
+            self._create_ranking_row,
+            self._fill_ranking_row,
+            visible_rows=12,
+            fg_color="transparent"
+        )
+        ranking.pack(fill="both", expand=True)
+        ranking.set_items(products)
+
+    def _create_ranking_row(self, parent):
+        row_frame = ctk.CTkFrame(parent, corner_radius=5)
+
+        # Configure columns (same as header)
+        row_frame.columnconfigure(0, weight=1)
+        row_frame.columnconfigure(1, weight=3)
+        row_frame.columnconfigure(2, weight=2)
+        row_frame.columnconfigure(3, weight=2)
+
+        widgets = {"frame": row_frame}
+        for column, key in enumerate(("rank", "company", "revenue", "quality")):
+            label = ctk.CTkLabel(
+                row_frame,
+                text="",
+                font=self.FONTS["body"],
+                text_color=self.COLORS["text_primary"]
+            )
+            label.grid(row=0, column=column, padx=10, pady=5, sticky="w")
+            widgets[key] = label
+        return widgets
+
+    def _fill_ranking_row(self, widgets, i, product):
+        widgets["frame"].configure(fg_color=self.COLORS["bg_tertiary"] if i % 2 == 0 else "transparent")
+
+        # Determine if this is the player's product
+        is_player = product.owner_name == self.game.player.name
+        text_color = self.COLORS["accent_primary"] if is_player else self.COLORS["text_primary"]
+
+        widgets["rank"].configure(text=f"{i+1}")
+        widgets["company"].configure(text=f"{product.owner_name} {'(YOU)' if is_player else ''}", text_color=text_color)
+        widgets["revenue"].configure(text=format_money(product.revenue))
+        widgets["quality"].configure(text=self.game._get_product_quality_rank(product))
+
     def update_acquisitions_tab(self):
         """Update the acquisitions tab with current acquisition candidates"""
-        # Clear current candidates
-        for widget in self.candidates_scroll.winfo_children():
-            widget.destroy()
-        
         # Update pending acquisitions section
         if hasattr(self, 'pending_frame'):
             if self.game.pending_acquisitions:
@@ -1396,115 +1494,154 @@ class TechnopolyGUI:
                 )
         
         # Find acquisition candidates
-        candidates = []
-        for ai_company in self.game.ai_companies:
-            # Calculate acquisition price
-            price = self.game._calculate_acquisition_price(ai_company)
-            # Only include companies the player can afford
-            if self.game.player.cash >= price:
-                candidates.append((ai_company, price))
-        
-        # If no candidates are available
-        if not candidates:
-            no_candidates = ctk.CTkLabel(
+        # Only include companies the player can afford
+        candidates = [(ai_company, price) for ai_company, price in self.game.acquisition_prices()
+                      if self.game.player.cash >= price]
+
+        # Only the cards in view exist; scrolling refills them with other candidates
+        view = getattr(self, "_candidate_list", None)
+        if view is None or view.container is not self.candidates_scroll:
+            view = self._candidate_list = VirtualList(
                 self.candidates_scroll,
-                text="No acquisition candidates available. You either can't afford any acquisitions or there are no AI companies left.",
-                font=self.FONTS["body"],
-                text_color=self.COLORS["text_tertiary"],
-                wraplength=600
+                self._create_candidate_card,
+                self._fill_candidate_card,
+                visible_rows=6,
+                row_pack={"fill": "x", "pady": 5, "padx": 10},
+                fg_color="transparent"
             )
-            no_candidates.pack(pady=20)
+            self._candidate_placeholder = None
+
+        # If no candidates are available
+        if not candidates:
+            view.pack_forget()
+            if self._candidate_placeholder is None:
+                self._candidate_placeholder = self._placeholder_label(
+                    self.candidates_scroll,
+                    "No acquisition candidates available. You either can't afford any acquisitions or there are no AI companies left.",
+                    font=self.FONTS["body"],
+                    wraplength=600
+                )
             return
-        
-        # Create cards for each candidate
-        for i, (company, price) in enumerate(candidates):
-            # Create candidate card
-            card = ctk.CTkFrame(
-                self.candidates_scroll,
-                fg_color=self.COLORS["bg_tertiary"],
-                corner_radius=10
-            )
-            card.pack(fill="x", pady=5, padx=10)
-            
-            # Card content
-            content_frame = ctk.CTkFrame(card, fg_color="transparent")
-            content_frame.pack(fill="x", padx=15, pady=15)
-            
-            # Company name
-            name_label = ctk.CTkLabel(
-                content_frame,
-                text=company.name,
-                font=self.FONTS["heading3"],
-                text_color=self.COLORS["text_primary"],
-                anchor="w"
-            )
-            name_label.pack(side="left")
-            
-            # Market cap
-            market_cap_label = ctk.CTkLabel(
-                content_frame,
-                text=f"Market Cap: {format_money(company.market_cap)}",
-                font=self.FONTS["body"],
-                text_color=self.COLORS["text_secondary"]
-            )
-            market_cap_label.pack(side="left", padx=20)
-            
-            # Acquisition price
-            price_label = ctk.CTkLabel(
-                content_frame,
-                text=f"Price: {format_money(price)}",
-                font=self.FONTS["body"],
-                text_color=self.COLORS["text_primary"]
-            )
-            price_label.pack(side="left", padx=10)
-            
-            # Acquisition button
-            acquire_button = ctk.CTkButton(
-                content_frame,
-                text="ACQUIRE",
-                font=self.FONTS["body_small"],
-                height=30,
-                fg_color=self.COLORS["accent_primary"],
-                hover_color=self.blend_colors(self.COLORS["accent_primary"], "#FFFFFF", 0.2),
-                command=lambda c=company, p=price: self.confirm_acquisition_dialog(c, p)
-            )
-            acquire_button.pack(side="right")
-            
-            # Store widgets
-            self.candidate_widgets[company.name] = (card, name_label, market_cap_label, price_label, acquire_button)
-            
-            # Additional company info
-            info_frame = ctk.CTkFrame(card, fg_color="transparent")
-            info_frame.pack(fill="x", padx=15, pady=(0, 15))
-            
-            # Product count
-            product_count = len(company.products)
-            products_label = ctk.CTkLabel(
-                info_frame,
-                text=f"Products: {product_count}",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_secondary"],
-                anchor="w"
-            )
-            products_label.pack(side="left", padx=(0, 20))
-            
-            # Employee count
-            employees_label = ctk.CTkLabel(
-                info_frame,
-                text=f"Employees: {company.employees}",
-                font=self.FONTS["body_small"],
-                text_color=self.COLORS["text_secondary"],
-                anchor="w"
-            )
-            employees_label.pack(side="left", padx=(0, 20))
-            
-            # Quarterly revenue
-            revenue = company.total_revenue_this_quarter()
-            revenue_label = ctk.CTkLabel(
+        if self._candidate_placeholder is not None:
+            self._candidate_placeholder.destroy()
+            self._candidate_placeholder = None
+        view.pack(fill="both", expand=True)
+        view.set_items(candidates)
+
+    def confirm_acquisition_dialog(self, company, price):
+        """Ask before bidding for an AI company; the bid is a player move (see BusinessGameEngine.player_act)"""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Confirm Acquisition")
+        dialog.geometry("480x220")
+        dialog.grab_set()
+
+        main_frame = ctk.CTkFrame(dialog, fg_color=self.COLORS["bg_primary"])
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        ctk.CTkLabel(
+            main_frame,
+            text=f"Acquire {company.name} for {format_money(price)}?\nThe acquisition finalizes next turn.",
+            font=self.FONTS["body"],
+            text_color=self.COLORS["text_primary"],
+            wraplength=420
+        ).pack(pady=(10, 20))
+
+        def confirm():
+            self.game.player_act("bid", company.name, price, None)
+            dialog.destroy()
+            self.update_acquisitions_tab()
+
+        button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        button_frame.pack(pady=10)
+        for text, color, command in (("ACQUIRE", self.COLORS["accent_primary"], confirm),
+                                     ("CANCEL", self.COLORS["bg_tertiary"], dialog.destroy)):
+            ctk.CTkButton(
+                button_frame,
+                text=text,
+                font=self.FONTS["button"],
+                height=40,
+                fg_color=color,
+                hover_color=self.blend_colors(color, "#FFFFFF", 0.2),
+                command=command
+            ).pack(side="left", padx=10)
+
+    def _create_candidate_card(self, parent):
+        # Create candidate card
+        card = ctk.CTkFrame(
+            parent,
+            fg_color=self.COLORS["bg_tertiary"],
+            corner_radius=10
+        )
+
+        # Card content
+        content_frame = ctk.CTkFrame(card, fg_color="transparent")
+        content_frame.pack(fill="x", padx=15, pady=15)
+
+        # Company name
+        name_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self.FONTS["heading3"],
+            text_color=self.COLORS["text_primary"],
+            anchor="w"
+        )
+        name_label.pack(side="left")
+
+        # Market cap
+        market_cap_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self.FONTS["body"],
+            text_color=self.COLORS["text_secondary"]
+        )
+        market_cap_label.pack(side="left", padx=20)
+
+        # Acquisition price
+        price_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self.FONTS["body"],
+            text_color=self.COLORS["text_primary"]
+        )
+        price_label.pack(side="left", padx=10)
+
+        # Acquisition button (its command is set in _fill_candidate_card)
+        acquire_button = ctk.CTkButton(
+            content_frame,
+            text="ACQUIRE",
+            font=self.FONTS["body_small"],
+            height=30,
+            fg_color=self.COLORS["accent_primary"],
+            hover_color=self.blend_colors(self.COLORS["accent_primary"], "#FFFFFF", 0.2)
+        )
+        acquire_button.pack(side="right")
+
+        # Additional company info
+        info_frame = ctk.CTkFrame(card, fg_color="transparent")
+        info_frame.pack(fill="x", padx=15, pady=(0, 15))
+
+        info_labels = []
+        for padx in ((0, 20), (0, 20), 0):
+            label = ctk.CTkLabel(
                 info_frame,
-                text=f"Quarterly Revenue: {format_money(revenue)}",
+                text="",
                 font=self.FONTS["body_small"],
                 text_color=self.COLORS["text_secondary"],
                 anchor="w"
             )
-            revenue_label.pack(side="left")
\ No newline at end of file
+            label.pack(side="left", padx=padx)
+            info_labels.append(label)
+
+        return {"frame": card, "name": name_label, "market_cap": market_cap_label, "price": price_label,
+                "button": acquire_button, "products": info_labels[0],
+                "employees": info_labels[1], "revenue": info_labels[2]}
+
+    def _fill_candidate_card(self, widgets, index, candidate):
+        company, price = candidate
+        widgets["name"].configure(text=company.name)
+        widgets["market_cap"].configure(text=f"Market Cap: {format_money(company.market_cap)}")
+        widgets["price"].configure(text=f"Price: {format_money(price)}")
+        widgets["button"].configure(command=lambda c=company, p=price: self.confirm_acquisition_dialog(c, p))
+        widgets["products"].configure(text=f"Products: {len(company.products)}")
+        widgets["employees"].configure(text=f"Employees: {company.employees}")
+        widgets["revenue"].configure(text=f"Quarterly Revenue: {format_money(company.total_revenue_this_quarter())}")
@@ -1,15 +1,37 @@
+from array import array
+
+
 class Loan:
     """
     Represents a loan taken by a company.
     Each loan has a principal amount, an annual interest rate,
     and a remaining term in months.
     The monthly payment is calculated using the standard amortization formula.
+
+    By default a quarter is settled as three payments against the interest of
+    the current balance (see pay_quarter). With exact_schedule=True the loan
+    precomputes its true amortisation schedule at creation instead: schedule[q]
+    is the balance left after q quarters of monthly compounding, so settling a
+    quarter is an index lookup, the balance is exact and the loan is repaid to
+    0 at the end of its term.
     """
-    def __init__(self, principal, annual_rate, term_months):
+    __slots__ = ("principal", "annual_rate", "term_remaining_months", "monthly_payment",
+                 "schedule", "quarters_paid")
+
+    def __init__(self, principal, annual_rate, term_months, exact_schedule=False):
         self.principal = principal
         self.annual_rate = annual_rate  # e.g. 0.06 for 6%
         self.term_remaining_months = term_months  # e.g. 120 months for 10 years
         self.monthly_payment = self.calculate_monthly_payment()
+        self.quarters_paid = 0
+        self.schedule = self._build_schedule() if exact_schedule else None
+
+    def __setstate__(self, state):
+        # Loans saved before schedules existed
+        self.schedule = None
+        self.quarters_paid = 0
+        for name, value in state[1].items():
+            setattr(self, name, value)
 
     def calculate_monthly_payment(self):
         monthly_r = self.annual_rate / 12
@@ -17,3 +39,73 @@ class Loan:
         if n <= 0:
             return 0
         return (monthly_r * self.principal) / (1 - (1 + monthly_r) ** (-n))
+
+    def _build_schedule(self):
+        """
+        Balance after each quarter, from the closed form
+        B(m) = P(1+r)^m - M((1+r)^m - 1)/r after m monthly payments.
+        """
+        n = self.term_remaining_months
+        p, m, r = self.principal, self.monthly_payment, self.annual_rate / 12
+        balances = array("d", [p])
+        for months in range(3, n, 3):
+            growth = (1 + r) ** months
+            balances.append(max(0.0, p * growth - m * (growth - 1) / r))
+        if n > 0:
+            balances.append(0.0)  # the last payment clears the loan
+        return balances
+
+    def pay_quarter(self):
+        """
+        Settles one quarter (three monthly payments, fewer in a final short quarter
+        of a scheduled loan): reduces the principal and the remaining term.
+        Returns the amount paid.
+        """
+        if self.schedule is not None:
+            months = min(3, self.term_remaining_months)
+            if months <= 0:
+                return 0.0
+            self.quarters_paid += 1
+            self.principal = self.schedule[min(self.quarters_paid, len(self.schedule) - 1)]
+            self.term_remaining_months -= 3
+            return self.monthly_payment * months
+
+        monthly_r = self.annual_rate / 12
+        # Calculate interest for one month.
+        interest_payment = self.principal * monthly_r
+        # Calculate principal portion for one month.
+        principal_portion = self.monthly_payment - interest_payment
+        if principal_portion < 0:
+            principal_portion = 0
+        # Reduce the loan principal by the quarter's (3 months) principal portion.
+        self.principal = max(0, self.principal - principal_portion * 3)
+        self.term_remaining_months -= 3
+        self.quarters_paid += 1
+        return self.monthly_payment * 3
+
+    def projected_payments(self, quarters):
+        """
+        Payments of the next `quarters` quarters (0 once the loan is repaid).
+        """
+        payments = []
+        months_left = self.term_remaining_months
+        for _ in range(quarters):
+            if self.schedule is not None:
+                months = min(3, max(0, months_left))
+            else:
+                months = 3 if months_left > 0 else 0
+            payments.append(self.monthly_payment * months)
+            months_left -= 3
+        return payments
+
+    def balance_after(self, quarters):
+        """
+        Principal left after `quarters` more quarters: exact for a scheduled loan,
+        a straight-line estimate of the remaining term otherwise.
+        """
+        if self.schedule is not None:
+            return self.schedule[min(self.quarters_paid + quarters, len(self.schedule) - 1)]
+        quarters_left = -(-self.term_remaining_months // 3)
+        if quarters >= quarters_left:
+            return 0.0
+        return self.principal * (1 - quarters / quarters_left)
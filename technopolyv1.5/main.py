@@ -1,13 +1,45 @@
 import sys
 import random
 from models import Company, Market, Loan, Product, Bond
-from configs import CAMPUS_TYPES
+from configs import CAMPUS_TYPES, DEFAULT_SCALE, ACQUISITION_TARGET_RANKS
 from data_store import DataStorage
 from events import EventManager
 from finances import update_finances
 from ai import AIController
-from utils import format_money
-from gui import TechnopolyGUI # import our gui
+import models
+import revenue_engine
+import ai_plan
+import projection
+import savegame
+from profiler import TurnProfiler
+from registry import CompanyRegistry
+from turnlog import TurnLog
+import news
+from news import NewsItem, FeedSink, NullSink
+
+
+# ===================
+#     TURN RESULT
+# ===================
+
+class TurnResult:
+    """
+    Outcome of a single quarter, returned by BusinessGameEngine.advance_quarter().
+    Holds everything the GUI (or a batch job) needs to present the quarter.
+    """
+    def __init__(self, turn_index, year, quarter):
+        self.turn_index = turn_index  # the quarter that was just played
+        self.year = year  # date AFTER the quarter was played
+        self.quarter = quarter
+        self.event = None  # GameEvent picked this quarter (or None)
+        self.news = []  # NewsItems: event feed + general news, ready for display
+        self.competitor_news = []  # NewsItems: AI competitor moves made this quarter
+        self.is_bankrupt = False
+        self.is_winner = False
+
+    @property
+    def game_over(self) -> bool:
+        return self.is_bankrupt or self.is_winner
 
 
 # ===================
@@ -27,13 +59,28 @@ class BusinessGameEngine:
          6) Store data
          7) Output summary
     """
-    def __init__(self):
+    def __init__(self, seed=None, vectorized_revenue=False, scale=None, ai_workers=None, exact_loans=False,
+                 record_log=False, news=True):
+        # Every random draw of the simulation comes from this generator, so a game
+        # is reproducible from its seed and parallel games share no state.
+        if record_log and seed is None:
+            seed = random.SystemRandom().getrandbits(63)  # a recorded game must be replayable
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Size limits (see configs.DEFAULT_SCALE); e.g. configs.STRESS_SCALE for stress runs
+        unknown = set(scale or ()) - set(DEFAULT_SCALE)
+        if unknown:
+            raise ValueError(f"Unknown scale settings: {sorted(unknown)}")
+        self.scale = dict(DEFAULT_SCALE, **(scale or {}))
+
         self.turn_index = 0
         self.start_year = 2000
         self.game_over=False
 
         self.player = None
         self.ai_companies=[]
+        self.registry = CompanyRegistry()  # name index and market-cap order, kept in sync with ai_companies
 
         market_names = [
             "Artificial Intelligence", "Cloud Computing", "Cybersecurity", "Enterprise SaaS", 
@@ -44,34 +91,220 @@ class BusinessGameEngine:
             "VR Software", "Cloud Gaming", "Quantum Computing", "Smart Home",
             "Streaming Platforms", "GreenTech", "Wearables", "Video Games"
         ]
-        self.markets=[Market(n) for n in market_names]
+        self.markets=[Market(self._pool_name(market_names, i), self.rng) for i in range(self.scale["initial_markets"])]
 
         self.data_store= DataStorage()
-        self.event_manager= EventManager(self.markets)
+        self.event_manager= EventManager(self.markets, self.rng)
         self.ai_controller= AIController(self)  # pass ref to ourselves
 
         self.used_company_names=set()
         self.used_product_names=set()
 
         self.pending_acquisitions=[]
-        self.news_feed=[]
-        self.competitor_news_feed = []  # For AI competitor moves
+        # market name -> [Product] (incl. a spawned market's imaginary product),
+        # kept in sync on product creation, acquisitions, bankruptcies and market spawns
+        self._market_products = {m.name: [] for m in self.markets}
+        # market name -> {Product: (position, rank label)}, built lazily and
+        # invalidated whenever effectiveness or market membership changes
+        self._rank_cache = {}
+        # market name -> (Product ranked as an acquisition target, ...) in market order,
+        # derived from the rankings and invalidated with them
+        self._candidate_cache = {}
+        # Company -> (balance-sheet key, acquisition price), emptied by every update_finances
+        self._price_cache = {}
+        # NewsItems of the quarter being played (see news.py); with news=False (headless
+        # runs) a NullSink discards them and the AI does not build them at all
+        self.news_sink = FeedSink() if news else NullSink()
         
         self.spawned_ai_count = 0
         self.spawned_market_count = 0
+        self.bankruptcies = {}  # tier -> number of AI companies that went bankrupt
+
+        # Use the NumPy revenue engine when requested and available
+        self.vectorized_revenue = vectorized_revenue and revenue_engine.HAS_NUMPY
+
+        # Phase timings of advance_quarter (off until profiler.enabled is set)
+        self.profiler = TurnProfiler()
+
+        # None: AI companies act one after another (the reference behaviour).
+        # N >= 1: two-phase AI (see ai_plan.py), planned across N worker processes.
+        self.ai_workers = ai_workers
+        self._ai_pool = None
+        self._ai_pool_workers = 0  # size of _ai_pool; the pool is restarted when ai_workers changes
+
+        # New loans precompute their exact amortisation schedule (see loan.Loan)
+        self.exact_loans = exact_loans
         
         # --- ADDED THESE ---
         self.Loan = Loan # needed to avoid circular dependance and allow for gui to make loan objects with game engine loan parameters
         self.Bond = Bond # needed to avoid circular dependance and allow for gui to make bond objects with game engine bond parameters
         self.CAMPUS_TYPES = CAMPUS_TYPES # need to make campus types available
 
+        # Binary log of every decision, for turnlog.replay (None when not recording)
+        self.turn_log = None
+        if record_log:
+            self.turn_log = TurnLog()
+            self.turn_log.settings(seed, self.vectorized_revenue, exact_loans, self.scale, ai_workers, news)
+
     def setup_game(self):
+        if self.turn_log is not None:
+            self.turn_log.setup()
         # first, create AI
         self._create_ai_companies()
         # then create player
         self._initialize_player() # still creates a default player instance
         # NO initial state storage here; it happens AFTER player setup
 
+    def start_player_company(self, company_name, market_name):
+        """
+        Names the player's company and launches its first product in the chosen market.
+        Records the initial state so the first quarter can be played.
+        """
+        if self.turn_log is not None:
+            self.turn_log.start_player(company_name, market_name)
+        self.player.name = company_name
+
+        p = Product(self.player.name, market_name)
+        p.assigned_employees["r&d"] = 0
+        p.assigned_employees["q&a"] = 0
+        p.assigned_employees["marketing"] = 0
+
+        # Adjust product based on market competition
+        prods = self._find_products_in_market(market_name)
+        if prods:
+            biggest = max(prods, key=lambda x: x.revenue)
+            if biggest.revenue >= 10_000:
+                biggest.revenue -= 10_000
+                p.revenue = 10_000
+            min_eff = min(prod.effectiveness for prod in prods)
+            p.effectiveness = max(0, min_eff - (min_eff * 0.4))
+
+        # Add product to player's portfolio
+        self.player.add_product(market_name, p)
+        self._register_product(p)
+
+        # Record initial state
+        self.data_store.record_state(self.turn_index, [self.player] + self.ai_companies, self.markets)
+        return p
+
+    def advance_quarter(self) -> TurnResult:
+        """
+        Plays one full quarter without any GUI involvement:
+          1) Growth re-randomization (every 8 turns)
+          2) Pending acquisitions
+          3) AI actions
+          4) Spawns (companies every 4 turns, markets every 3)
+          5) Distribute revenue
+          6) Events
+          7) Finances
+          8) Store data
+          9) Win / loss checks
+        Each step is timed by self.profiler when it is enabled, which also counts
+        the Company aggregate cache hits and misses of the quarter.
+        Returns a TurnResult describing what happened.
+        """
+        profiler = self.profiler
+        if not profiler.enabled:
+            return self._play_quarter(profiler)
+        profiler.begin_turn(self.turn_index)
+        hits, misses = models.aggregate_cache_counts()
+        with profiler.phase("turn"):
+            result = self._play_quarter(profiler)
+        end_hits, end_misses = models.aggregate_cache_counts()
+        profiler.count("aggregate_cache/hit", end_hits - hits)
+        profiler.count("aggregate_cache/miss", end_misses - misses)
+        profiler.end_turn()
+        return result
+
+    def _play_quarter(self, profiler):
+        # Re-randomize Market Growth Every 8 Turns
+        if self.turn_index > 0 and (self.turn_index % 8) == 0:
+            for mk in self.markets:
+                mk.base_growth_rate = self.rng.uniform(0.05, 0.15)
+                mk.growth_rate = mk.base_growth_rate  # Reset growth rate
+
+        # Resolve any pending acquisitions
+        with profiler.phase("acquisitions"):
+            self._resolve_pending_acquisitions()
+
+        # Run AI actions (iterate over a copy: bankruptcies remove companies)
+        log = self.turn_log
+        if log is not None:
+            log.begin_quarter(self.turn_index, len(self.ai_companies))
+        with profiler.phase("ai"):
+            if self.ai_workers is None:
+                for comp in list(self.ai_companies):
+                    self.ai_controller.ai_take_actions(comp)
+            else:
+                ai_plan.run_ai_phase(self)
+        if log is not None:
+            log.end_ai_phase(self.rng)
+
+        # Spawn new companies and markets periodically
+        with profiler.phase("spawns"):
+            if self.turn_index > 0 and (self.turn_index % self.scale["ai_spawn_interval"]) == 0:
+                self.spawn_new_ai_companies()
+
+            if self.turn_index > 0 and (self.turn_index % self.scale["market_spawn_interval"]) == 0:
+                self.spawn_new_product_market()
+
+        # Distribute Revenue & Update Market Size
+        with profiler.phase("revenue"):
+            self._distribute_revenue_all_markets()
+
+        # Trigger Events
+        with profiler.phase("events"):
+            ev = self.event_manager.pick_random_event()
+            self.event_manager.apply_event(ev)
+            if log is not None:
+                log.event(ev)
+            if ev is not None:
+                ev.turn_happened = self.turn_index
+                self._push_news(NewsItem(news.EVENTS, "{}: {}", ev.name, ev.description))
+
+            self.event_manager.update_recession()
+
+        # Update Finances
+        with profiler.phase("finances"):
+            self._update_finances()
+
+        # Update bankruptcy status
+        self.player.update_negative_cash_quarters()
+
+        # Store data for the turn
+        with profiler.phase("record_state"):
+            self.data_store.record_state(self.turn_index + 1, [self.player] + self.ai_companies, self.markets)
+        if log is not None:
+            log.player_state(self.player)
+
+        # Check for game over conditions
+        is_bankrupt = self.player.is_bankrupt()
+
+        # Check for victory condition
+        total_market_cap = self.registry.total_market_cap
+        is_winner = False
+        if total_market_cap > 0:
+            player_dominance = (self.player.market_cap / total_market_cap)
+            is_winner = player_dominance > 0.7 or len(self.ai_companies) == 0
+
+        played_turn = self.turn_index
+        self.turn_index += 1
+
+        # Prepare news for display
+        year, quarter = self._get_date()
+        result = TurnResult(played_turn, year, quarter)
+        result.event = ev
+        general_news, result.competitor_news = self.news_sink.drain()
+        if self.news_enabled:
+            result.news = self.event_manager.format_news_feed(year, quarter)
+            result.news.extend(general_news)
+
+        result.is_bankrupt = is_bankrupt
+        result.is_winner = is_winner
+        if result.game_over:
+            self._end_game()
+        return result
+
     def _get_date(self):
         """
         Calculate the current year and quarter based on the turn index.
@@ -90,13 +323,38 @@ class BusinessGameEngine:
         """
         Determines the product's effectiveness rank based on its position within the market.
         """
-        products_in_market = self._find_products_in_market(product.market_name)
-        products_in_market.sort(key=lambda x: x.effectiveness, reverse=True)
-
-        # Get the index of the product in the sorted list
-        position = products_in_market.index(product)
-        total_products = len(products_in_market)
+        return self._market_rankings(product.market_name)[product][1]
 
+    def _market_rankings(self, mname):
+        """
+        Returns the cached {Product: (position, rank label)} mapping for a market,
+        sorting the market's products by effectiveness only when the cache is stale.
+        """
+        rankings = self._rank_cache.get(mname)
+        if rankings is None:
+            products_in_market = sorted(self._market_products.get(mname, ()), key=lambda x: x.effectiveness, reverse=True)
+            total_products = len(products_in_market)
+            rankings = {p: (position, self._rank_label(position, total_products))
+                        for position, p in enumerate(products_in_market)}
+            self._rank_cache[mname] = rankings
+        return rankings
+
+    def _acquisition_candidates(self, mname):
+        """
+        The market's products ranked as acquisition targets (ACQUISITION_TARGET_RANKS),
+        in market order. Shared by every AI company until the market's rankings change,
+        so an acquisition step only walks these few products.
+        """
+        candidates = self._candidate_cache.get(mname)
+        if candidates is None:
+            rankings = self._market_rankings(mname)
+            candidates = tuple(p for p in self._market_products.get(mname, ())
+                               if rankings[p][1] in ACQUISITION_TARGET_RANKS)
+            self._candidate_cache[mname] = candidates
+        return candidates
+
+    @staticmethod
+    def _rank_label(position, total_products):
         if position == 0:
             return "Very Good"
         elif position == total_products - 1:
@@ -108,6 +366,101 @@ class BusinessGameEngine:
         else:
             return "Moderate"
 
+    def _invalidate_rankings(self, mname=None):
+        """
+        Drops the cached rankings of one market (or of every market when mname is None).
+        """
+        if mname is None:
+            self._rank_cache.clear()
+            self._candidate_cache.clear()
+        else:
+            self._rank_cache.pop(mname, None)
+            self._candidate_cache.pop(mname, None)
+
+
+    def close(self):
+        """
+        Stops the AI worker processes, if any were started. The engine stays usable:
+        a later two-phase quarter starts a new pool.
+        """
+        if self._ai_pool is not None:
+            self._ai_pool.terminate()
+            self._ai_pool = None
+            self._ai_pool_workers = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ==================================
+    #           SAVE / LOAD
+    # ==================================
+    def save(self, path):
+        """
+        Writes the whole game to a binary save file (see savegame.py).
+        """
+        return savegame.save_game(self, path)
+
+    @staticmethod
+    def load(path):
+        """
+        Returns the game stored in a save file written by save().
+        """
+        return savegame.load_game(path)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_rank_cache"] = {}  # derived from effectiveness, rebuilt on demand
+        state["_candidate_cache"] = {}
+        state["_price_cache"] = {}
+        state["profiler"] = TurnProfiler(self.profiler.enabled, self.profiler.window)  # timings are per session
+        state["_ai_pool"] = None
+        state["_ai_pool_workers"] = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "profiler" not in state:
+            self.profiler = TurnProfiler()
+        if "ai_workers" not in state:
+            self.ai_workers = None
+            self._ai_pool = None
+        if "_ai_pool_workers" not in state:
+            self._ai_pool_workers = 0
+        if "scale" not in state:
+            self.scale = dict(DEFAULT_SCALE)
+        if "_candidate_cache" not in state:
+            self._candidate_cache = {}
+        if "_price_cache" not in state:
+            self._price_cache = {}
+        if "turn_log" not in state:
+            self.turn_log = None
+        if "news_sink" not in state:
+            # Saves from before news sinks kept the feeds on the engine (plain strings before typed news)
+            self.news_sink = FeedSink()
+            self.news_sink.news.extend(map(news.as_news, state.get("news_feed", ())))
+            self.news_sink.competitor_news.extend(map(news.as_news, state.get("competitor_news_feed", ())))
+            self.__dict__.pop("news_feed", None)
+            self.__dict__.pop("competitor_news_feed", None)
+        if "exact_loans" not in state:
+            self.exact_loans = False
+        if "registry" not in state:
+            self.registry = CompanyRegistry()
+            for c in self.ai_companies:
+                self.registry.add(c)
+            if self.player is not None:
+                self.registry.refresh(self.player, self.ai_companies)
+            self.__dict__.pop("_ai_by_name", None)
+            self.__dict__.pop("_market_cap_order", None)
+        if "_rank_cache" not in state:
+            self._rank_cache = {}
+        if "_market_products" not in state:
+            # Saves from before the per-market product index
+            self._rebuild_market_index()
+        # The save may come from a machine with NumPy installed
+        self.vectorized_revenue = self.vectorized_revenue and revenue_engine.HAS_NUMPY
 
     # ==================================
     #        SETUP / INITIALIZATION
@@ -140,50 +493,51 @@ class BusinessGameEngine:
         # Actually let's replicate your logic exactly if possible. 
         tiers=[("Startup",5,1),("Medium",7,2),("Large",5,4),("Big Tech",3,5)]
         for tier_name, count, mcount in tiers:
-            for _ in range(count):
-                cname= random_company_name(prefixes,suffixes,self.used_company_names)
+            for _ in range(count * self.scale["initial_ai_multiplier"]):
+                cname= random_company_name(prefixes,suffixes,self.used_company_names,self.rng)
                 c= Company(cname, tier_name)
                 # campus - large campus park
                 # Example: Startup starts with "Garage", Medium with "Small Office", etc.
                 if tier_name == "Startup":
-                    c.campuses.append(("Garage", 0, 0.0, 10))
+                    c.add_campus(("Garage", 0, 0.0, 10))
                 elif tier_name == "Medium":
-                    c.campuses.append(("Small Office", 250_000, 0.02, 50))
+                    c.add_campus(("Small Office", 250_000, 0.02, 50))
                 elif tier_name == "Large":
-                    c.campuses.append(("Large Office", 2_500_000, 0.04, 125))
+                    c.add_campus(("Large Office", 2_500_000, 0.04, 125))
                 elif tier_name == "Big Tech":
-                    c.campuses.append(("Large Building", 5_000_000, 0.08, 250))
+                    c.add_campus(("Large Building", 5_000_000, 0.08, 250))
 
                 # set employees/cash
                 if tier_name=="Startup":
-                    c.employees=random.randint(10,20)
-                    c.cash=random.uniform(500_000,2_000_000)
+                    c.employees=self.rng.randint(10,20)
+                    c.cash=self.rng.uniform(500_000,2_000_000)
                 elif tier_name=="Medium":
-                    c.employees=random.randint(35, 70)
-                    c.cash=random.uniform(3_000_000,6_000_000)
+                    c.employees=self.rng.randint(35, 70)
+                    c.cash=self.rng.uniform(3_000_000,6_000_000)
                 elif tier_name=="Large":
-                    c.employees=random.randint(80, 140)
-                    c.cash=random.uniform(12_000_000,18_000_000)
+                    c.employees=self.rng.randint(80, 140)
+                    c.cash=self.rng.uniform(12_000_000,18_000_000)
                 else:
-                    c.employees=random.randint(180,300)
-                    c.cash=random.uniform(25_000_000,40_000_000)
+                    c.employees=self.rng.randint(180,300)
+                    c.cash=self.rng.uniform(25_000_000,40_000_000)
                 # pick markets
-                chosen_mkts= random.sample(self.markets,mcount)
+                chosen_mkts= self.rng.sample(self.markets,mcount)
                 from models import Product
                 from utils import random_product_name
                 for mk in chosen_mkts:
                     p=Product(c.name,mk.name)
                     # random assignment
-                    p.assigned_employees["r&d"] = random.randint(1, 3)
-                    p.assigned_employees["q&a"] = random.randint(1, 3)
-                    p.assigned_employees["marketing"] = random.randint(1, 3)
+                    p.assigned_employees["r&d"] = self.rng.randint(1, 3)
+                    p.assigned_employees["q&a"] = self.rng.randint(1, 3)
+                    p.assigned_employees["marketing"] = self.rng.randint(1, 3)
                     # random revenue
                     p.revenue=0.0
                     # store
-                    prod_key= random_product_name(self.used_product_names)
-                    c.products[prod_key]= p
+                    prod_key= random_product_name(self.used_product_names, self.rng)
+                    c.add_product(prod_key, p)
+                    self._register_product(p)
 
-                self.ai_companies.append(c)
+                self._add_ai_company(c)
 
         # do your ratio-based initial share distribution
         self._assign_initial_market_shares()
@@ -194,7 +548,7 @@ class BusinessGameEngine:
         self.player.cash=1_000_000
         self.player.employees=5
         # campus => Garage
-        self.player.campuses.append(("Garage",0,0.0,10))
+        self.player.add_campus(("Garage",0,0.0,10))
 
     def _choose_initial_product(self):
         # NO LONGER NEEDED - GUI handles this.
@@ -216,14 +570,16 @@ class BusinessGameEngine:
         # Same logic as old code but with a check for player setup
         TIER_RATIO = {"Startup": 1, "Medium": 2, "Large": 4, "Big Tech": 8}
 
-        for mk in self.markets:
-            comps_in_mkt = {}
+        # market name -> {company: [its products in that market]}, in company order
+        by_market = {mk.name: {} for mk in self.markets}
+        for c in self.ai_companies:
+            for p in c.products.values():
+                if p.market_name in by_market:
+                    by_market[p.market_name].setdefault(c, []).append(p)
 
+        for mk in self.markets:
             # 1. AI Companies
-            for c in self.ai_companies:
-                prods = [p for p in c.products.values() if p.market_name == mk.name]
-                if prods:
-                    comps_in_mkt[c] = prods
+            comps_in_mkt = by_market[mk.name]
 
             # Skip if no participants in the market
             if not comps_in_mkt:
@@ -246,27 +602,27 @@ class BusinessGameEngine:
 
 
     def _count_products_in_market(self,mname) -> int:
-        # all AI + player
-        c=0
-        for ai in self.ai_companies:
-            for p in ai.products.values():
-                if p.market_name==mname:
-                    c+=1
-        for p in self.player.products.values():
-            if p.market_name==mname:
-                c+=1
+        # all AI + player (the imaginary product is not a competitor)
+        c= len(self._market_products.get(mname, ()))
+        for m in self.markets:
+            if m.name==mname and m.imaginary_product is not None:
+                c-=1
         return c
 
     # ===========================
     #      TURN STEPS
     # ===========================
     def _distribute_revenue_all_markets(self):
+        if self.vectorized_revenue:
+            revenue_engine.distribute_revenue_vectorized(self)
+            return
+
         is_initial_turn = (self.turn_index == 0)
         
         for mk in self.markets:
             # Apply recession effects if applicable.
             mk.apply_recession()
-            participants = self._find_products_in_market(mk.name)
+            participants = self._market_products.get(mk.name)
             if not participants:
                 mk.last_quarter_total_revenue = 0
                 continue
@@ -326,6 +682,7 @@ class BusinessGameEngine:
                         p.recent_growth.pop(0)
 
             mk.last_quarter_total_revenue = sum(p.revenue for p in participants)
+            self._invalidate_rankings(mk.name)  # effectiveness changed
 
             # **** NEW: Update the market size each turn if not in recession ****
             if not mk.is_in_global_recession:
@@ -344,35 +701,36 @@ class BusinessGameEngine:
     def _resolve_pending_acquisitions(self):
         # same logic as your code
         to_remove=[]
+        resolved_upto = 0  # to_remove entries (failures included) dropped by the last success
         for (buyer, target_name, price, turn_submitted) in self.pending_acquisitions:
             if self.turn_index>= turn_submitted+1:
                 # time to resolve
-                t=None
-                for ai in self.ai_companies:
-                    if ai.name==target_name:
-                        t= ai
-                        break
+                t= self.registry.get(target_name)
                 if not t:
-                    self._push_competitor_news(f"Acquisition of {target_name} failed; no longer exists.")
+                    self._push_competitor_news(NewsItem(news.ACQUISITIONS, "Acquisition of {} failed; no longer exists.", target_name))
                     to_remove.append((buyer,target_name,price,turn_submitted))
                     continue
                 if buyer.cash< price:
-                    self._push_competitor_news(f"Acquisition of {target_name} failed; insufficient funds.")
+                    self._push_competitor_news(NewsItem(news.ACQUISITIONS, "Acquisition of {} failed; insufficient funds.", target_name))
                     to_remove.append((buyer,target_name,price,turn_submitted))
                     continue
                 # top2 growth check
                 if self._is_target_in_top_2_growth(t):
-                    self._push_competitor_news(f"Acquisition of {target_name} failed; top-2 growth.")
+                    self._push_competitor_news(NewsItem(news.ACQUISITIONS, "Acquisition of {} failed; top-2 growth.", target_name))
                     to_remove.append((buyer,target_name,price,turn_submitted))
                     continue
                 # success
                 buyer.cash-= price
                 self._merge_companies(buyer, t)
-                self._push_news(f"{buyer.name} acquired {target_name} for {format_money(price)}!")
-                self.ai_companies.remove(t)
+                self._push_news(NewsItem(news.ACQUISITIONS, "{} acquired {} for {:money}!", buyer.name, target_name, price))
+                self._remove_ai_company(t)
                 to_remove.append((buyer,target_name,price,turn_submitted))
+                resolved_upto = len(to_remove)
 
-                self.pending_acquisitions = [acq for acq in self.pending_acquisitions if acq not in to_remove]
+        # Filter once at the end (a failure after the last success stays pending)
+        if resolved_upto:
+            removed = set(to_remove[:resolved_upto])
+            self.pending_acquisitions = [acq for acq in self.pending_acquisitions if acq not in removed]
 
 
     def _is_target_in_top_2_growth(self, comp):
@@ -398,13 +756,19 @@ class BusinessGameEngine:
         buyer.loans.extend(target.loans)
         buyer.bonds.extend(target.bonds)
 
+        # A buyer that has itself left the game (e.g. went bankrupt while its bid was
+        # pending) takes the target's products out of the markets with it.
+        if buyer is not self.player and not self.registry.is_live(buyer):
+            for prod in target.products.values():
+                self._unregister_product(prod)
+
         # Transfer and rename products if necessary
         for prod_name, prod in target.products.items():
             prod.owner_name = buyer.name
             if prod_name in buyer.products:
-                buyer.products[f"{prod_name}_acq"] = prod
+                buyer.add_product(f"{prod_name}_acq", prod)
             else:
-                buyer.products[prod_name] = prod
+                buyer.add_product(prod_name, prod)
 
         # Clean up target after acquisition
         target.cash = 0
@@ -414,6 +778,10 @@ class BusinessGameEngine:
         target.loans.clear()
         target.bonds.clear()
 
+        # Both companies' campuses changed, and the target lost its products.
+        buyer.invalidate_aggregates()
+        target.invalidate_aggregates()
+
 
     def _update_finances(self):
         """
@@ -421,6 +789,8 @@ class BusinessGameEngine:
         """
         from finances import update_finances
         update_finances([self.player]+ self.ai_companies)
+        self.registry.refresh(self.player, self.ai_companies)
+        self._price_cache.clear()  # revenues, market caps and loan principals have moved
 
     def _log_turn_data(self):
         # done in process_turn via data_store.record_state
@@ -435,22 +805,20 @@ class BusinessGameEngine:
         # player losing
         if self.player.is_bankrupt():
             # print("\nYou lost! Your investors shut you down because your cash was negative 4 consecutive quarters.") # now handled by gui
-            self._push_news("\nYou lost! Your investors shut you down because your cash was negative 4 consecutive quarters.")
+            self._push_news(NewsItem(news.GAME, "\nYou lost! Your investors shut you down because your cash was negative 4 consecutive quarters."))
             self._end_game()
             return
         # if no ai or if player MC>70
-        total= self.player.market_cap
-        for c in self.ai_companies:
-            total+= c.market_cap
+        total= self.registry.total_market_cap
         if len(self.ai_companies)==0:
             # print("You acquired all of your competitors. Technopoly!") # now handled by gui
-            self._push_news("You acquired all of your competitors. Technopoly!")
+            self._push_news(NewsItem(news.GAME, "You acquired all of your competitors. Technopoly!"))
             self._end_game()
             return
         share= self.player.market_cap/ total if total>0 else 0
         if share>=0.7:
             # print("You got 70 percent of the market's total market capitalization. Technopoly!") # now handled by gui
-            self._push_news("You got 70 percent of the market's total market capitalization. Technopoly!")
+            self._push_news(NewsItem(news.GAME, "You got 70 percent of the market's total market capitalization. Technopoly!"))
             self._end_game()
 
     def _end_game(self):
@@ -462,45 +830,63 @@ class BusinessGameEngine:
             #t= snap["turn"]
             #print(f" Turn={t}, #Companies={len(snap['companies'])}")
 
+    @property
+    def news_enabled(self):
+        """False when the news sink discards news, so there is no point building it."""
+        return self.news_sink.enabled
+
     def _push_news(self, msg):
         """
-        Add to news feed.
+        Add a NewsItem (or a plain string) to the news feed.
         """
-        self.news_feed.append(msg)
-        # Limit size to prevent memory issues
-        if len(self.news_feed) > 100:  # Keep only the most recent 100 messages
-            self.news_feed = self.news_feed[-100:]
+        self.news_sink.push(msg)
 
     def _find_products_in_market(self, mname):
-        results = []
+        """
+        Returns a new list of every product competing in the market (including the
+        market's imaginary product, if any). Callers are free to sort the result.
+        """
+        return list(self._market_products.get(mname, ()))
 
-        if self.player is not None:
-            for p in self.player.products.values():
-                if p.market_name == mname:
-                    results.append(p)
+    def _register_product(self, product):
+        """
+        Adds a newly created product to the per-market index.
+        Must be called whenever a product enters the game.
+        """
+        self._market_products.setdefault(product.market_name, []).append(product)
+        self._invalidate_rankings(product.market_name)
 
-        for c in self.ai_companies:
-            for p in c.products.values():
-                if p.market_name == mname:
-                    results.append(p)
+    def _unregister_product(self, product):
+        """
+        Removes a product from the per-market index.
+        """
+        products = self._market_products.get(product.market_name)
+        if products and product in products:
+            products.remove(product)
+            self._invalidate_rankings(product.market_name)
 
-        # Include the imaginary product if the market has one
+    def _rebuild_market_index(self):
+        """
+        Rebuilds the per-market product index from scratch (player, AI and imaginary products).
+        """
+        self._market_products = {m.name: [] for m in self.markets}
+        self._invalidate_rankings()
+        companies = ([self.player] if self.player is not None else []) + self.ai_companies
+        for c in companies:
+            for p in c.products.values():
+                self._register_product(p)
         for m in self.markets:
-            if m.name == mname and hasattr(m, "imaginary_product"):
-                results.append(m.imaginary_product)
-
-        return results
+            if m.imaginary_product is not None:
+                self._register_product(m.imaginary_product)
 
     
     
     def _push_competitor_news(self, msg):
         """
         Add to competitor news, which is displayed separately.
+        None (e.g. a player move, or news not built) is ignored.
         """
-        self.competitor_news_feed.append(msg)
-        # Limit size to prevent memory issues
-        if len(self.competitor_news_feed) > 100:  # Keep only the most recent 100 messages
-            self.competitor_news_feed = self.competitor_news_feed[-100:]
+        self.news_sink.push_competitor(msg)
 
 
     def _company_has_product_in_market(self, comp, mname):
@@ -509,6 +895,71 @@ class BusinessGameEngine:
                 return True
         return False
 
+    def player_act(self, kind, *args):
+        """
+        Applies a move of the player between quarters, with the same actions and
+        arguments as AIController.act (pass None as the news to keep a move out of
+        the competitor news). Recorded in the turn log, so GUI moves replay too.
+        """
+        if self.turn_log is not None:
+            self.turn_log.player_action(kind, args)
+        self.ai_controller.act(self.player, kind, *args)
+
+    def project_cash(self, comp=None, quarters=projection.DEFAULT_QUARTERS):
+        """
+        Forward cash-flow projection of a company (the player by default).
+        """
+        return projection.project(comp or self.player, quarters)
+
+    def project_all_cash(self, quarters=projection.DEFAULT_QUARTERS):
+        """
+        Projections of the player and every AI company, computed in one batch.
+        """
+        return projection.project_all([self.player] + self.ai_companies, quarters)
+
+    def _markets_without_product(self, comp):
+        """
+        Markets (in game order) where the company has no product yet.
+        """
+        owned = {p.market_name for p in comp.products.values()}
+        return [m for m in self.markets if m.name not in owned]
+
+    # ===========================
+    #       AI COMPANY LIST
+    # ===========================
+    def find_ai_company(self, name):
+        """
+        The AI company with this name, or None if it is no longer in the game.
+        """
+        return self.registry.get(name)
+
+    def _add_ai_company(self, comp):
+        self.ai_companies.append(comp)
+        self.registry.add(comp)
+
+    def _remove_ai_company(self, comp):
+        if self.registry.remove(comp):
+            self.ai_companies.remove(comp)
+
+    def _largest_company_excluding(self, comp):
+        """
+        The company (player or AI still in the game) with the highest market cap, other
+        than comp; ties go to the player, then to the earliest AI. The registry keeps the
+        market-cap heap, rebuilt in _update_finances (or here, before the first quarter).
+        """
+        if self.registry.stale:
+            self.registry.refresh(self.player, self.ai_companies)
+        return self.registry.largest_excluding(comp) or self.player
+
+    @staticmethod
+    def _pool_name(names, i):
+        """
+        i-th name of a market name pool; past its end the pool repeats with a number ("FinTech 2").
+        """
+        if i < len(names):
+            return names[i]
+        return f"{names[i % len(names)]} {i // len(names) + 1}"
+
     def player_menu(self):
         # NO LONGER NEEDED - GUI handles player interaction.
         pass
@@ -520,7 +971,34 @@ class BusinessGameEngine:
         """
         Minimum = (annualizedRevenue + max(netAssets, 0)) * 1.3
         Compare that to target's market_cap. Use whichever is higher.
+
+        The price is memoized for the quarter. Between two update_finances runs it only
+        moves with the target's cash, market cap and set of bonds and loans, which form
+        the cache key, so bidders and the GUI re-pricing a target reuse the same value.
+        A company without revenue history is priced on its live product revenue, which
+        then joins the key.
         """
+        live_revenue = None if target_company.past_quarter_revenues else target_company.total_revenue_this_quarter()
+        key = (target_company.cash, target_company.market_cap, len(target_company.bonds), len(target_company.loans),
+               live_revenue)
+        entry = self._price_cache.get(target_company)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        price = self._price_from_balance_sheet(target_company)
+        self._price_cache[target_company] = (key, price)
+        return price
+
+    def acquisition_prices(self):
+        """
+        [(AI company, acquisition price)] for every AI company in game order,
+        e.g. for the GUI candidate list. A convenience wrapper over
+        _calculate_acquisition_price: the price has no terms shared between
+        companies, so each one is priced (or read from the memo) on its own.
+        """
+        price = self._calculate_acquisition_price
+        return [(c, price(c)) for c in self.ai_companies]
+
+    def _price_from_balance_sheet(self, target_company):
         # annualized revenue from last 3 quarters
         if target_company.past_quarter_revenues:
             avg_rev = sum(target_company.past_quarter_revenues)/len(target_company.past_quarter_revenues)
@@ -543,30 +1021,33 @@ class BusinessGameEngine:
         """
         Spawns 3 new AI companies (unless we already hit the 100-company limit).
         Each company selects its product markets at random, but only from the FIRST 8 initialized product markets.
+        (Batch size, limit and market pool come from self.scale.)
         Each new product gets 3 employees automatically assigned (1 in marketing, R&D, and Q&A).
         """
-        import random
         from utils import random_company_name, random_product_name
         from models import Company, Product
 
+        max_spawned = self.scale["max_spawned_ai"]
+
         # If we've already spawned 100 AI, do nothing
-        if self.spawned_ai_count >= 100:
+        if self.spawned_ai_count >= max_spawned:
             return
 
         # Only allow new AI companies to select from the first 8 initialized markets
-        available_markets = self.markets[:8]
+        pool = self.scale["spawn_market_pool"]
+        available_markets = self.markets[:pool] if pool else list(self.markets)
 
         # Weighted tiers
         tiers = ["Startup", "Medium", "Large", "Big Tech"]
         weights = [0.50, 0.25, 0.15, 0.05]  # 50% Startup, 25% Medium, 15% Large, 5% Big Tech
 
-        companies_to_spawn = 3
+        companies_to_spawn = self.scale["ai_spawn_batch"]
         for _ in range(companies_to_spawn):
-            if self.spawned_ai_count >= 100:
+            if self.spawned_ai_count >= max_spawned:
                 break  # never exceed 100 new spawns
 
             # Pick a tier based on weighted probabilities
-            tier_choice = random.choices(tiers, weights, k=1)[0]
+            tier_choice = self.rng.choices(tiers, weights, k=1)[0]
             new_name = random_company_name(
                 prefixes=[
                     "Neuro", "Quantum", "Cyber", "Hyper", "Vertex", "Nexus", "Strato", "Omicron", "Zenith", "Titan",
@@ -578,7 +1059,8 @@ class BusinessGameEngine:
                     "Logic", "Cybernetics", "Synapse", "Robotics", "Intelligence", "Analytics", "Works", "Data", "Quantum", "Networks",
                     "Engage", "Synergy", "Enterprises", "Computation", "Core", "Stream", "Matrix", "Node", "Forge", "Frameworks"
                 ],
-                used_names=self.used_company_names
+                used_names=self.used_company_names,
+                rng=self.rng
             )
 
             # Create the new company object
@@ -586,29 +1068,29 @@ class BusinessGameEngine:
 
             # Choose campus, employees, cash, etc.
             if tier_choice == "Startup":
-                new_company.campuses.append(("Garage", 0, 0.0, 10))
-                new_company.employees = random.randint(5, 10)
-                new_company.cash = random.uniform(500_000, 2_000_000)
+                new_company.add_campus(("Garage", 0, 0.0, 10))
+                new_company.employees = self.rng.randint(5, 10)
+                new_company.cash = self.rng.uniform(500_000, 2_000_000)
                 product_count = 1
             elif tier_choice == "Medium":
-                new_company.campuses.append(("Small Office", 400_000, 0.02, 50))
-                new_company.employees = random.randint(15, 35)
-                new_company.cash = random.uniform(3_000_000, 5_000_000)
+                new_company.add_campus(("Small Office", 400_000, 0.02, 50))
+                new_company.employees = self.rng.randint(15, 35)
+                new_company.cash = self.rng.uniform(3_000_000, 5_000_000)
                 product_count = 2
             elif tier_choice == "Large":
-                new_company.campuses.append(("Large Office", 1_000_000, 0.04, 150))
-                new_company.employees = random.randint(40, 70)
-                new_company.cash = random.uniform(7_000_000, 15_000_000)
+                new_company.add_campus(("Large Office", 1_000_000, 0.04, 150))
+                new_company.employees = self.rng.randint(40, 70)
+                new_company.cash = self.rng.uniform(7_000_000, 15_000_000)
                 product_count = 3
             else:
                 # Big Tech
-                new_company.campuses.append(("Large Building", 1_600_000, 0.08, 275))
-                new_company.employees = random.randint(80, 140)
-                new_company.cash = random.uniform(18_000_000, 28_000_000)
+                new_company.add_campus(("Large Building", 1_600_000, 0.08, 275))
+                new_company.employees = self.rng.randint(80, 140)
+                new_company.cash = self.rng.uniform(18_000_000, 28_000_000)
                 product_count = 4
 
             # Create products for the new AI company (only from the first 8 initialized markets)
-            chosen_markets = random.sample(available_markets, min(product_count, len(available_markets)))
+            chosen_markets = self.rng.sample(available_markets, min(product_count, len(available_markets)))
 
             for market in chosen_markets:
                 p = Product(new_company.name, market.name)
@@ -627,11 +1109,12 @@ class BusinessGameEngine:
                 # Deduct $1k from whichever competitor in that market has the highest revenue
                 biggest_product = None
                 biggest_revenue = 0.0
-                for competitor in (self.ai_companies + [self.player]):
-                    for prod_name, prod_obj in competitor.products.items():
-                        if prod_obj.market_name == market.name and prod_obj.revenue > biggest_revenue:
-                            biggest_revenue = prod_obj.revenue
-                            biggest_product = prod_obj
+                for prod_obj in self._market_products.get(market.name, ()):
+                    if prod_obj is market.imaginary_product:
+                        continue  # not a competitor
+                    if prod_obj.revenue > biggest_revenue:
+                        biggest_revenue = prod_obj.revenue
+                        biggest_product = prod_obj
 
                 if biggest_product and biggest_product.revenue >= 1000.0:
                     biggest_product.revenue -= 1000.0
@@ -640,15 +1123,16 @@ class BusinessGameEngine:
                     biggest_product.revenue -= amount_to_deduct
 
                 # Store product in the new company under a unique product name
-                product_name = random_product_name(self.used_product_names)
-                new_company.products[product_name] = p
+                product_name = random_product_name(self.used_product_names, self.rng)
+                new_company.add_product(product_name, p)
+                self._register_product(p)
 
             # Add the new AI to our main list
-            self.ai_companies.append(new_company)
+            self._add_ai_company(new_company)
             self.spawned_ai_count += 1
 
             # Push a competitor news announcement
-            self._push_news(f"NEW COMPETITOR ALERT! {new_name} COMPANY SIZE: {tier_choice}")
+            self._push_news(NewsItem(news.COMPETITORS, "NEW COMPETITOR ALERT! {} COMPANY SIZE: {}", new_name, tier_choice))
 
 
 
@@ -666,26 +1150,19 @@ class BusinessGameEngine:
         A news message is pushed with a rating of that growth rate
         (like 'Bad', 'Good', or 'Very Good' - purely cosmetic).
         """
-        import random
         from models import Market, Product  # Ensure Product is imported
 
-        spawn_market_names = [
-            "Semiconductors", "Autonomous Vehicles", "Blockchain", "Telecommunications",
-            "VR Software", "Cloud Gaming", "Quantum Computing", "Smart Home",
-            "Streaming Platforms", "GreenTech", "Wearables", "Video Games"
-        ]
-
         # If we already spawned 12 new markets, stop.
-        if self.spawned_market_count >= 12:
+        if self.spawned_market_count >= self.scale["max_spawned_markets"]:
             return
 
         # Use the next name in the list, based on how many we've spawned so far
-        market_name = spawn_market_names[self.spawned_market_count]
+        market_name = self._pool_name(self.spawn_market_names, self.spawned_market_count)
 
-        initial_revenue = random.uniform(500_000, 5_000_000)
-        growth_rate = random.uniform(0.10, 0.15)
+        initial_revenue = self.rng.uniform(500_000, 5_000_000)
+        growth_rate = self.rng.uniform(0.10, 0.15)
 
-        new_market = Market(market_name)
+        new_market = Market(market_name, self.rng)
         new_market.size = initial_revenue
         new_market.base_growth_rate = growth_rate
         new_market.growth_rate = growth_rate
@@ -698,6 +1175,7 @@ class BusinessGameEngine:
         new_market.imaginary_product = imaginary_product  # Attach to market
 
         self.markets.append(new_market)
+        self._market_products[market_name] = [imaginary_product]
         self.spawned_market_count += 1
 
         # (Optional) Map the exact growth % to a descriptive label
@@ -708,14 +1186,15 @@ class BusinessGameEngine:
         else:
             rating = "Very Good"
 
-        self._push_news(f"NEW PRODUCT MARKET! {market_name} SIZE: ~${initial_revenue:,.0f} GROWTH: {rating}")
+        self._push_news(NewsItem(news.MARKETS, "NEW PRODUCT MARKET! {} SIZE: ~${:,.0f} GROWTH: {}", market_name, initial_revenue, rating))
 
 
 
 
 def main():
-    game = BusinessGameEngine()
-    gui = TechnopolyGUI(game) 
+    from gui import TechnopolyGUI # import our gui (only needed when playing interactively)
+    with BusinessGameEngine() as game:  # stops any AI worker processes once the window is closed
+        gui = TechnopolyGUI(game)
 
 if __name__=="__main__":
     main()
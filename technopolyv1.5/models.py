@@ -1,48 +1,156 @@
 # models.py
 
 import random
+from collections.abc import MutableMapping
 from utils import clamp
 from loan import Loan
 
+# Company aggregates remember the company's version they were computed at (bumped
+# by every write to one of its products' revenue or employee assignments, and by
+# add_product) and are recomputed only when it, the headcount or the debt changed.
+# Campus changes and merges drop the cache with invalidate_aggregates.
+_aggregate_cache_counts = [0, 0]  # hits, misses
+
+
+def aggregate_cache_counts():
+    """
+    (hits, misses) of the Company aggregate caches since start-up (this process only).
+    """
+    return _aggregate_cache_counts[0], _aggregate_cache_counts[1]
+
+
+# --- Department storage ---
+class DepartmentView(MutableMapping):
+    """
+    Dict-like view over three per-department slots of a Product, so code can keep
+    using product.assigned_employees["r&d"] while the values live in plain fields.
+    Keys are fixed: "r&d", "q&a" and "marketing".
+    """
+    __slots__ = ("_owner", "_fields")
+
+    def __init__(self, owner, fields):
+        self._owner = owner
+        self._fields = fields  # dept -> slot name
+
+    def __getitem__(self, dept):
+        return getattr(self._owner, self._fields[dept])
+
+    def __setitem__(self, dept, value):
+        self._owner._changed()
+        setattr(self._owner, self._fields[dept], value)
+
+    def __delitem__(self, dept):
+        raise TypeError("departments cannot be removed")
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return 3
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 # --- Product Class ---
 class Product:
     """
     Represents a single product in a single market.
     Now uses employees assigned to R&D/QA/Marketing, each costing $25k/quarter.
     We track 'effective_spend' for the exponential build-up formula.
+    Department values are stored in fixed fields; assigned_employees and
+    effective_spend expose them as dict-like views.
     """
+    __slots__ = (
+        "owner_name", "market_name",
+        "rd_employees", "qa_employees", "marketing_employees",
+        "rd_effective_spend", "qa_effective_spend", "marketing_effective_spend",
+        "effectiveness", "_revenue", "recent_growth", "history_id", "_company",
+    )
     DELAYS = {"r&d": 5.0, "q&a": 3.0, "marketing": 1.0}
     WEIGHTS = {"r&d": 0.5, "q&a": 0.3, "marketing": 0.2}
+    EMPLOYEE_FIELDS = {"r&d": "rd_employees", "q&a": "qa_employees", "marketing": "marketing_employees"}
+    SPEND_FIELDS = {"r&d": "rd_effective_spend", "q&a": "qa_effective_spend", "marketing": "marketing_effective_spend"}
 
     def __init__(self, owner_name, market_name):
         self.owner_name = owner_name
         self.market_name = market_name
-        self.assigned_employees = {"r&d": 0, "q&a": 0, "marketing": 0}
-        self.effective_spend = {"r&d": 0.0, "q&a": 0.0, "marketing": 0.0}
+        self._company = None  # the Company holding it (set by Company.add_product)
+        self.rd_employees = 0
+        self.qa_employees = 0
+        self.marketing_employees = 0
+        self.rd_effective_spend = 0.0
+        self.qa_effective_spend = 0.0
+        self.marketing_effective_spend = 0.0
         self.effectiveness = 0.0
         self.revenue = 0.0
         self.recent_growth = []  # last 4 quarters growth, for M&A checks
+        self.history_id = None  # set by DataStorage when first recorded; survives renames
+
+    def __setstate__(self, state):
+        # Products of older saves have no history_id or _company yet
+        self.history_id = None
+        self._company = None
+        for name, value in state[1].items():
+            setattr(self, name, value)
+
+    def _changed(self):
+        if self._company is not None:
+            self._company._version += 1
+
+    @property
+    def revenue(self):
+        return self._revenue
+
+    @revenue.setter
+    def revenue(self, value):
+        self._changed()
+        self._revenue = value
+
+    @property
+    def assigned_employees(self):
+        return DepartmentView(self, self.EMPLOYEE_FIELDS)
+
+    @assigned_employees.setter
+    def assigned_employees(self, values):
+        self._changed()
+        self.rd_employees = values["r&d"]
+        self.qa_employees = values["q&a"]
+        self.marketing_employees = values["marketing"]
+
+    @property
+    def effective_spend(self):
+        return DepartmentView(self, self.SPEND_FIELDS)
+
+    @effective_spend.setter
+    def effective_spend(self, values):
+        self.rd_effective_spend = values["r&d"]
+        self.qa_effective_spend = values["q&a"]
+        self.marketing_effective_spend = values["marketing"]
+
+    def total_assigned_employees(self) -> int:
+        return self.rd_employees + self.qa_employees + self.marketing_employees
 
     def employees_to_spend(self, cat: str) -> float:
-        return self.assigned_employees[cat] * 25_000
+        return getattr(self, self.EMPLOYEE_FIELDS[cat]) * 25_000
 
     def total_spend_this_quarter(self) -> float:
-        return sum(self.employees_to_spend(k) for k in self.assigned_employees)
+        return self.rd_employees * 25_000 + self.qa_employees * 25_000 + self.marketing_employees * 25_000
 
     def calculate_effective_spend(self, cat: str) -> float:
         delay = self.DELAYS[cat]
-        prev = self.effective_spend[cat]
-        actual = self.assigned_employees[cat] * 25_000
+        prev = getattr(self, self.SPEND_FIELDS[cat])
+        actual = getattr(self, self.EMPLOYEE_FIELDS[cat]) * 25_000
         return prev + (actual - prev) / delay
 
     def update_effective_spend_each_quarter(self):
-        for cat in self.effective_spend:
-            self.effective_spend[cat] = self.calculate_effective_spend(cat)
+        self.rd_effective_spend += (self.rd_employees * 25_000 - self.rd_effective_spend) / 5.0
+        self.qa_effective_spend += (self.qa_employees * 25_000 - self.qa_effective_spend) / 3.0
+        self.marketing_effective_spend += (self.marketing_employees * 25_000 - self.marketing_effective_spend) / 1.0
 
     def update_effectiveness(self):
-        W = {"r&d": 0.5, "q&a": 0.3, "marketing": 0.2}
         denom = max(self.revenue, 1.0)
-        total_eff_spend = sum(W[t] * self.effective_spend[t] for t in ["r&d", "q&a", "marketing"])
+        total_eff_spend = 0.5 * self.rd_effective_spend + 0.3 * self.qa_effective_spend + 0.2 * self.marketing_effective_spend
         self.effectiveness = total_eff_spend / denom
 
 # --- Bond Class ---
@@ -50,6 +158,8 @@ class Bond:
     """
     Represents a bond purchased by a company or player.
     """
+    __slots__ = ("principal", "annual_rate", "term_remaining", "original_term")
+
     def __init__(self, principal, annual_rate, term_quarters):
         self.principal = principal
         self.annual_rate = annual_rate
@@ -64,6 +174,13 @@ class Company:
     """
     Represents either the player or an AI competitor.
     """
+    __slots__ = (
+        "name", "tier", "cash", "debt", "debt_monthly_payment", "debt_interest_rate",
+        "debt_remaining_months", "loans", "bonds", "employees", "market_cap", "products",
+        "past_quarter_profits", "campuses", "_negative_cash_quarters",
+        "past_quarter_revenues", "last_acquisition_quarter", "_version", "_aggregates",
+    )
+
     def __init__(self, name, tier=None):
         self.name = name
         self.tier = tier
@@ -82,24 +199,87 @@ class Company:
         self._negative_cash_quarters = 0
         self.past_quarter_revenues = [0.0, 0.0, 0.0]  # store up to 3 prior quarter revenues
         self.last_acquisition_quarter = -100
+        self._version = 0  # bumped when its products' revenue or staffing change
+        self._aggregates = None  # aggregate name -> (key it was computed at, value); created on first use
+
+    def __getstate__(self):
+        # Aggregates are recomputed on demand; never save them.
+        return None, {name: getattr(self, name) for name in self.__slots__ if name != "_aggregates"}
+
+    def __setstate__(self, state):
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self._aggregates = None
+        if "_version" not in state[1]:
+            # Saves from before per-company versions: products did not know their company
+            self._version = 0
+            for p in self.products.values():
+                p._company = self
+
+    def add_product(self, name, product):
+        """Stores product under name; its revenue and staffing writes now reach this company's cache."""
+        product._company = self
+        self.products[name] = product
+        self._version += 1
 
+    def add_campus(self, campus):
+        """Adds a (name, cost, overhead, capacity) campus."""
+        self.campuses.append(campus)
+        self.invalidate_aggregates()
+
+    def _cached(self, name, key):
+        """
+        The cached aggregate if it was computed at `key`, else None.
+        """
+        entry = self._aggregates.get(name) if self._aggregates is not None else None
+        if entry is not None and entry[0] == key:
+            _aggregate_cache_counts[0] += 1
+            return entry[1]
+        _aggregate_cache_counts[1] += 1
+        return None
+
+    def _store(self, name, key, value):
+        if self._aggregates is None:
+            self._aggregates = {}
+        self._aggregates[name] = (key, value)
+
+    def invalidate_aggregates(self):
+        """Drops every cached aggregate (after campuses changed, or products were removed or moved)."""
+        self._aggregates = None
 
     def employee_capacity(self) -> int:
-        return sum(c[3] for c in self.campuses)
+        key = None  # campus changes invalidate the cache
+        value = self._cached("capacity", key)
+        if value is None:
+            value = sum(c[3] for c in self.campuses)
+            self._store("capacity", key, value)
+        return value
 
     def overhead_percent(self) -> float:
-        if not self.campuses:
-            return 0.0
-        return max(c[2] for c in self.campuses)
+        key = None
+        value = self._cached("overhead", key)
+        if value is None:
+            value = max((c[2] for c in self.campuses), default=0.0)
+            self._store("overhead", key, value)
+        return value
 
     def total_revenue_this_quarter(self) -> float:
-        return sum(p.revenue for p in self.products.values())
+        key = self._version
+        value = self._cached("revenue", key)
+        if value is None:
+            value = sum(p.revenue for p in self.products.values())
+            self._store("revenue", key, value)
+        return value
 
     def total_product_spend(self) -> float:
-        total = 0.0
-        for p in self.products.values():
-            total += p.total_spend_this_quarter()
-        return total
+        key = self._version
+        value = self._cached("product_spend", key)
+        if value is None:
+            value = 0.0
+            for p in self.products.values():
+                value += p.total_spend_this_quarter()
+            self._store("product_spend", key, value)
+        return value
 
     def total_spending_this_quarter(self) -> float:
         employee_base = self.employees * 25_000
@@ -108,7 +288,12 @@ class Company:
         return employee_base + overhead + debt_cost
 
     def quarterly_profit(self) -> float:
-        return self.total_revenue_this_quarter() - self.total_spending_this_quarter()
+        key = (self._version, self.employees, self.debt_monthly_payment)
+        value = self._cached("profit", key)
+        if value is None:
+            value = self.total_revenue_this_quarter() - self.total_spending_this_quarter()
+            self._store("profit", key, value)
+        return value
 
     def update_negative_cash_quarters(self):
         if self.cash < 0:
@@ -125,15 +310,22 @@ class Market:
     """
     Represents a market with size, growth rate, and other attributes.
     """
-    def __init__(self, name):
+    __slots__ = (
+        "name", "size", "base_growth_rate", "growth_rate", "quarters_elapsed",
+        "is_in_global_recession", "recession_quarters_left", "last_quarter_total_revenue",
+        "imaginary_product",
+    )
+
+    def __init__(self, name, rng=random):
         self.name = name
-        self.size = random.randint(25_000_000, 50_000_000)
-        self.base_growth_rate = random.uniform(0.05, 0.15)
+        self.size = rng.randint(25_000_000, 50_000_000)
+        self.base_growth_rate = rng.uniform(0.05, 0.15)
         self.growth_rate = self.base_growth_rate 
         self.quarters_elapsed = 0
         self.is_in_global_recession = False
         self.recession_quarters_left = 0
         self.last_quarter_total_revenue = 0.0
+        self.imaginary_product = None  # set for spawned markets, holds their initial revenue
 
     def apply_recession(self):
         if self.is_in_global_recession and self.recession_quarters_left > 0:
@@ -0,0 +1,133 @@
+"""
+news.py
+
+Typed news records.
+
+A NewsItem carries its category as a field and its message as a template
+plus arguments; the text is only formatted when something reads it (the
+GUI, a report), so the news of a quarter nobody displays costs no string
+formatting. Templates use str.format fields, with one addition: "{:money}"
+formats a number with utils.format_money.
+
+The engine hands its news to a sink. FeedSink keeps it in two
+collections.deque(maxlen=NEWS_FEED_SIZE) feeds: appending is O(1) and the
+oldest item drops out once a feed is full. NullSink discards everything and
+reports enabled = False, so producers that check it (the AI's hires, loans,
+bonds and per-product employee assignments) don't build the items at all;
+BusinessGameEngine(news=False) plays with one, for headless runs.
+"""
+
+import string
+from collections import deque
+
+from utils import format_money
+
+NEWS_FEED_SIZE = 100  # items kept per feed between two quarters
+
+# Competitor news categories, in the order the GUI lists them
+HIRING = "Hiring"
+FIRING = "Firing"
+ACQUISITIONS = "Acquisitions"
+LOANS = "Loans"
+BONDS = "Bonds"
+CAMPUS = "Campus Expansion"
+REASSIGNMENTS = "Employee Reassignments"
+OTHER = "Other"
+COMPETITOR_CATEGORIES = (HIRING, FIRING, ACQUISITIONS, LOANS, BONDS, CAMPUS, REASSIGNMENTS, OTHER)
+
+# General news categories
+EVENTS = "Events"
+MARKETS = "Markets"
+COMPETITORS = "Competitors"
+GAME = "Game"
+
+
+class _NewsFormatter(string.Formatter):
+    def format_field(self, value, format_spec):
+        if format_spec == "money":
+            return format_money(value)
+        return super().format_field(value, format_spec)
+
+
+_FORMATTER = _NewsFormatter()
+
+
+class NewsItem:
+    """
+    One news record: a category and a message template, formatted on demand.
+    """
+    __slots__ = ("category", "template", "args")
+
+    def __init__(self, category, template, *args):
+        self.category = category
+        self.template = template
+        self.args = args
+
+    @property
+    def text(self):
+        if not self.args:
+            return self.template
+        return _FORMATTER.format(self.template, *self.args)
+
+    def __str__(self):
+        return self.text
+
+    def __eq__(self, other):
+        if not isinstance(other, NewsItem):
+            return NotImplemented
+        return (self.category, self.template, self.args) == (other.category, other.template, other.args)
+
+    def __hash__(self):
+        return hash((self.category, self.template, self.args))
+
+    def __repr__(self):
+        return f"NewsItem({self.category!r}, {self.text!r})"
+
+
+def as_news(msg, category=OTHER):
+    """A NewsItem for msg, which may already be one or a plain string."""
+    if isinstance(msg, NewsItem):
+        return msg
+    return NewsItem(category, msg)
+
+
+class FeedSink:
+    """
+    Keeps the news of the quarter being played: general news and competitor moves.
+    """
+    enabled = True
+
+    def __init__(self, size=NEWS_FEED_SIZE):
+        self.news = deque(maxlen=size)
+        self.competitor_news = deque(maxlen=size)
+
+    def push(self, msg):
+        self.news.append(as_news(msg))
+
+    def push_competitor(self, msg):
+        if msg is None:
+            return  # e.g. player moves, which are not competitor news
+        self.competitor_news.append(as_news(msg))
+
+    def drain(self):
+        """Returns (news, competitor news) as lists and empties both feeds."""
+        items, competitor_items = list(self.news), list(self.competitor_news)
+        self.news.clear()
+        self.competitor_news.clear()
+        return items, competitor_items
+
+
+class NullSink:
+    """
+    Discards all news. Producers check `enabled` and skip building it.
+    """
+    enabled = False
+
+    def push(self, msg):
+        pass
+
+    def push_competitor(self, msg):
+        pass
+
+    def drain(self):
+        return [], []
@@ -0,0 +1,198 @@
+"""
+profiler.py
+
+Timing of the quarter pipeline.
+
+The engine owns one TurnProfiler (game.profiler). Each phase of
+advance_quarter() runs inside `with profiler.phase(name):`, and the AI
+controller adds one "ai/<tier>" phase per tier, so a slow quarter can be
+traced to AI logic, revenue distribution, finances or record_state. Counters
+(e.g. the Company aggregate cache's "aggregate_cache/hit" and ".../miss")
+are kept per turn next to the timings.
+
+Profiling is off by default; a disabled profiler hands out a shared no-op
+context, so the hooks cost one attribute lookup and a call per phase.
+
+    game.profiler.enabled = True
+    ...
+    print(game.profiler.report())
+"""
+
+import time
+from collections import deque
+from contextlib import nullcontext
+
+_NULL_PHASE = nullcontext()
+
+
+class _PhaseTimer:
+    """
+    Context manager adding the wall time of its block to one phase of the current turn.
+    """
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class TurnProfiler:
+    """
+    Per-turn phase timings plus rolling statistics over the last `window` turns.
+    """
+    def __init__(self, enabled=False, window=50):
+        self.enabled = enabled
+        self.window = window
+        self.turns = deque(maxlen=window)  # (turn index, {phase: seconds}) for finished turns
+        self.totals = {}  # phase -> seconds over the whole game
+        self.calls = {}  # phase -> number of timed blocks over the whole game
+        self.counter_turns = deque(maxlen=window)  # {counter: count} per finished turn, aligned with turns
+        self.counter_totals = {}  # counter -> count over the whole game
+        self._current = None
+        self._current_counts = {}
+        self._turn_index = None
+
+    def phase(self, name):
+        """
+        `with profiler.phase("revenue"): ...` times the block (no-op when disabled).
+        A phase may be entered several times per turn; its times add up.
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _PhaseTimer(self, name)
+
+    def add(self, name, seconds):
+        """
+        Adds `seconds` to a phase of the current turn.
+        """
+        if self._current is None:
+            self._current = {}
+        self._current[name] = self._current.get(name, 0.0) + seconds
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def count(self, name, n=1):
+        """
+        Adds n to a counter of the current turn.
+        """
+        self._current_counts[name] = self._current_counts.get(name, 0) + n
+        self.counter_totals[name] = self.counter_totals.get(name, 0) + n
+
+    def begin_turn(self, turn_index):
+        self._turn_index = turn_index
+        self._current = {}
+        self._current_counts = {}
+
+    def end_turn(self):
+        """
+        Closes the current turn and moves it into the rolling window.
+        """
+        if self._current is None:
+            return
+        self.turns.append((self._turn_index, self._current))
+        self.counter_turns.append(self._current_counts)
+        self._current = None
+        self._current_counts = {}
+
+    def reset(self):
+        self.turns.clear()
+        self.totals.clear()
+        self.calls.clear()
+        self.counter_turns.clear()
+        self.counter_totals.clear()
+        self._current = None
+        self._current_counts = {}
+
+    # ===========================
+    #          QUERIES
+    # ===========================
+    @property
+    def last_turn(self):
+        """(turn index, {phase: seconds}) of the latest finished turn, or None."""
+        return self.turns[-1] if self.turns else None
+
+    def phases(self):
+        """Every phase name seen in the rolling window, in first-seen order."""
+        names = {}
+        for _, times in self.turns:
+            for name in times:
+                names.setdefault(name, None)
+        return list(names)
+
+    def stats(self):
+        """
+        Returns {phase: {"last", "mean", "max", "p95"}} in seconds over the rolling window.
+        Turns in which a phase did not run count as 0 for it.
+        """
+        result = {}
+        last = self.turns[-1][1] if self.turns else {}
+        for name in self.phases():
+            samples = sorted(times.get(name, 0.0) for _, times in self.turns)
+            n = len(samples)
+            result[name] = {
+                "last": last.get(name, 0.0),
+                "mean": sum(samples) / n,
+                "max": samples[-1],
+                "p95": samples[min(n - 1, int(0.95 * n))],
+            }
+        return result
+
+    def counters(self):
+        """
+        Returns {counter: {"last", "window"}}: the count of the latest finished turn and
+        the sum over the rolling window.
+        """
+        result = {}
+        last = self.counter_turns[-1] if self.counter_turns else {}
+        for counts in self.counter_turns:
+            for name, n in counts.items():
+                entry = result.setdefault(name, {"last": 0, "window": 0})
+                entry["window"] += n
+        for name, entry in result.items():
+            entry["last"] = last.get(name, 0)
+        return result
+
+    def hit_rate(self, name):
+        """
+        Hits / (hits + misses) of the "<name>/hit" and "<name>/miss" counters over the
+        rolling window, or None if neither was counted.
+        """
+        counters = self.counters()
+        hits = counters.get(f"{name}/hit", {}).get("window", 0)
+        misses = counters.get(f"{name}/miss", {}).get("window", 0)
+        return hits / (hits + misses) if hits + misses else None
+
+    def report(self):
+        """
+        Plain text table of the rolling statistics (milliseconds), slowest mean first,
+        followed by the counters and the hit rate of each hit/miss pair.
+        """
+        stats = self.stats()
+        if not stats:
+            return "No turns profiled yet." if self.enabled else "Profiling is disabled."
+        first, last = self.turns[0][0], self.turns[-1][0]
+        lines = [f"turns {first}..{last} ({len(self.turns)} in window)",
+                 f"{'phase':<20} {'last':>9} {'mean':>9} {'p95':>9} {'max':>9}"]
+        for name, s in sorted(stats.items(), key=lambda item: item[1]["mean"], reverse=True):
+            lines.append(f"{name:<20} {s['last'] * 1e3:>9.2f} {s['mean'] * 1e3:>9.2f} "
+                         f"{s['p95'] * 1e3:>9.2f} {s['max'] * 1e3:>9.2f}")
+        counters = self.counters()
+        if counters:
+            lines.append("")
+            lines.append(f"{'counter':<24} {'last':>10} {'window':>12}")
+            for name in sorted(counters):
+                lines.append(f"{name:<24} {counters[name]['last']:>10} {counters[name]['window']:>12}")
+            for name in sorted(n[:-4] for n in counters if n.endswith("/hit")):
+                rate = self.hit_rate(name)
+                if rate is not None:
+                    lines.append(f"{name} hit rate: {rate * 100:.1f}%")
+        return "\n".join(lines)
@@ -0,0 +1,156 @@
+"""
+projection.py
+
+Forward cash-flow projection of a company, quarter by quarter, following the
+same order of cash movements as finances.update_finances:
+
+ - bonds: a quarter of interest while held, principal back in the quarter the
+   bond matures,
+ - profit: projected revenue minus headcount cost (employees x $25k, plus
+   overhead_percent of it) and the company's debt payment, headcount held
+   constant,
+ - loans: the payments of Loan.projected_payments (exact for loans with an
+   amortisation schedule).
+
+Revenue follows the trend of past_quarter_revenues: the per-quarter growth
+rate from the oldest to the newest recorded quarter (clamped to +/-25%),
+compounded from this quarter's revenue.
+
+project() handles one company with plain Python (a few dozen operations for a
+typical company). project_all() projects a list of companies at once; with
+NumPy installed the revenue, cost and cash paths of all of them are computed
+as (companies x quarters) arrays.
+"""
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+DEFAULT_QUARTERS = 8
+MAX_TREND = 0.25  # per-quarter revenue growth is clamped to [-MAX_TREND, MAX_TREND]
+
+
+class CashProjection:
+    """
+    Projected cash flows of one company for the next `quarters` quarters.
+    Each list has one entry per quarter; cash[q] is the cash at the end of quarter q + 1.
+    """
+    __slots__ = ("company_name", "start_cash", "revenue", "costs", "bond_income", "loan_payments", "cash")
+
+    def __init__(self, company_name, start_cash, revenue, costs, bond_income, loan_payments, cash):
+        self.company_name = company_name
+        self.start_cash = start_cash
+        self.revenue = revenue
+        self.costs = costs
+        self.bond_income = bond_income  # interest plus principal of bonds maturing
+        self.loan_payments = loan_payments
+        self.cash = cash
+
+    @property
+    def quarters(self):
+        return len(self.cash)
+
+    def net_flow(self, q):
+        """Net change of cash in quarter q (0-based)."""
+        return self.revenue[q] - self.costs[q] + self.bond_income[q] - self.loan_payments[q]
+
+    def min_cash(self):
+        return min(self.cash, default=self.start_cash)
+
+    def first_negative_quarter(self):
+        """0-based index of the first quarter ending with negative cash, or None."""
+        for q, cash in enumerate(self.cash):
+            if cash < 0:
+                return q
+        return None
+
+    def __repr__(self):
+        return (f"CashProjection({self.company_name!r}, {self.quarters} quarters, "
+                f"cash {self.start_cash:,.0f} -> {self.cash[-1] if self.cash else self.start_cash:,.0f})")
+
+
+def revenue_trend(company):
+    """
+    Per-quarter revenue growth rate implied by past_quarter_revenues.
+    """
+    history = [r for r in company.past_quarter_revenues if r > 0]
+    if len(history) < 2:
+        return 0.0
+    growth = (history[-1] / history[0]) ** (1.0 / (len(history) - 1)) - 1.0
+    return max(-MAX_TREND, min(MAX_TREND, growth))
+
+
+def _bond_flows(company, quarters):
+    flows = [0.0] * quarters
+    for b in company.bonds:
+        interest = b.quarterly_interest()
+        last = min(max(b.term_remaining, 1), quarters)  # a bond pays through the quarter it matures
+        for q in range(last):
+            flows[q] += interest
+        if b.term_remaining <= quarters:
+            flows[last - 1] += b.principal
+    return flows
+
+
+def _loan_flows(company, quarters):
+    flows = [0.0] * quarters
+    for loan in company.loans:
+        for q, payment in enumerate(loan.projected_payments(quarters)):
+            flows[q] += payment
+    return flows
+
+
+def project(company, quarters=DEFAULT_QUARTERS):
+    """
+    CashProjection of one company for the next `quarters` quarters.
+    """
+    base = company.total_revenue_this_quarter()
+    growth = 1.0 + revenue_trend(company)
+    cost = company.total_spending_this_quarter()
+    bond_income = _bond_flows(company, quarters)
+    loan_payments = _loan_flows(company, quarters)
+
+    revenue, costs, cash = [], [], []
+    balance = company.cash
+    for q in range(quarters):
+        rev = base * growth ** (q + 1)
+        balance += bond_income[q] + rev - cost - loan_payments[q]
+        revenue.append(rev)
+        costs.append(cost)
+        cash.append(balance)
+    return CashProjection(company.name, company.cash, revenue, costs, bond_income, loan_payments, cash)
+
+
+def project_all(companies, quarters=DEFAULT_QUARTERS):
+    """
+    CashProjection of every company, in order. Uses NumPy arrays when available.
+    """
+    if not HAS_NUMPY or not companies:
+        return [project(c, quarters) for c in companies]
+
+    n = len(companies)
+    base = np.fromiter((c.total_revenue_this_quarter() for c in companies), dtype=np.float64, count=n)
+    growth = 1.0 + np.fromiter((revenue_trend(c) for c in companies), dtype=np.float64, count=n)
+    cost = np.fromiter((c.total_spending_this_quarter() for c in companies), dtype=np.float64, count=n)
+    start = np.fromiter((c.cash for c in companies), dtype=np.float64, count=n)
+
+    bond_income = np.zeros((n, quarters))
+    loan_payments = np.zeros((n, quarters))
+    for i, c in enumerate(companies):
+        if c.bonds:
+            bond_income[i] = _bond_flows(c, quarters)
+        if c.loans:
+            loan_payments[i] = _loan_flows(c, quarters)
+
+    steps = np.arange(1, quarters + 1)
+    revenue = base[:, None] * growth[:, None] ** steps
+    costs = np.repeat(cost[:, None], quarters, axis=1)
+    cash = start[:, None] + np.cumsum(bond_income + revenue - costs - loan_payments, axis=1)
+
+    return [CashProjection(c.name, c.cash, rev, cst, bonds, loans, cc)
+            for c, rev, cst, bonds, loans, cc in zip(companies, revenue.tolist(), costs.tolist(),
+                                                      bond_income.tolist(), loan_payments.tolist(),
+                                                      cash.tolist())]
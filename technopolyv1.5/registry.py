@@ -0,0 +1,98 @@
+"""
+registry.py
+
+Engine-maintained index of the companies in play.
+
+The engine keeps ai_companies as the ordered list the turn loop walks; the
+CompanyRegistry sits next to it and answers the lookups that used to scan
+that list:
+ - name -> AI company (acquisition targets, bids, merges) in O(1),
+ - the largest company other than a given one (who absorbs a bankrupt
+   company's products) from a market-cap heap, O(log n) amortised,
+ - the total market cap of every company in play (victory check, GUI
+   dominance) without re-summing.
+
+Market caps only change in update_finances, so the heap and the total are
+rebuilt once per quarter by refresh(). Companies that leave the game stay in
+the heap until they surface at the top (lazy deletion); companies that join
+after a refresh are pushed with their current market cap.
+"""
+
+import heapq
+
+
+class CompanyRegistry:
+    """
+    Name index and market-cap order of the player and the AI companies.
+    """
+    def __init__(self):
+        self.by_name = {}  # name -> AI company still in the game
+        self.player = None
+        self.total_market_cap = 0.0  # player + AI, as of the last refresh (minus companies removed since)
+        self._heap = None  # (-market_cap, seq, company); None until the first refresh
+        self._seq = 0
+
+    def get(self, name):
+        """The AI company with this name, or None."""
+        return self.by_name.get(name)
+
+    def is_live(self, comp):
+        """True for the player and for AI companies still in the game."""
+        return comp is self.player or self.by_name.get(comp.name) is comp
+
+    def add(self, comp):
+        self.by_name[comp.name] = comp
+        if self._heap is not None:
+            self._push(comp)
+            self.total_market_cap += comp.market_cap
+
+    def remove(self, comp):
+        """Drops an AI company. Returns False if it was not registered."""
+        if self.by_name.get(comp.name) is not comp:
+            return False
+        del self.by_name[comp.name]
+        if self._heap is not None:
+            self.total_market_cap -= comp.market_cap  # its heap entry is discarded when it reaches the top
+        return True
+
+    def refresh(self, player, ai_companies):
+        """
+        Rebuilds the market-cap heap and the total. Call after update_finances.
+        Ties keep list order: the player first, then the AI companies in game order.
+        """
+        self.player = player
+        companies = [player] + ai_companies
+        self._heap = [(-c.market_cap, seq, c) for seq, c in enumerate(companies)]
+        heapq.heapify(self._heap)
+        self._seq = len(companies)
+        self.total_market_cap = sum(c.market_cap for c in companies if c.market_cap > 0)
+
+    @property
+    def stale(self):
+        """True until the first refresh()."""
+        return self._heap is None
+
+    def largest_excluding(self, comp):
+        """
+        The live company with the highest market cap other than comp (None if there is none).
+        """
+        heap = self._heap
+        self._drop_dead()
+        if not heap:
+            return None
+        if heap[0][2] is not comp:
+            return heap[0][2]
+        top = heapq.heappop(heap)
+        self._drop_dead()
+        runner_up = heap[0][2] if heap else None
+        heapq.heappush(heap, top)
+        return runner_up
+
+    def _push(self, comp):
+        heapq.heappush(self._heap, (-comp.market_cap, self._seq, comp))
+        self._seq += 1
+
+    def _drop_dead(self):
+        heap = self._heap
+        while heap and not self.is_live(heap[0][2]):
+            heapq.heappop(heap)
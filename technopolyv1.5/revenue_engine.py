@@ -0,0 +1,144 @@
+"""
+revenue_engine.py
+
+Optional NumPy-backed version of BusinessGameEngine._distribute_revenue_all_markets.
+
+Every participating product of every market is packed into contiguous arrays,
+grouped by market (all products of the first market, then the second, ...):
+ - effective spend and assigned employees per department (n x 3)
+ - revenue and effectiveness (n)
+Effective spend, effectiveness, churn loss, churn share and growth share are then
+computed for all markets at once, and the results are written back to the Product
+objects. The pure-Python path in main.py remains the reference implementation;
+results match it up to floating point summation order.
+
+NumPy is optional: HAS_NUMPY is False when it is not installed and the engine
+keeps using the pure-Python path.
+"""
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+from models import Product
+
+DEPARTMENTS = ("r&d", "q&a", "marketing")
+CHURN_RATE = 0.08
+
+
+class MarketArrays:
+    """
+    Contiguous per-product arrays for a set of markets, grouped by market.
+    segment[i] is the index (into self.markets) of the market product i competes in.
+    """
+    def __init__(self, markets, market_products):
+        self.markets = []
+        self.products = []
+        segment = []
+        for mk in markets:
+            participants = market_products.get(mk.name)
+            if not participants:
+                continue
+            seg = len(self.markets)
+            self.markets.append(mk)
+            self.products.extend(participants)
+            segment.extend([seg] * len(participants))
+
+        n = len(self.products)
+        self.segment = np.array(segment, dtype=np.intp)
+        self.assigned = np.empty((n, 3), dtype=np.float64)
+        self.effective_spend = np.empty((n, 3), dtype=np.float64)
+        self.revenue = np.empty(n, dtype=np.float64)
+        self.effectiveness = np.empty(n, dtype=np.float64)
+        for i, p in enumerate(self.products):
+            self.assigned[i] = (p.rd_employees, p.qa_employees, p.marketing_employees)
+            self.effective_spend[i] = (p.rd_effective_spend, p.qa_effective_spend, p.marketing_effective_spend)
+            self.revenue[i] = p.revenue
+            self.effectiveness[i] = p.effectiveness
+
+    def segment_sum(self, values):
+        return np.bincount(self.segment, weights=values, minlength=len(self.markets))
+
+    def write_back(self):
+        for i, p in enumerate(self.products):
+            p.rd_effective_spend, p.qa_effective_spend, p.marketing_effective_spend = self.effective_spend[i].tolist()
+            p.revenue = float(self.revenue[i])
+            p.effectiveness = float(self.effectiveness[i])
+
+
+def distribute_revenue_vectorized(game):
+    """
+    Drop-in replacement for BusinessGameEngine._distribute_revenue_all_markets.
+    """
+    is_initial_turn = (game.turn_index == 0)
+
+    # Recession effects are applied to every market, even those without products.
+    for mk in game.markets:
+        mk.apply_recession()
+        if not game._market_products.get(mk.name):
+            mk.last_quarter_total_revenue = 0
+
+    arrays = MarketArrays(game.markets, game._market_products)
+    if not arrays.products:
+        return
+
+    # Products that sit out this quarter (the player's on the initial turn).
+    if is_initial_turn:
+        active = np.array([p.owner_name != game.player.name for p in arrays.products], dtype=bool)
+    else:
+        active = np.ones(len(arrays.products), dtype=bool)
+
+    # Per-market scalars.
+    previous = arrays.revenue.copy()
+    previous_totals = arrays.segment_sum(previous)
+    growth_rev = np.empty(len(arrays.markets), dtype=np.float64)
+    churn_amount = np.empty(len(arrays.markets), dtype=np.float64)
+    for seg, mk in enumerate(arrays.markets):
+        if mk.last_quarter_total_revenue <= 0:
+            mk.last_quarter_total_revenue = float(previous_totals[seg])
+        growth_rev[seg] = 0 if mk.is_in_global_recession else (mk.size * mk.growth_rate) / 4.0
+        churn_amount[seg] = CHURN_RATE * mk.last_quarter_total_revenue
+
+    # Effective spend build-up and effectiveness.
+    delays = np.array([Product.DELAYS[d] for d in DEPARTMENTS])
+    weights = np.array([Product.WEIGHTS[d] for d in DEPARTMENTS])
+    prev_spend = arrays.effective_spend
+    new_spend = prev_spend + (arrays.assigned * 25_000 - prev_spend) / delays
+    arrays.effective_spend = np.where(active[:, None], new_spend, prev_spend)
+
+    weighted = arrays.effective_spend * weights
+    total_eff_spend = weighted[:, 0] + weighted[:, 1] + weighted[:, 2]
+    new_eff = total_eff_spend / np.maximum(arrays.revenue, 1.0)
+    arrays.effectiveness = np.where(active, new_eff, arrays.effectiveness)
+
+    total_eff = arrays.segment_sum(np.where(active, arrays.effectiveness, 0.0))
+    total_eff[total_eff <= 0] = 1.0
+
+    # Churn loss, churn share and growth share.
+    share = arrays.effectiveness / total_eff[arrays.segment]
+    rev = arrays.revenue - arrays.revenue * CHURN_RATE
+    rev = rev + share * churn_amount[arrays.segment]
+    rev = rev + share * growth_rev[arrays.segment]
+    arrays.revenue = np.where(active, rev, arrays.revenue)
+
+    arrays.write_back()
+
+    # recent_growth bookkeeping (per-product lists, so this stays a Python loop).
+    growth_pct = np.zeros_like(previous)
+    np.divide(arrays.revenue - previous, previous, out=growth_pct, where=previous > 0)
+    growth_pct *= 100
+    for i in np.flatnonzero(active & (previous > 0)):
+        p = arrays.products[i]
+        p.recent_growth.append(float(growth_pct[i]))
+        if len(p.recent_growth) > 4:
+            p.recent_growth.pop(0)
+
+    totals = arrays.segment_sum(arrays.revenue)
+    for seg, mk in enumerate(arrays.markets):
+        mk.last_quarter_total_revenue = float(totals[seg])
+        if not mk.is_in_global_recession:
+            mk.size = mk.last_quarter_total_revenue
+        game._invalidate_rankings(mk.name)  # effectiveness changed
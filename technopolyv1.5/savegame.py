@@ -0,0 +1,101 @@
+"""
+savegame.py
+
+Binary save/load of a whole BusinessGameEngine.
+
+A save file is a small fixed header followed by the engine pickled with the
+highest protocol and compressed with zlib:
+
+    magic    8 bytes   b"TECHSAVE"
+    version  uint16    FORMAT_VERSION the file was written with
+    flags    uint16    FLAG_ZLIB when the payload is compressed
+    turn     uint32    turn index at save time (readable without unpickling)
+    length   uint64    payload length in bytes
+    payload
+
+Everything reachable from the engine is saved in one pickle, so shared
+references survive the round trip (the event manager's market list is the
+engine's market list, the market index holds the same Product objects as the
+companies, pending acquisitions point at the live buyers, ...). The seeded
+random generator is saved too, so a loaded game plays on exactly like the
+original would have.
+
+Only load files you wrote yourself: unpickling runs code from the file.
+"""
+
+import pickle
+import struct
+import zlib
+
+MAGIC = b"TECHSAVE"
+FORMAT_VERSION = 1
+FLAG_ZLIB = 1
+
+_HEADER = struct.Struct("<8sHHIQ")
+
+
+class SaveFormatError(ValueError):
+    """Raised when a file is not a save game or was written by a newer format."""
+
+
+def dumps(game, compress=True) -> bytes:
+    """
+    Serialises the engine to bytes (header + payload).
+    """
+    payload = pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 1)  # fastest level; pickles of floats compress little more at 9
+        flags |= FLAG_ZLIB
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, flags, game.turn_index, len(payload)) + payload
+
+
+def loads(data: bytes):
+    """
+    Rebuilds an engine from bytes produced by dumps().
+    """
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("File is too short to be a save game.")
+    magic, version, flags, _turn, length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a Technopoly save game.")
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Save format {version} is newer than supported ({FORMAT_VERSION}).")
+    payload = data[_HEADER.size:_HEADER.size + length]
+    if len(payload) != length:
+        raise SaveFormatError("Save game is truncated.")
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    return pickle.loads(payload)
+
+
+def save_game(game, path, compress=True):
+    """
+    Writes the engine to `path`. Returns the number of bytes written.
+    """
+    data = dumps(game, compress)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def load_game(path):
+    """
+    Reads an engine saved with save_game().
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def read_header(path):
+    """
+    Returns (version, turn_index) of a save file without loading the game.
+    """
+    with open(path, "rb") as f:
+        data = f.read(_HEADER.size)
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("File is too short to be a save game.")
+    magic, version, _flags, turn, _length = _HEADER.unpack(data)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a Technopoly save game.")
+    return version, turn
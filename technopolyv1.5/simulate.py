@@ -0,0 +1,229 @@
+"""
+simulate.py
+
+Batch Monte Carlo runner for balance sweeps.
+
+Plays N seeded headless games of M quarters each with a scripted player
+strategy, spread over a multiprocessing pool (one game per task, so throughput
+scales with the number of worker processes), and aggregates:
+ - winner distribution (player victory / player bankruptcy / no winner, and
+   which tier leads the stock market at the end)
+ - AI bankruptcies per tier
+ - market-cap concentration (leader share and Herfindahl index)
+into a plain text report.
+
+Usage:
+    python simulate.py --games 200 --quarters 80 --workers 8 --output sweep.txt
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+
+from main import BusinessGameEngine
+
+TIERS = ["Startup", "Medium", "Large", "Big Tech"]
+
+
+# ===========================
+#    SCRIPTED PLAYER STRATEGIES
+# ===========================
+def _strategy_idle(game):
+    """
+    The player never changes anything after picking its first market.
+    """
+    pass
+
+
+def _strategy_balanced(game):
+    """
+    Keeps staff cost around 60% of revenue (within campus capacity),
+    moves to a bigger campus when nearly full and cash allows,
+    and splits employees evenly across products (50% R&D, 30% Q&A, 20% marketing).
+    Every move goes through game.player_act, so a recorded game replays it.
+    """
+    player = game.player
+    revenue = player.total_revenue_this_quarter()
+
+    # Hiring / releasing towards the target headcount
+    target = min(player.employee_capacity(), max(5, int(0.6 * revenue / 25_000)))
+    if target > player.employees and player.cash > 0:
+        game.player_act("hire", target - player.employees, None)
+    elif target < player.employees:
+        game.player_act("release", player.employees - target, None)
+
+    # Campus expansion
+    capacity = player.employee_capacity()
+    if player.employees >= 0.85 * capacity:
+        bigger = [c for c in game.CAMPUS_TYPES if c[3] > capacity and c[1] * 3 < player.cash]
+        if bigger:
+            game.player_act("campus", min(bigger, key=lambda c: c[1]), None)
+
+    # Employee assignment
+    if player.products:
+        per_product = player.employees // len(player.products)
+        rd, qa = int(per_product * 0.5), int(per_product * 0.3)
+        for pname in list(player.products):
+            game.player_act("assign", pname, "r&d", rd)
+            game.player_act("assign", pname, "q&a", qa)
+            game.player_act("assign", pname, "marketing", per_product - rd - qa)
+
+
+STRATEGIES = {
+    "idle": _strategy_idle,
+    "balanced": _strategy_balanced,
+}
+
+
+# ===========================
+#         ONE GAME
+# ===========================
+def run_game(seed, quarters, strategy="balanced", vectorized_revenue=False):
+    """
+    Plays a single seeded headless game and returns a dict of outcome metrics.
+    Runs in a worker process, so it only takes and returns plain data.
+    The engine's own seeded generator makes the game reproducible bit-for-bit.
+    Nobody reads the news of a sweep, so the game plays without building it.
+    """
+    play = STRATEGIES[strategy]
+    outcome = "none"
+    with BusinessGameEngine(seed=seed, vectorized_revenue=vectorized_revenue, news=False) as game:
+        game.setup_game()
+        start_market = game.rng.choice(game.markets)
+        game.start_player_company("Player Co", start_market.name)
+
+        for _ in range(quarters):
+            play(game)
+            result = game.advance_quarter()
+            if result.is_bankrupt:
+                outcome = "player_bankrupt"
+                break
+            if result.is_winner:
+                outcome = "player_won"
+                break
+
+    companies = [game.player] + game.ai_companies
+    caps = [max(0.0, c.market_cap) for c in companies]
+    total_cap = sum(caps)
+    leader = max(companies, key=lambda c: c.market_cap)
+    if total_cap > 0:
+        shares = [cap / total_cap for cap in caps]
+        leader_share = max(shares)
+        hhi = sum(s * s for s in shares)
+        player_share = game.player.market_cap / total_cap
+    else:
+        leader_share = hhi = player_share = 0.0
+
+    record = {
+        "seed": seed,
+        "quarters": game.turn_index,
+        "outcome": outcome,
+        "leader_tier": "Player" if leader is game.player else leader.tier,
+        "leader_share": leader_share,
+        "player_share": player_share,
+        "hhi": hhi,
+        "ai_left": len(game.ai_companies),
+        "markets": len(game.markets),
+    }
+    for tier in TIERS:
+        record["bankrupt_" + tier] = game.bankruptcies.get(tier, 0)
+    return record
+
+
+def _run_game_task(task):
+    return run_game(*task)
+
+
+# ===========================
+#        AGGREGATION
+# ===========================
+def run_sweep(games, quarters, base_seed=0, workers=None, strategy="balanced", vectorized_revenue=False):
+    """
+    Plays `games` games with seeds base_seed .. base_seed + games - 1 across a process pool.
+    Returns the per-game records ordered by seed.
+    """
+    tasks = [(base_seed + i, quarters, strategy, vectorized_revenue) for i in range(games)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        records = [_run_game_task(t) for t in tasks]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            records = list(pool.imap_unordered(_run_game_task, tasks, chunksize=1))
+    records.sort(key=lambda r: r["seed"])
+    return records
+
+
+def format_report(records, header_lines=()):
+    """
+    Builds the plain text report: aggregates first, then one line per game.
+    """
+    n = len(records)
+    lines = list(header_lines)
+    lines.append(f"games: {n}")
+    if not n:
+        return "\n".join(lines) + "\n"
+
+    def pct(count):
+        return f"{count} ({count / n * 100:.1f}%)"
+
+    lines.append("")
+    lines.append("[outcomes]")
+    for outcome in ("player_won", "player_bankrupt", "none"):
+        lines.append(f"{outcome}: {pct(sum(1 for r in records if r['outcome'] == outcome))}")
+
+    lines.append("")
+    lines.append("[market leader at end]")
+    for leader in ["Player"] + TIERS:
+        lines.append(f"{leader}: {pct(sum(1 for r in records if r['leader_tier'] == leader))}")
+
+    lines.append("")
+    lines.append("[AI bankruptcies per tier]")
+    for tier in TIERS:
+        total = sum(r["bankrupt_" + tier] for r in records)
+        lines.append(f"{tier}: total {total}, mean {total / n:.2f} per game")
+
+    lines.append("")
+    lines.append("[market-cap concentration]")
+    for key in ("leader_share", "player_share", "hhi"):
+        values = sorted(r[key] for r in records)
+        lines.append(f"{key}: mean {sum(values) / n:.3f}, median {values[n // 2]:.3f}, "
+                     f"min {values[0]:.3f}, max {values[-1]:.3f}")
+
+    lines.append("")
+    lines.append("[games]")
+    columns = list(records[0].keys())
+    lines.append(" ".join(columns))
+    for r in records:
+        lines.append(" ".join(f"{r[c]:.4f}" if isinstance(r[c], float) else str(r[c]) for c in columns))
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run seeded headless Technopoly games for balance sweeps.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("--quarters", type=int, default=80, help="maximum quarters per game")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game (game i uses seed + i)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="balanced", help="scripted player strategy")
+    parser.add_argument("--vectorized", action="store_true", help="use the NumPy revenue engine if available")
+    parser.add_argument("--output", default="sweep_results.txt", help="report file to write")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    records = run_sweep(args.games, args.quarters, args.seed, args.workers, args.strategy, args.vectorized)
+    elapsed = time.perf_counter() - start
+
+    header = [
+        f"technopoly sweep: strategy={args.strategy} quarters={args.quarters} seeds={args.seed}..{args.seed + args.games - 1}",
+        f"elapsed: {elapsed:.2f}s ({args.games / elapsed if elapsed > 0 else 0:.1f} games/s)",
+    ]
+    report = format_report(records, header)
+    with open(args.output, "w") as f:
+        f.write(report)
+    print(report.split("\n[games]")[0])
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
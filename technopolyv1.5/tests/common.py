@@ -0,0 +1,28 @@
+"""
+Helpers shared by the tests: seeded games and a bit-exact view of their state.
+"""
+
+from main import BusinessGameEngine
+
+
+def new_game(seed, **kwargs):
+    """A seeded game with the player's company started in a random market."""
+    game = BusinessGameEngine(seed=seed, **kwargs)
+    game.setup_game()
+    game.start_player_company("Player Co", game.rng.choice(game.markets).name)
+    return game
+
+
+def game_state(game):
+    """Everything a quarter changes, with floats compared bit for bit."""
+    companies = [game.player] + game.ai_companies
+    return (
+        game.turn_index,
+        game.rng.getstate(),
+        [(c.name, repr(c.cash), repr(c.market_cap), c.employees, len(c.campuses), len(c.loans), len(c.bonds),
+          sorted((pname, repr(p.revenue), repr(p.effectiveness), tuple(p.assigned_employees.values()))
+                 for pname, p in c.products.items()))
+         for c in companies],
+        [(m.name, repr(m.size), repr(m.growth_rate)) for m in game.markets],
+        [(buyer.name, target, repr(price), turn) for buyer, target, price, turn in game.pending_acquisitions],
+    )
@@ -0,0 +1,40 @@
+"""
+Two-phase AI of ai_plan.py: the number of worker processes never changes the
+game, and committed plans are profiled like serial AI turns.
+"""
+
+import unittest
+
+from tests.common import new_game, game_state
+
+
+class TwoPhaseAITest(unittest.TestCase):
+    QUARTERS = 12
+
+    def play(self, **kwargs):
+        with new_game(seed=5, **kwargs) as game:
+            states = []
+            for _ in range(self.QUARTERS):
+                game.advance_quarter()
+                states.append(game_state(game))
+            return states, game.data_store.history
+
+    def test_worker_count_does_not_change_the_game(self):
+        single = self.play(ai_workers=1)
+        for workers in (2, 3):
+            with self.subTest(ai_workers=workers):
+                self.assertEqual(self.play(ai_workers=workers), single)
+
+    def test_commits_are_timed_per_tier(self):
+        with new_game(seed=5, ai_workers=1) as game:
+            game.profiler.enabled = True
+            tiers = {"ai/" + str(c.tier) for c in game.ai_companies}
+            game.advance_quarter()
+            _, times = game.profiler.last_turn
+        self.assertIn("ai/plan", times)
+        self.assertIn("ai/commit", times)
+        self.assertTrue(tiers <= set(times), tiers - set(times))
+
+
+if __name__ == "__main__":
+    unittest.main()
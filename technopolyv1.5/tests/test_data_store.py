@@ -0,0 +1,71 @@
+"""
+Columnar history of data_store.py: product series follow the Product, not the
+name it is kept under, and saves of the older layout load into the new one.
+"""
+
+import pickle
+import unittest
+from array import array
+
+import data_store
+from data_store import DataStorage
+from models import Company, Market, Product
+
+
+def _company(name, product_name, market_name, revenue):
+    c = Company(name, "Medium")
+    c.employees = 7
+    p = Product(name, market_name)
+    p.assigned_employees = {"r&d": 3, "q&a": 2, "marketing": 2}
+    p.revenue = revenue
+    c.products[product_name] = p
+    return c
+
+
+class ProductSeriesTest(unittest.TestCase):
+    def setUp(self):
+        self.markets = [Market("Cloud Computing")]
+        self.buyer = _company("Buyer", "Nimbus", "Cloud Computing", 100.0)
+        self.target = _company("Target", "Nimbus", "Cloud Computing", 200.0)
+        self.store = DataStorage()
+        self.store.record_state(0, [self.buyer, self.target], self.markets)
+
+    def test_same_name_in_two_companies_keeps_two_series(self):
+        self.assertEqual(self.store.product_series(self.buyer.products["Nimbus"], "revenue"), ([0], [100.0]))
+        self.assertEqual(self.store.product_series(self.target.products["Nimbus"], "revenue"), ([0], [200.0]))
+
+    def test_series_survives_rename(self):
+        acquired = self.target.products.pop("Nimbus")
+        self.buyer.products["Nimbus_acq"] = acquired  # as _merge_companies renames it
+        acquired.revenue = 250.0
+        self.store.record_state(1, [self.buyer, self.target], self.markets)
+
+        self.assertEqual(self.store.product_series(acquired, "revenue"), ([0, 1], [200.0, 250.0]))
+        self.assertEqual(sorted(self.store.snapshot(1)["companies"][0]["products"]), ["Nimbus", "Nimbus_acq"])
+
+    def test_headcounts_are_integers(self):
+        self.assertEqual(self.store.company_rows["employees"].typecode, "i")
+        self.assertEqual(self.store.product_series(self.buyer.products["Nimbus"], "rd"), ([0], [3]))
+
+    def test_loads_store_keyed_by_product_name(self):
+        history = self.store.history
+        state = self.store.__dict__.copy()
+        old = data_store._Columns(turn="i", company="i", product="i", market="i", rd="d", qa="d",
+                                  marketing="d", revenue="d", effectiveness="d")
+        for name, column in old.columns.items():
+            column.extend(list(self.store.product_rows["name" if name == "product" else name]))
+        state["product_rows"] = old
+        state["company_rows"] = pickle.loads(pickle.dumps(self.store.company_rows))
+        state["company_rows"].columns["employees"] = array("d", list(state["company_rows"]["employees"]))
+        del state["_product_count"]
+
+        loaded = DataStorage.__new__(DataStorage)
+        loaded.__setstate__(state)
+        self.assertEqual(loaded.history, history)
+        self.assertEqual(loaded.product_rows["rd"].typecode, "i")
+        loaded.record_state(1, [self.buyer, self.target], self.markets)
+        self.assertEqual(len(loaded.history), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
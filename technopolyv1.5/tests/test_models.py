@@ -0,0 +1,81 @@
+"""
+Company aggregate caches of models.py: never stale after product writes,
+merges or campus changes, and kept per company.
+"""
+
+import unittest
+
+import models
+from models import Company, Product
+from tests.common import new_game
+
+
+def _company(name, revenues):
+    c = Company(name, "Medium")
+    c.employees = 10
+    c.add_campus(("Small Office", 250_000, 0.02, 50))
+    for i, revenue in enumerate(revenues):
+        p = Product(name, f"Market {i}")
+        p.assigned_employees = {"r&d": 2, "q&a": 1, "marketing": 1}
+        p.revenue = revenue
+        c.add_product(f"Product {i}", p)
+    return c
+
+
+def _aggregates(c):
+    return (c.employee_capacity(), c.overhead_percent(), c.total_revenue_this_quarter(),
+            c.total_product_spend(), c.quarterly_profit())
+
+
+def _fresh(c):
+    revenue = sum(p.revenue for p in c.products.values())
+    overhead = max((campus[2] for campus in c.campuses), default=0.0)
+    spending = c.employees * 25_000 + c.employees * 25_000 * overhead + c.debt_monthly_payment * 3
+    return (sum(campus[3] for campus in c.campuses), overhead, revenue,
+            sum(p.total_spend_this_quarter() for p in c.products.values()), revenue - spending)
+
+
+class AggregateCacheTest(unittest.TestCase):
+    def assertFresh(self, c):
+        self.assertEqual(_aggregates(c), _fresh(c))
+
+    def test_product_writes(self):
+        c = _company("A", [100.0, 200.0])
+        self.assertFresh(c)
+        c.products["Product 0"].revenue = 150.0
+        c.products["Product 1"].assigned_employees["r&d"] = 5
+        self.assertFresh(c)
+
+    def test_campus_change(self):
+        c = _company("A", [100.0])
+        self.assertFresh(c)
+        c.add_campus(("Large Office", 2_500_000, 0.04, 125))
+        self.assertFresh(c)
+
+    def test_merge(self):
+        game = new_game(seed=4)
+        buyer, target = game.ai_companies[:2]
+        buyer_products = dict(buyer.products)
+        for c in (buyer, target):
+            self.assertFresh(c)
+        game._merge_companies(buyer, target)
+        for c in (buyer, target):
+            self.assertFresh(c)
+        # Products moved to the buyer report their writes to it from now on
+        moved = next(p for p in buyer.products.values() if p not in buyer_products.values())
+        moved.revenue += 1_000.0
+        self.assertFresh(buyer)
+        self.assertEqual(target.total_revenue_this_quarter(), 0.0)
+
+    def test_cache_is_per_company(self):
+        a, b = _company("A", [100.0]), _company("B", [200.0])
+        _aggregates(a), _aggregates(b)
+        a.products["Product 0"].revenue = 300.0
+        hits, misses = models.aggregate_cache_counts()
+        self.assertEqual(b.total_revenue_this_quarter(), 200.0)
+        self.assertEqual(models.aggregate_cache_counts(), (hits + 1, misses))
+        self.assertFresh(a)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Parity of the NumPy revenue engine (revenue_engine.py) with the pure-Python
+reference path of BusinessGameEngine._distribute_revenue_all_markets.
+"""
+
+import pickle
+import unittest
+
+import revenue_engine
+from main import BusinessGameEngine
+
+REL_TOL = 1e-9  # the paths differ only in floating point summation order
+
+
+def _game_at(seed, quarters):
+    game = BusinessGameEngine(seed=seed)
+    game.setup_game()
+    game.start_player_company("Player Co", game.rng.choice(game.markets).name)
+    for _ in range(quarters):
+        game.advance_quarter()
+    return game
+
+
+def _distribute(game, vectorized):
+    """A copy of game after one revenue distribution on the chosen path."""
+    copy = pickle.loads(pickle.dumps(game, pickle.HIGHEST_PROTOCOL))
+    copy.vectorized_revenue = vectorized
+    copy._distribute_revenue_all_markets()
+    return copy
+
+
+@unittest.skipUnless(revenue_engine.HAS_NUMPY, "NumPy is not installed")
+class VectorizedRevenueParityTest(unittest.TestCase):
+    def assertClose(self, actual, expected, what):
+        self.assertAlmostEqual(actual, expected, delta=REL_TOL * max(1.0, abs(expected)), msg=what)
+
+    def check_parity(self, game):
+        reference, vectorized = _distribute(game, False), _distribute(game, True)
+        companies = zip([reference.player] + reference.ai_companies, [vectorized.player] + vectorized.ai_companies)
+        for ref_comp, vec_comp in companies:
+            self.assertEqual(list(vec_comp.products), list(ref_comp.products))
+            for pname, ref_prod in ref_comp.products.items():
+                vec_prod = vec_comp.products[pname]
+                self.assertClose(vec_prod.revenue, ref_prod.revenue, f"revenue of {ref_comp.name} / {pname}")
+                self.assertClose(vec_prod.effectiveness, ref_prod.effectiveness,
+                                 f"effectiveness of {ref_comp.name} / {pname}")
+        for ref_market, vec_market in zip(reference.markets, vectorized.markets):
+            self.assertClose(vec_market.size, ref_market.size, f"size of {ref_market.name}")
+            self.assertClose(vec_market.last_quarter_total_revenue, ref_market.last_quarter_total_revenue,
+                             f"last quarter revenue of {ref_market.name}")
+            if ref_market.imaginary_product is not None:
+                self.assertClose(vec_market.imaginary_product.revenue, ref_market.imaginary_product.revenue,
+                                 f"revenue of the imaginary product of {ref_market.name}")
+
+    def test_first_quarter(self):
+        self.check_parity(_game_at(seed=7, quarters=0))
+
+    def test_mid_game(self):
+        for seed in (1, 11):
+            with self.subTest(seed=seed):
+                self.check_parity(_game_at(seed=seed, quarters=20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Round trip of savegame.py: a loaded game plays on exactly like the original,
+and damaged or foreign files are rejected with SaveFormatError.
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+
+import savegame
+from tests.common import new_game, game_state
+
+
+class SaveRoundTripTest(unittest.TestCase):
+    QUARTERS = 12
+
+    def test_loaded_game_advances_identically(self):
+        game = new_game(seed=11)
+        for _ in range(self.QUARTERS):
+            game.advance_quarter()
+
+        loaded = savegame.loads(savegame.dumps(game))
+        self.assertEqual(game_state(loaded), game_state(game))
+
+        for _ in range(self.QUARTERS):
+            original, replayed = game.advance_quarter(), loaded.advance_quarter()
+            self.assertEqual((replayed.is_bankrupt, replayed.is_winner, replayed.news, replayed.competitor_news),
+                             (original.is_bankrupt, original.is_winner, original.news, original.competitor_news))
+            self.assertEqual(game_state(loaded), game_state(game))
+        self.assertEqual(loaded.data_store.history, game.data_store.history)
+
+    def test_save_and_load_file(self):
+        game = new_game(seed=3)
+        for _ in range(4):
+            game.advance_quarter()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "game.sav")
+            written = savegame.save_game(game, path, compress=False)
+            self.assertEqual(written, os.path.getsize(path))
+            self.assertEqual(savegame.read_header(path), (savegame.FORMAT_VERSION, game.turn_index))
+            self.assertEqual(game_state(savegame.load_game(path)), game_state(game))
+
+
+class SaveFormatErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.data = savegame.dumps(new_game(seed=5))
+
+    def test_bad_magic(self):
+        with self.assertRaisesRegex(savegame.SaveFormatError, "Not a Technopoly save game"):
+            savegame.loads(b"NOTASAVE" + self.data[8:])
+
+    def test_newer_version(self):
+        newer = self.data[:8] + struct.pack("<H", savegame.FORMAT_VERSION + 1) + self.data[10:]
+        with self.assertRaisesRegex(savegame.SaveFormatError, "newer than supported"):
+            savegame.loads(newer)
+
+    def test_truncated_payload(self):
+        with self.assertRaisesRegex(savegame.SaveFormatError, "truncated"):
+            savegame.loads(self.data[:-1])
+
+    def test_truncated_header(self):
+        with self.assertRaisesRegex(savegame.SaveFormatError, "too short"):
+            savegame.loads(self.data[:10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Record -> replay round trips of turnlog.py: a replayed game matches the
+recorded one bit for bit, including a quarter with cash-limited firing.
+"""
+
+import unittest
+from unittest import mock
+
+import turnlog
+from ai import AIController
+from tests.common import new_game, game_state
+
+FIRING_TURN = 3
+
+
+def _strategy_with_cash_limited_firing(run_strategy):
+    """
+    run_strategy, plus at FIRING_TURN: the first AI company spends all but $45k on
+    a bond, then tries to let everyone go, which it can only partly pay severance for.
+    Both moves go through act(), so the log holds them like any strategy decision.
+    """
+    def wrapped(self, comp):
+        run_strategy(self, comp)
+        if self.game.turn_index == FIRING_TURN and comp is self.game.ai_companies[0]:
+            self.act(comp, "bond", comp.cash - 45_000, 0.05, 4, None)
+            self.fire_excess_employees(comp, 0)
+    return wrapped
+
+
+class TurnLogReplayTest(unittest.TestCase):
+    QUARTERS = 12
+
+    def record(self, **kwargs):
+        game = new_game(seed=21, record_log=True, **kwargs)
+        for _ in range(self.QUARTERS):
+            game.player_act("assign", next(iter(game.player.products)), "r&d", game.player.employees)
+            game.advance_quarter()
+        return game
+
+    def assertReplays(self, game):
+        replayed = turnlog.replay(game.turn_log.dumps())
+        self.assertEqual(game_state(replayed), game_state(game))
+        self.assertEqual(replayed.data_store.history, game.data_store.history)
+        return replayed
+
+    def test_replay_matches_recording(self):
+        self.assertReplays(self.record())
+
+    def test_replay_with_cash_limited_firing(self):
+        fired = []
+        act = AIController.act
+
+        def spy(self, comp, kind, *args):
+            if kind == "fire":
+                fired.append(args[0])
+            act(self, comp, kind, *args)
+
+        strategy = _strategy_with_cash_limited_firing(AIController.run_strategy)
+        with mock.patch.object(AIController, "run_strategy", strategy), mock.patch.object(AIController, "act", spy):
+            game = self.record()
+        self.assertTrue(fired, "the forced firing did not happen")
+        self.assertTrue(all(type(n) is int for n in fired))
+        self.assertReplays(game)
+
+    def test_replay_to_turn_then_play_on(self):
+        game = self.record(ai_workers=1)
+        replayed = turnlog.replay(game.turn_log.dumps(), turn=6)
+        self.assertEqual(replayed.turn_index, 6)
+        self.assertEqual(replayed.ai_workers, 1)
+        for _ in range(6):
+            replayed.player_act("assign", next(iter(replayed.player.products)), "r&d", replayed.player.employees)
+            replayed.advance_quarter()
+        self.assertEqual(game_state(replayed), game_state(game))
+
+    def test_unlogged_player_change_is_detected(self):
+        game = self.record()
+        game.player.employees += 3
+        game.advance_quarter()
+        with self.assertRaises(turnlog.ReplayError):
+            turnlog.replay(game.turn_log.dumps())
+
+    def test_rejects_foreign_data(self):
+        with self.assertRaises(turnlog.LogFormatError):
+            turnlog.replay(b"TECHSAVE" + bytes(16))
+
+
+if __name__ == "__main__":
+    unittest.main()
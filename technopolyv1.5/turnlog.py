@@ -0,0 +1,425 @@
+"""
+turnlog.py
+
+Event-sourced record of a game, and a replayer that rebuilds the game at any
+turn from it without running the AI strategies.
+
+An engine created with BusinessGameEngine(record_log=True) appends a record
+for every state-changing decision to game.turn_log as it plays:
+
+ - the engine settings (seed, scale, revenue model, loan schedules, AI
+   workers, news),
+ - setup_game() and start_player_company(name, market),
+ - player moves made through BusinessGameEngine.player_act (hiring, campuses,
+   loans, bonds, bids and employee assignments),
+ - per quarter: the number of AI companies taking a turn, each AI action
+   applied through AIController.act (with the name of any product it
+   launched), the employee assignments each AI company ends its turn with,
+   the state of the random generator once the AI phase is over, the event
+   applied and the player's state at the end of the quarter.
+
+Replay re-runs everything that is not an AI decision (pending acquisitions,
+bankruptcies, spawns, revenue, events, finances) and applies the recorded
+AI actions and assignments instead of running the tier strategies (or
+planning them in worker processes) and the staffing logic, then restores
+the random generator so the rest of the quarter draws the same numbers.
+The recorded event and the player's end-of-quarter state are checked
+against the replayed ones: a log missing a player move, or played back by a
+different version of the simulation, raises ReplayError instead of silently
+diverging.
+
+A log is a small header followed by records, compressed with zlib by dumps():
+
+    magic    8 bytes   b"TECHLOG1"
+    version  uint16    FORMAT_VERSION the log was written with
+    flags    uint16    FLAG_ZLIB when the records are compressed
+    records  each:  kind uint8, length uint32, payload
+
+A payload is a sequence of tagged values: None, int (int8 or int64), float
+(double), str (UTF-8), tuples of those and news items (category, template,
+arguments; None for the news of a game played with news=False, which then
+replays without it). Employee assignments follow the
+company name as raw int32 words and the generator state is stored as raw
+32-bit words.
+"""
+
+import struct
+import zlib
+from array import array
+from collections import deque
+
+from ai import AIController
+from news import NewsItem
+
+MAGIC = b"TECHLOG1"
+FORMAT_VERSION = 2  # 2: AI workers and news in SETTINGS, PLAYER_STATE records
+FLAG_ZLIB = 1
+
+_HEADER = struct.Struct("<8sHH")
+_RECORD = struct.Struct("<BI")
+_SMALL = struct.Struct("<b")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_LEN = struct.Struct("<I")
+
+# Record kinds
+SETTINGS = 1  # seed, vectorized_revenue, exact_loans, scale items, ai_workers, news
+SETUP = 2  # setup_game()
+START = 3  # start_player_company(name, market)
+PLAYER = 4  # player move: kind, args
+QUARTER = 5  # turn index, number of AI companies taking a turn
+ACTION = 6  # AI company name, kind, args, result
+ASSIGN = 7  # AI company name, then per product (in company order): department order, 3 x employees
+RNG_STATE = 8  # generator state after the AI phase
+EVENT = 9  # name of the event applied ("" for none); ends the quarter
+PLAYER_STATE = 10  # player cash, employees, products, campuses, loans, bonds after the quarter
+
+# Department orders of AIController.adjust_employee_assignments (the order of its news)
+DEPARTMENT_ORDERS = (("r&d", "marketing", "q&a"), ("r&d", "q&a", "marketing"), ("q&a", "marketing", "r&d"))
+
+
+class LogFormatError(ValueError):
+    """Raised when data is not a turn log or was written by a newer format."""
+
+
+class ReplayError(RuntimeError):
+    """Raised when the replayed game does not match the log."""
+
+
+# ===========================
+#        ENCODING
+# ===========================
+def _pack(out, value):
+    if value is None:
+        out += b"N"
+    elif isinstance(value, int):
+        if -128 <= value < 128:
+            out += b"b"
+            out += _SMALL.pack(value)
+        else:
+            out += b"i"
+            out += _INT.pack(value)
+    elif isinstance(value, float):
+        out += b"f"
+        out += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        out += b"s"
+        out += _LEN.pack(len(raw))
+        out += raw
+    elif isinstance(value, (tuple, list)):
+        out += b"t"
+        out += _LEN.pack(len(value))
+        for item in value:
+            _pack(out, item)
+    elif isinstance(value, NewsItem):
+        out += b"n"
+        _pack(out, value.category)
+        _pack(out, value.template)
+        _pack(out, value.args)
+    else:
+        raise TypeError(f"Cannot log a {type(value).__name__}: {value!r}")
+
+
+def _unpack(data, pos):
+    """Returns (value, position after it)."""
+    tag = data[pos:pos + 1]
+    pos += 1
+    if tag == b"N":
+        return None, pos
+    if tag == b"b":
+        return _SMALL.unpack_from(data, pos)[0], pos + _SMALL.size
+    if tag == b"i":
+        return _INT.unpack_from(data, pos)[0], pos + _INT.size
+    if tag == b"f":
+        return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+    if tag == b"s":
+        length = _LEN.unpack_from(data, pos)[0]
+        pos += _LEN.size
+        return bytes(data[pos:pos + length]).decode("utf-8"), pos + length
+    if tag == b"t":
+        count = _LEN.unpack_from(data, pos)[0]
+        pos += _LEN.size
+        items = []
+        for _ in range(count):
+            item, pos = _unpack(data, pos)
+            items.append(item)
+        return tuple(items), pos
+    if tag == b"n":
+        category, pos = _unpack(data, pos)
+        template, pos = _unpack(data, pos)
+        args, pos = _unpack(data, pos)
+        return NewsItem(category, template, *args), pos
+    raise LogFormatError(f"Unknown value tag {tag!r} in turn log.")
+
+
+# ===========================
+#         RECORDING
+# ===========================
+class TurnLog:
+    """
+    Append-only binary log of a game, kept in memory (see the module docstring).
+    """
+    def __init__(self):
+        self.data = bytearray()
+
+    def __len__(self):
+        return len(self.data)
+
+    def _record(self, kind, *values):
+        payload = bytearray()
+        for value in values:
+            _pack(payload, value)
+        self.data += _RECORD.pack(kind, len(payload))
+        self.data += payload
+
+    def settings(self, seed, vectorized_revenue, exact_loans, scale, ai_workers, news):
+        self._record(SETTINGS, seed, int(vectorized_revenue), int(exact_loans), tuple(sorted(scale.items())),
+                     ai_workers, int(news))
+
+    def setup(self):
+        self._record(SETUP)
+
+    def start_player(self, company_name, market_name):
+        self._record(START, company_name, market_name)
+
+    def player_action(self, kind, args):
+        self._record(PLAYER, kind, args)
+
+    def begin_quarter(self, turn_index, ai_count):
+        self._record(QUARTER, turn_index, ai_count)
+
+    def action(self, company_name, kind, args, result):
+        self._record(ACTION, company_name, kind, args, result)
+
+    def assignments(self, company_name, changes):
+        """changes: AIController.adjust_employee_assignments' result, one entry per product in company order."""
+        payload = bytearray()
+        _pack(payload, company_name)
+        words = array("i")
+        for depts in changes.values():
+            order = tuple(depts)
+            words.append(DEPARTMENT_ORDERS.index(order))
+            words.extend(depts[d] for d in order)
+        payload += words.tobytes()
+        self.data += _RECORD.pack(ASSIGN, len(payload))
+        self.data += payload
+
+    def end_ai_phase(self, rng):
+        _version, words, gauss_next = rng.getstate()
+        payload = bytearray(array("I", words).tobytes())
+        _pack(payload, gauss_next)
+        self.data += _RECORD.pack(RNG_STATE, len(payload))
+        self.data += payload
+
+    def event(self, ev):
+        self._record(EVENT, ev.name if ev is not None else "")
+
+    def player_state(self, player):
+        self._record(PLAYER_STATE, *_player_state(player))
+
+    def dumps(self, compress=True) -> bytes:
+        """
+        The log as bytes (header + records).
+        """
+        body = bytes(self.data)
+        flags = 0
+        if compress:
+            body = zlib.compress(body, 6)
+            flags |= FLAG_ZLIB
+        return _HEADER.pack(MAGIC, FORMAT_VERSION, flags) + body
+
+
+def _player_state(player):
+    return (float(player.cash), player.employees, len(player.products), len(player.campuses),
+            len(player.loans), len(player.bonds))
+
+
+def save_log(game, path, compress=True):
+    """
+    Writes game.turn_log to `path`. Returns the number of bytes written.
+    """
+    if game.turn_log is None:
+        raise ValueError("The game was not created with record_log=True.")
+    data = game.turn_log.dumps(compress)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def load_log(path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# ===========================
+#          READING
+# ===========================
+def _rng_state(payload):
+    words = array("I")
+    words.frombytes(payload[:625 * words.itemsize])
+    gauss_next, _ = _unpack(payload, 625 * words.itemsize)
+    return 3, tuple(words), gauss_next
+
+
+def read_records(data):
+    """
+    Yields (kind, values) for every record of a log produced by TurnLog.dumps().
+    """
+    if len(data) < _HEADER.size:
+        raise LogFormatError("Data is too short to be a turn log.")
+    magic, version, flags = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise LogFormatError("Not a Technopoly turn log.")
+    if version > FORMAT_VERSION:
+        raise LogFormatError(f"Turn log format {version} is newer than supported ({FORMAT_VERSION}).")
+    body = memoryview(data)[_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        body = memoryview(zlib.decompress(body))
+
+    pos, end = 0, len(body)
+    while pos < end:
+        if end - pos < _RECORD.size:
+            raise LogFormatError("Turn log is truncated.")
+        kind, length = _RECORD.unpack_from(body, pos)
+        pos += _RECORD.size
+        payload = body[pos:pos + length]
+        if len(payload) != length:
+            raise LogFormatError("Turn log is truncated.")
+        pos += length
+        if kind == RNG_STATE:
+            yield kind, _rng_state(payload)
+            continue
+        if kind == ASSIGN:
+            company_name, at = _unpack(payload, 0)
+            words = array("i")
+            words.frombytes(payload[at:])
+            yield kind, (company_name, words)
+            continue
+        values, at = [], 0
+        while at < length:
+            value, at = _unpack(payload, at)
+            values.append(value)
+        yield kind, values
+
+
+# ===========================
+#          REPLAY
+# ===========================
+class ReplayController(AIController):
+    """
+    Applies the recorded actions and employee assignments of each AI company
+    instead of running its strategy.
+    """
+    def __init__(self, game_ref):
+        super().__init__(game_ref)
+        self.actions = deque()  # (record kind, values) of the quarter's ACTION and ASSIGN records
+        self.remaining = 0  # AI turns left in the quarter
+        self.rng_state = None
+
+    def begin_quarter(self, ai_count, actions, rng_state):
+        self.remaining = ai_count
+        self.actions = deque(actions)
+        self.rng_state = rng_state
+
+    def ai_take_actions(self, comp):
+        comp.update_negative_cash_quarters()
+        if comp.is_bankrupt():
+            self.handle_bankruptcy(comp)
+        else:
+            actions = self.actions
+            while actions and actions[0][0] == ACTION and actions[0][1][0] == comp.name:
+                _name, kind, args, result = actions.popleft()[1]
+                if result is None:
+                    self.act(comp, kind, *args)
+                else:
+                    self.act(comp, kind, *args, result)
+            self.finish_turn(comp)
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.end_ai_phase()
+
+    def finish_turn(self, comp):
+        comp.update_negative_cash_quarters()
+        if not self.actions or self.actions[0][0] != ASSIGN or self.actions[0][1][0] != comp.name:
+            raise ReplayError(f"Turn {self.game.turn_index}: no recorded employee assignments for {comp.name}.")
+        words = self.actions.popleft()[1][1]
+        if len(words) != 4 * len(comp.products):
+            raise ReplayError(f"Turn {self.game.turn_index}: {comp.name} has {len(comp.products)} products, "
+                              f"the log assigns employees to {len(words) // 4}.")
+        changes = {}
+        for i, (pname, product) in enumerate(comp.products.items()):
+            depts = dict(zip(DEPARTMENT_ORDERS[words[4 * i]], words[4 * i + 1:4 * i + 4]))
+            product.assigned_employees = depts
+            changes[pname] = depts
+        self.push_assignment_news(comp, changes)
+
+    def end_ai_phase(self):
+        if self.actions:
+            raise ReplayError(f"Turn {self.game.turn_index}: {len(self.actions)} recorded AI actions "
+                              f"were not replayed (next by {self.actions[0][1][0]}).")
+        # Skip the draws the strategies made
+        self.game.rng.setstate(self.rng_state)
+
+
+def replay(data, turn=None):
+    """
+    Rebuilds the game recorded in `data` (bytes from TurnLog.dumps() or load_log())
+    as it stood at the start of `turn` (after every recorded quarter when turn is None).
+    Returns the engine, which can be played on from there.
+    """
+    from main import BusinessGameEngine  # main imports this module
+
+    records = read_records(data)
+    kind, values = next(records, (None, None))
+    if kind != SETTINGS:
+        raise LogFormatError("Turn log does not start with the game settings.")
+    seed, vectorized_revenue, exact_loans, scale, *more = values
+    ai_workers, news = more if more else (None, 1)  # format 1 logs predate both
+    # The recorded AI decisions are applied serially; the workers take over afterwards.
+    game = BusinessGameEngine(seed=seed, vectorized_revenue=bool(vectorized_revenue),
+                              scale=dict(scale), exact_loans=bool(exact_loans), news=bool(news))
+    controller = game.ai_controller = ReplayController(game)
+
+    quarter = None  # (ai_count, actions, [rng_state]) of the quarter being read
+    for kind, values in records:
+        if kind == SETUP:
+            game.setup_game()
+        elif kind == START:
+            game.start_player_company(*values)
+        elif kind == PLAYER:
+            player_kind, args = values
+            game.player_act(player_kind, *args)
+        elif kind == QUARTER:
+            turn_index, ai_count = values
+            if turn_index != game.turn_index:
+                raise ReplayError(f"Log has turn {turn_index} where the game is at turn {game.turn_index}.")
+            if turn is not None and turn_index >= turn:
+                break
+            quarter = (ai_count, [], [None])
+        elif kind == ACTION or kind == ASSIGN:
+            quarter[1].append((kind, values))
+        elif kind == RNG_STATE:
+            quarter[2][0] = values
+        elif kind == EVENT:
+            ai_count, actions, (rng_state,) = quarter
+            if ai_count == 0 and actions:
+                raise ReplayError(f"Turn {game.turn_index}: AI actions recorded for a quarter without AI companies.")
+            controller.begin_quarter(ai_count, actions, rng_state)
+            result = game.advance_quarter()
+            replayed = result.event.name if result.event is not None else ""
+            if replayed != values[0]:
+                raise ReplayError(f"Turn {result.turn_index}: replay applied event {replayed!r}, "
+                                  f"the log has {values[0]!r}.")
+            quarter = None
+        elif kind == PLAYER_STATE:
+            replayed = _player_state(game.player)
+            if replayed != tuple(values):
+                raise ReplayError(f"Turn {game.turn_index - 1}: replayed player state (cash, employees, products, "
+                                  f"campuses, loans, bonds) {replayed}, the log has {tuple(values)}.")
+        else:
+            raise LogFormatError(f"Unknown record kind {kind} in turn log.")
+
+    game.ai_controller = AIController(game)  # play on with the real strategies
+    game.ai_workers = ai_workers
+    return game
@@ -19,19 +19,34 @@ def format_money(val: float) -> str:
     else:
         return f"${val:.2f}"
 
-def random_company_name(prefixes, suffixes, used_names):
+def random_company_name(prefixes, suffixes, used_names, rng=random):
+    """
+    Generate a random prefix + suffix company name that is unique within ``used_names``.
+    Like random_product_name, it falls back to an incrementing name once every
+    combination is taken (large games spawn thousands of companies).
+    """
+    max_unique_combinations = len(prefixes) * len(suffixes)
+    if len(used_names) < max_unique_combinations or not _all_used(prefixes, suffixes, used_names):
+        while True:
+            pre = rng.choice(prefixes)
+            suf = rng.choice(suffixes)
+            name= f"{pre}{suf}"
+            if name not in used_names:
+                used_names.add(name)
+                return name
+
+    counter = max(1, len(used_names) - max_unique_combinations + 1)
     while True:
-        pre = random.choice(prefixes)
-        suf = random.choice(suffixes)
-        name= f"{pre}{suf}"
+        name = f"Company{counter}"
+        counter += 1
         if name not in used_names:
             used_names.add(name)
             return name
 
-_product_fallback_counter = 1
-
-
-def random_product_name(used_names):
+def _all_used(prefixes, suffixes, used_names):
+    return all(f"{pre}{suf}" in used_names for pre in prefixes for suf in suffixes)
+
+def random_product_name(used_names, rng=random):
     """
     Generate a pseudo-random product name that is unique within ``used_names``.
 
@@ -41,10 +56,10 @@ def random_product_name(used_names):
     after 20-30 turns as the AI keeps launching new products.  To avoid that we
     keep the original behaviour for as long as unused combinations exist but we
     fall back to a deterministic, incrementing name when they are exhausted.
+    The fallback counter is derived from ``used_names`` rather than kept as module
+    state, so two games with the same seed always produce the same names.
     """
 
-    global _product_fallback_counter
-
     prefix_samples = [
         "Sky", "Neo", "Prime", "Nova", "Aero", "Delta", "Zeta", "Omega",
         "Quantum", "Hyper", "Green", "Cyber", "Mono", "Alpha", "Aqua",
@@ -58,16 +73,19 @@ def random_product_name(used_names):
     max_unique_combinations = len(prefix_samples) * len(suffix_samples)
     max_attempts = max_unique_combinations * 5  # allow extra attempts for randomness
 
-    for _ in range(max_attempts):
-        candidate = random.choice(prefix_samples) + random.choice(suffix_samples)
-        if candidate not in used_names:
-            used_names.add(candidate)
-            return candidate
+    # Skip the random attempts entirely once every combination is taken.
+    if len(used_names) < max_unique_combinations or not _all_used(prefix_samples, suffix_samples, used_names):
+        for _ in range(max_attempts):
+            candidate = rng.choice(prefix_samples) + rng.choice(suffix_samples)
+            if candidate not in used_names:
+                used_names.add(candidate)
+                return candidate
 
     # Fall back to an incrementing name once the curated pool is exhausted.
+    counter = max(1, len(used_names) - max_unique_combinations + 1)
     while True:
-        candidate = f"Product{_product_fallback_counter}"
-        _product_fallback_counter += 1
+        candidate = f"Product{counter}"
+        counter += 1
         if candidate not in used_names:
             used_names.add(candidate)
             return candidate